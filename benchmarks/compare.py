@@ -0,0 +1,100 @@
+import sys
+import json
+import argparse
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare two benchmark result files stage by stage"
+    )
+    parser.add_argument("baseline", help="results JSON of the reference commit")
+    parser.add_argument("candidate", help="results JSON of the commit under test")
+    parser.add_argument("--metric", default="min_s", choices=("min_s", "median_s"),
+                        help="timing compared (default: min_s)")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="candidate/baseline time ratio above which a stage counts "
+                             "as a regression (default: 1.10)")
+    return parser.parse_args(argv)
+
+
+def load_results(path: str) -> tuple:
+    with open(path) as f:
+        payload = json.load(f)
+
+    results = {
+        (r["frequency"], r["rows"], r["stage"]): r
+        for r in payload["results"] if "skipped" not in r
+    }
+    return payload["meta"], results
+
+
+def _ratio(new, old):
+    if new is None or old is None or old <= 0:
+        return None
+    return new / old
+
+
+def compare(baseline: dict, candidate: dict, metric: str, threshold: float) -> tuple:
+    """
+    Args:
+        baseline: (frequency, rows, stage) -> result entry
+        candidate: same, for the commit under test
+        metric: timing key to compare
+        threshold: time ratio above which a stage regressed
+
+    Returns:
+        tuple: list of row dicts for every stage present in both, list of
+            regressed keys
+    """
+
+    rows = []
+    regressions = []
+    for key in sorted(baseline.keys() & candidate.keys(), key=lambda k: (k[0], k[1])):
+        old, new = baseline[key], candidate[key]
+        time_ratio = _ratio(new[metric], old[metric])
+        rows.append({
+            "key": key,
+            "baseline_s": old[metric],
+            "candidate_s": new[metric],
+            "time_ratio": time_ratio,
+            "memory_ratio": _ratio(new.get("peak_alloc_mb"), old.get("peak_alloc_mb")),
+        })
+        if time_ratio is not None and time_ratio > threshold:
+            regressions.append(key)
+
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    baseline_meta, baseline = load_results(args.baseline)
+    candidate_meta, candidate = load_results(args.candidate)
+
+    rows, regressions = compare(baseline, candidate, args.metric, args.threshold)
+
+    print(f"baseline:  {baseline_meta['commit']} ({baseline_meta['timestamp']})")
+    print(f"candidate: {candidate_meta['commit']} ({candidate_meta['timestamp']})")
+    print(f"{'frequency':>9} {'rows':>10} {'stage':<14} {'baseline':>10} "
+          f"{'candidate':>10} {'time x':>7} {'mem x':>7}")
+
+    for row in rows:
+        frequency, size, stage = row["key"]
+        memory = "n/a" if row["memory_ratio"] is None else f"{row['memory_ratio']:.2f}"
+        time_ratio = "n/a" if row["time_ratio"] is None else f"{row['time_ratio']:.2f}"
+        flag = "  <- regression" if row["key"] in regressions else ""
+        print(f"{frequency:>9} {size:>10,} {stage:<14} {row['baseline_s']:>9.4f}s "
+              f"{row['candidate_s']:>9.4f}s {time_ratio:>7} {memory:>7}{flag}")
+
+    missing = sorted(baseline.keys() ^ candidate.keys())
+    if missing:
+        print(f"{len(missing)} stage(s) present in only one file were not compared")
+
+    if regressions:
+        print(f"{len(regressions)} stage(s) slower than {args.threshold:.2f}x the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# cumulative `python -X importtime` budget per module, in milliseconds.
+# The budgets leave about 3x headroom over a typical cold import, so they
+# catch a regression such as an eager heavy import, not machine noise;
+# pandas and numpy alone account for most of the larger ones
+BUDGETS_MS = {
+    "forecasting_engine.logger": 150,
+    "forecasting_engine.instrumentation": 150,
+    "forecasting_engine.cli": 150,
+    "forecasting_engine.inference.server": 200,
+    "forecasting_engine.models.registry": 1500,
+    "forecasting_engine.utils": 1500,
+    "forecasting_engine.data.ingestion": 1500,
+    "forecasting_engine.data.cleansing": 1500,
+    "forecasting_engine.data.preprocessing": 1500,
+    "forecasting_engine.training.trainer": 1500,
+    "forecasting_engine.inference.predictor": 1500,
+    "forecasting_engine.pipeline": 2000,
+}
+
+# loaded on first use only; importing any module above must not pull them in
+LAZY_MODULES = ("statsmodels", "sklearn", "xgboost", "plotly", "joblib", "streamlit")
+
+# entry points that must not load numpy / pandas either, so the CLI's
+# --help and the serving process start instantly
+LIGHT_MODULES = {
+    "forecasting_engine.logger",
+    "forecasting_engine.instrumentation",
+    "forecasting_engine.cli",
+    "forecasting_engine.inference.server",
+}
+DATA_MODULES = ("numpy", "pandas")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check that importing the forecasting_engine modules leaves the "
+                    "heavy dependencies unloaded and stays within a cold import time "
+                    "budget (python -X importtime). Exits 1 on any failure, so it can "
+                    "gate CI."
+    )
+    parser.add_argument("--modules", nargs="+", default=list(BUDGETS_MS),
+                        help="modules to check (default: all budgeted modules)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="cold imports per module; the fastest is kept (default: 3)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply every budget, e.g. for slow CI machines (default: 1.0)")
+    parser.add_argument("--output", help="also write the measurements to this JSON file")
+    return parser.parse_args(argv)
+
+
+def import_profile(module: str) -> dict:
+    """
+    Imports `module` in a fresh interpreter with no pipeline environment
+    variables set, parses the -X importtime report and reads the
+    interpreter's sys.modules after the import.
+
+    Returns:
+        tuple: {imported module: cumulative microseconds}, top-level names
+            of every module in sys.modules
+    """
+
+    env = {
+        k: v for k, v in os.environ.items()
+        if k not in ("RUN_ID", "DATA_PATH", "ARTIFACTS_PATH", "CONFIG_PATH", "MODEL_CONFIG_PATH")
+    }
+    env["PYTHONPATH"] = str(PROJECT_ROOT / "src")
+    env["LOG_CONSOLE"] = "0"
+
+    completed = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+        ],
+        env=env, cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+
+    profile = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+
+    loaded = {name.split(".")[0] for name in json.loads(completed.stdout.splitlines()[-1])}
+
+    return profile, loaded
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    failures = []
+    results = {}
+
+    for module in args.modules:
+        profiles = [import_profile(module) for _ in range(args.repeat)]
+        best, loaded = min(profiles, key=lambda p: p[0][module])
+
+        elapsed_ms = best[module] / 1000
+        budget_ms = BUDGETS_MS.get(module, max(BUDGETS_MS.values())) * args.scale
+        forbidden = LAZY_MODULES + (DATA_MODULES if module in LIGHT_MODULES else ())
+        eager = sorted(loaded.intersection(forbidden))
+        results[module] = {"import_ms": elapsed_ms, "budget_ms": budget_ms, "eager_heavy": eager}
+
+        status = "ok"
+        if elapsed_ms > budget_ms:
+            status = "over budget"
+            failures.append(module)
+        if eager:
+            status = f"imports {', '.join(eager)}"
+            failures.append(module)
+
+        print(f"{module:<40} {elapsed_ms:>8.1f} ms / {budget_ms:>6.0f} ms  {status}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        print(f"{len(set(failures))} module(s) failed the import budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
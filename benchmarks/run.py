@@ -0,0 +1,334 @@
+import os
+import sys
+import copy
+import json
+import shutil
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+
+from synthetic import FREQUENCIES, generate_series, max_rows
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# seasonal period the SARIMAX spec is fitted with per frequency
+SEASONAL_PERIODS = {"hourly": 24, "daily": 7, "monthly": 12}
+
+STAGES = ("ingestion", "cleansing", "imputation", "preprocessing",
+          "training", "forecast_plot", "pipeline")
+
+MAP_DICT = {
+    "datetime_col": "timestamp",
+    "demand_col": "demand",
+    "series_col": None
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time and memory-profile each pipeline stage and the whole "
+                    "pipeline on synthetic seasonal series, offline and without Streamlit"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"rows per series (default: {DEFAULT_SIZES})")
+    parser.add_argument("--frequencies", nargs="+", default=list(FREQUENCIES),
+                        choices=list(FREQUENCIES), help="series frequencies (default: all)")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=STAGES,
+                        help="stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per stage; min and median are reported (default: 3)")
+    parser.add_argument("--train-rows", type=int, default=5_000,
+                        help="training and forecast stages use the last N preprocessed rows "
+                             "(default: 5000)")
+    parser.add_argument("--pipeline-max-rows", type=int, default=20_000,
+                        help="largest size the end-to-end pipeline is run on, since it "
+                             "trains on the full history (default: 20000)")
+    parser.add_argument("--horizon", type=int, default=24,
+                        help="forecast horizon of the pipeline run (default: 24)")
+    parser.add_argument("--model-config",
+                        help="model params YAML (default: config/model_params.yaml)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the extra tracemalloc run per stage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output",
+                        help="results JSON (default: benchmarks/results/<commit>_<time>.json)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="keep pipeline INFO logging (it is timed along with the stages)")
+    return parser.parse_args(argv)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment_info() -> dict:
+    import numpy as np
+    import pandas as pd
+    import statsmodels
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "statsmodels": statsmodels.__version__,
+    }
+
+
+def reset_caches() -> None:
+    """
+    Clears in-process caches so every timed run starts cold.
+    """
+    from forecasting_engine.data import preprocessing
+    from forecasting_engine.inference.model_cache import get_model_cache
+
+    preprocessing._stationarity_cache.clear()
+    get_model_cache().invalidate(os.environ["RUN_ID"])
+
+
+def measure(fn, repeat: int, profile_memory: bool) -> tuple:
+    """
+    Runs fn `repeat` times for wall time, then once more under tracemalloc
+    for peak traced allocation, which would otherwise inflate the timings.
+
+    Returns:
+        tuple: result of the last timed run, stats dict
+    """
+
+    times = []
+    result = None
+    for _ in range(repeat):
+        reset_caches()
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+
+    stats = {
+        "runs": repeat,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+    }
+
+    if profile_memory:
+        reset_caches()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        stats["peak_alloc_mb"] = peak / (1024 * 1024)
+
+    return result, stats
+
+
+def frequency_config(model_config: dict, frequency: str) -> dict:
+    """
+    Copy of the model config with the seasonal period set for the frequency.
+    """
+
+    config = copy.deepcopy(model_config)
+    period = SEASONAL_PERIODS[frequency]
+    model = config["model"]
+    model["params"]["seasonal_order"] = list(model["params"]["seasonal_order"][:3]) + [period]
+    if "auto_order" in model:
+        model["auto_order"]["s"] = [period]
+    return config
+
+
+def run_case(frequency: str, rows: int, args, model_config: dict, work_dir: Path) -> list:
+    """
+    Benchmarks every selected stage on one synthetic series. Stages are
+    chained as in run_pipeline: each one consumes the previous stage's output.
+    """
+
+    from forecasting_engine.utils import model_saver
+    from forecasting_engine.pipeline import run_pipeline
+    from forecasting_engine.data.ingestion import data_loader
+    from forecasting_engine.data.cleansing import (
+        data_cleanser, check_data_continuity, data_imputer
+    )
+    from forecasting_engine.data.preprocessing import data_preprocessing
+    from forecasting_engine.training.trainer import model_trainer
+    from forecasting_engine.inference.predictor import (
+        full_history_model, generate_forecast_plot_df
+    )
+
+    map_dict = {**MAP_DICT, "frequency": frequency}
+    datetime_col, demand_col = map_dict["datetime_col"], map_dict["demand_col"]
+    config = frequency_config(model_config, frequency)
+    profile_memory = not args.no_memory
+    selected = set(args.stages)
+    results = []
+
+    def record(stage, rows_in, fn, skip: str = None):
+        entry = {"frequency": frequency, "rows": rows, "stage": stage, "rows_in": rows_in}
+        if skip:
+            entry["skipped"] = skip
+            results.append(entry)
+            print(f"{frequency:>8} {rows:>10,} {stage:<14} skipped: {skip}", flush=True)
+            return None
+
+        result, stats = measure(fn, args.repeat, profile_memory)
+        entry.update(stats)
+        entry["rows_per_second"] = rows_in / max(stats["min_s"], 1e-9)
+        results.append(entry)
+
+        memory = f", peak {stats['peak_alloc_mb']:.1f} MB" if profile_memory else ""
+        print(
+            f"{frequency:>8} {rows:>10,} {stage:<14} "
+            f"min {stats['min_s']:.4f}s, median {stats['median_s']:.4f}s{memory}",
+            flush=True
+        )
+        return result
+
+    if rows > max_rows(frequency):
+        for stage in args.stages:
+            record(stage, rows, None,
+                   skip=f"exceeds datetime64[ns] range ({max_rows(frequency)} rows)")
+        return results
+
+    raw = generate_series(rows, frequency=frequency, seed=args.seed)
+    csv_path = work_dir / f"{frequency}_{rows}.csv"
+    raw.to_csv(csv_path, index=False)
+
+    # later stages need earlier outputs even when those are not benchmarked
+    def stage(name, rows_in, fn):
+        if name in selected:
+            return record(name, rows_in, fn)
+        return fn()
+
+    raw_df = stage("ingestion", len(raw), lambda: data_loader(csv_path, map_dict=map_dict))
+
+    cleansed_df, _ = stage(
+        "cleansing", len(raw_df),
+        lambda: data_cleanser(raw_df, datetime_col=datetime_col, demand_col=demand_col)
+    )
+
+    def impute():
+        data_continuity = check_data_continuity(cleansed_df, datetime_col, frequency)
+        return data_imputer(
+            cleansed_df,
+            datetime_col=datetime_col,
+            demand_col=demand_col,
+            frequency=frequency,
+            data_continuity=data_continuity,
+            **config.get("imputation", {})
+        )
+
+    imputed_df = stage("imputation", len(cleansed_df), impute)
+
+    preprocessed_df = stage(
+        "preprocessing", len(imputed_df),
+        lambda: data_preprocessing(imputed_df, demand_col=demand_col, save=False)
+    )
+
+    if {"training", "forecast_plot"} & selected:
+        train_df = preprocessed_df.tail(args.train_rows).reset_index(drop=True)
+
+        best_model, y_test, preds, _ = stage(
+            "training", len(train_df),
+            lambda: model_trainer(train_df, model_config=config, map_dict=map_dict)
+        )
+
+        if "forecast_plot" in selected:
+            model_saver(full_history_model(best_model, train_df[demand_col]))
+
+            plot_df = train_df.loc[y_test.index, [datetime_col]].copy()
+            plot_df["Actual"] = y_test.values
+            plot_df["Forecast"] = preds.values
+
+            # cold call: loads the saved model and forecasts the full window
+            record("forecast_plot", len(y_test), lambda: generate_forecast_plot_df(
+                plot_df=plot_df,
+                preprocessed_df=train_df,
+                y_test_index=y_test.index,
+                datetime_col=datetime_col,
+                frequency=frequency,
+                window_size=len(y_test)
+            ))
+
+    if "pipeline" in selected:
+        skip = None
+        if rows > args.pipeline_max_rows:
+            skip = f"above --pipeline-max-rows ({args.pipeline_max_rows})"
+        record("pipeline", len(raw), lambda: run_pipeline(
+            file=str(csv_path),
+            map_dict=map_dict,
+            model_config=config,
+            horizon=args.horizon
+        ), skip=skip)
+
+    csv_path.unlink()
+    return results
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="forecasting_bench_"))
+    model_config_path = Path(args.model_config or PROJECT_ROOT / "config" / "model_params.yaml")
+
+    # pipeline modules read the environment on import; keep every artifact
+    # the benchmark writes out of the project's data/ and artifacts/
+    from forecasting_engine.cli import configure_environment
+    configure_environment(
+        run_id="benchmark",
+        data_path=work_dir / "data",
+        artifacts_path=work_dir / "artifacts",
+        model_config=model_config_path.resolve()
+    )
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    from forecasting_engine.utils import load_config
+    from forecasting_engine.instrumentation import peak_rss_mb
+
+    model_config = load_config(str(model_config_path))
+
+    results = []
+    for frequency in args.frequencies:
+        for rows in sorted(args.sizes):
+            results += run_case(frequency, rows, args, model_config, work_dir)
+
+    meta = environment_info()
+    meta.update({
+        "args": {k: v for k, v in vars(args).items() if k not in ("output", "verbose")},
+        "peak_rss_mb": peak_rss_mb(),
+    })
+
+    output = Path(
+        args.output or PROJECT_ROOT / "benchmarks" / "results"
+        / f"{meta['commit']}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+# pandas frequency alias and seasonal cycles (in steps) per data frequency
+FREQUENCIES = {
+    "hourly": ("h", (24, 24 * 7)),
+    "daily": ("D", (7, 365.25)),
+    "monthly": ("MS", (12,)),
+}
+
+# datetime64[ns] spans 1677-09-21 .. 2262-04-11
+EARLIEST_START = pd.Timestamp("1678-01-01")
+LATEST_END = pd.Timestamp("2262-01-01")
+
+
+def max_rows(frequency: str) -> int:
+    """
+    Longest single series of this frequency that fits in datetime64[ns].
+    """
+    freq, _ = FREQUENCIES[frequency]
+    return len(pd.date_range(EARLIEST_START, LATEST_END, freq=freq))
+
+
+def generate_series(rows: int,
+                    frequency: str = "hourly",
+                    gap_rate: float = 0.01,
+                    nan_rate: float = 0.005,
+                    outlier_rate: float = 0.002,
+                    duplicate_rate: float = 0.001,
+                    negative_rate: float = 0.001,
+                    seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic demand series: level + trend + one sine per seasonal cycle of
+    the frequency + noise, with dirty data injected the way real uploads
+    arrive. Timestamps are strings, as read from a CSV.
+
+    Args:
+        rows: number of rows before gaps are removed
+        frequency: hourly | daily | monthly
+        gap_rate: share of timestamps dropped (missing periods)
+        nan_rate: share of demand values set to NaN
+        outlier_rate: share of demand values scaled by 5-10x
+        duplicate_rate: share of rows repeated
+        negative_rate: share of demand values negated
+        seed: random seed
+
+    Returns:
+        df: dataframe with `timestamp` (string) and `demand` columns
+    """
+
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"Unsupported frequency: {frequency}")
+    if rows > max_rows(frequency):
+        raise ValueError(
+            f"{rows} {frequency} rows exceed the datetime64[ns] range "
+            f"(at most {max_rows(frequency)})"
+        )
+
+    rng = np.random.default_rng(seed)
+    freq, cycles = FREQUENCIES[frequency]
+
+    # end at 2024 when the range allows, so small series look realistic
+    try:
+        start = max(EARLIEST_START, pd.Timestamp("2024-01-01") - pd.tseries.frequencies.to_offset(freq) * rows)
+    except (OverflowError, pd.errors.OutOfBoundsDatetime):
+        start = EARLIEST_START
+    timestamps = pd.date_range(start, periods=rows, freq=freq)
+
+    t = np.arange(rows, dtype=float)
+    demand = 100 + 0.001 * t + rng.normal(0, 3, rows)
+    for k, cycle in enumerate(cycles):
+        demand += (20 / (k + 1)) * np.sin(2 * np.pi * t / cycle)
+
+    outliers = rng.random(rows) < outlier_rate
+    demand[outliers] *= rng.uniform(5, 10, outliers.sum())
+    demand[rng.random(rows) < negative_rate] *= -1
+    demand[rng.random(rows) < nan_rate] = np.nan
+
+    df = pd.DataFrame({"timestamp": timestamps, "demand": demand})
+    df = df[rng.random(rows) >= gap_rate]
+
+    duplicates = df[rng.random(len(df)) < duplicate_rate]
+    df = pd.concat([df, duplicates]).sort_values("timestamp", kind="stable", ignore_index=True)
+
+    df["timestamp"] = df["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    return df
@@ -1,15 +1,22 @@
 import os
+import time
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 from forecasting_engine.utils import *
 from forecasting_engine.logger import app_logger
+from forecasting_engine.reporting import StreamlitReporter, set_reporter
+from forecasting_engine.cache import hash_payload, file_content_hash, cached_stage
+from forecasting_engine.instrumentation import get_run_metrics
 from forecasting_engine.data.ingestion import *
 from forecasting_engine.data.cleansing import *
 from forecasting_engine.data.preprocessing import *
+from forecasting_engine.data.features import feature_engineering
 from forecasting_engine.training.trainer import model_trainer
+from forecasting_engine.training.racing import uses_exog
 from forecasting_engine.training.evaluator import model_evaluator
-from forecasting_engine.inference.predictor import generate_forecast_plot_df
+from forecasting_engine.inference.predictor import generate_forecast_plot_df, full_history_model
+from forecasting_engine.batch.engine import batch_forecaster
 
 # -----------------------------------
 # UI CONFIG
@@ -69,6 +76,70 @@ if "RUN_ID" not in os.environ:
 logger = app_logger("forecasting_engine")
 logger.info("Application started")
 
+model_config = load_config(os.environ["MODEL_CONFIG_PATH"])
+
+set_reporter(StreamlitReporter())
+
+# per-session stage results, keyed on hashes of each stage's inputs
+stage_cache = st.session_state.setdefault("stage_cache", {})
+
+
+def run_ingestion(file):
+    raw_df = data_loader(file)
+    raw_data_saver(raw_df)
+    return raw_df
+
+
+def run_cleansing(raw_df, map_dict):
+    cleansed_df, quality_report = data_cleanser(
+        raw_df,
+        datetime_col=map_dict['datetime_col'],
+        demand_col=map_dict['demand_col']
+    )
+
+    data_continuity = check_data_continuity(
+        cleansed_df=cleansed_df,
+        datetime_col=map_dict['datetime_col'],
+        frequency=map_dict['frequency']
+    )
+
+    imputed_data = data_imputer(
+        cleansed_df=cleansed_df,
+        datetime_col=map_dict['datetime_col'],
+        demand_col=map_dict['demand_col'],
+        frequency=map_dict['frequency'],
+        data_continuity=data_continuity,
+        **model_config.get("imputation", {})
+    )
+
+    data_continuity_after = check_data_continuity(
+        cleansed_df=imputed_data,
+        datetime_col=map_dict['datetime_col'],
+        frequency=map_dict['frequency']
+    )
+
+    return cleansed_df, quality_report, imputed_data, data_continuity, data_continuity_after
+
+
+def run_training(preprocessed_df, map_dict):
+    best_model, y_test, preds, score = model_trainer(
+        preprocessed_df=preprocessed_df,
+        model_config=model_config,
+        map_dict=map_dict
+    )
+
+    # persist the model at the end of the full history, as the pipeline
+    # does, so forecasts and incremental updates continue from the last row
+    history_df = preprocessed_df.reset_index(drop=True)
+    features_df = None
+    if uses_exog(model_config):
+        features_df = feature_engineering(
+            history_df, map_dict['datetime_col'], model_config.get("features")
+        )
+    model_saver(full_history_model(best_model, history_df[map_dict['demand_col']], exog=features_df))
+
+    return best_model, y_test, preds, score
+
 # -----------------------------------
 # 1. DATA INGESTION
 # -----------------------------------
@@ -81,9 +152,11 @@ with st.container():
     )
 
 if file:
+    ingestion_key = hash_payload("ingestion", file.name, file_content_hash(file))
+
     with st.spinner("Loading data..."):
-        raw_df = data_loader(file)
-        raw_data_saver(raw_df)
+        raw_df = cached_stage(stage_cache, "ingestion", ingestion_key,
+                              run_ingestion, file)
 
     st.success("Data loaded successfully")
 
@@ -95,44 +168,77 @@ if file:
         st.subheader("🗺️ Data Mapping")
         map_dict = data_columns_mapper(raw_df)
 
-    with st.container():
-        st.subheader("🧹 Data Cleansing")
-        with st.spinner("Cleansing data..."):
-            cleansed_df = data_cleanser(
-                raw_df,
-                datetime_col=map_dict['datetime_col'],
-                demand_col=map_dict['demand_col']
+    if map_dict.get('series_col'):
+        with st.container():
+            st.subheader("🗂️ Batch Forecasting")
+            horizon = st.number_input(
+                "Forecast horizon (steps per series)",
+                min_value=1,
+                value=12
             )
 
-            data_continuity = check_data_continuity(
-                cleansed_df=cleansed_df,
-                datetime_col=map_dict['datetime_col'],
-                frequency=map_dict['frequency']
-            )
+            if st.button("Run batch forecast"):
+                progress_bar = st.progress(0.0, text="Starting batch...")
+                batch_start = time.perf_counter()
+
+                def update_progress(completed, total):
+                    rate = completed / max(time.perf_counter() - batch_start, 1e-9)
+                    progress_bar.progress(
+                        completed / total,
+                        text=f"{completed}/{total} series • {rate:.2f} series/s"
+                    )
+
+                forecast_df, summary_df, stats = batch_forecaster(
+                    raw_df=raw_df,
+                    map_dict=map_dict,
+                    model_config=model_config,
+                    horizon=int(horizon),
+                    progress_callback=update_progress
+                )
 
-            st.info(f'📉 Data continuity before imputation: {data_continuity}')
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Series", stats['series'])
+                col2.metric("Failed", stats['failed'])
+                col3.metric("Series / second", round(stats['series_per_second'], 2))
 
-            imputed_data = data_imputer(
-                cleansed_df=cleansed_df,
-                datetime_col=map_dict['datetime_col'],
-                demand_col=map_dict['demand_col'],
-                frequency=map_dict['frequency'],
-                data_continuity=data_continuity
-            )
+                st.dataframe(summary_df, use_container_width=True)
+                st.dataframe(forecast_df, use_container_width=True)
 
-            data_continuity_after = check_data_continuity(
-                cleansed_df=imputed_data,
-                datetime_col=map_dict['datetime_col'],
-                frequency=map_dict['frequency']
+        st.stop()
+
+    with st.container():
+        st.subheader("🧹 Data Cleansing")
+        with st.spinner("Cleansing data..."):
+            cleansing_key = hash_payload(
+                "cleansing", ingestion_key, map_dict,
+                model_config.get("imputation", {})
+            )
+            cleansed_df, quality_report, imputed_data, data_continuity, data_continuity_after = cached_stage(
+                stage_cache, "cleansing", cleansing_key,
+                run_cleansing, raw_df, map_dict
             )
 
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("NaN rows", quality_report['nan_rows'])
+            col2.metric("Duplicate rows", quality_report['duplicate_rows'])
+            col3.metric("Negative values", quality_report['negative_values'])
+            col4.metric("Rows dropped", quality_report['rows_dropped'])
+
+            st.info(f'📉 Data continuity before imputation: {data_continuity}')
             st.success(f'📈 Data continuity after imputation: {data_continuity_after}')
 
     with st.container():
         st.subheader("⚙️ Data Preprocessing")
         with st.spinner("Preprocessing data..."):
-            preprocessed_df = data_preprocessing(
-                cleansed_df=cleansed_df,
+            preprocessing_key = hash_payload(
+                "preprocessing", cleansing_key,
+                model_config.get("imputation", {}),
+                model_config.get("preprocessing", {})
+            )
+            preprocessed_df = cached_stage(
+                stage_cache, "preprocessing", preprocessing_key,
+                data_preprocessing,
+                cleansed_df=imputed_data,
                 demand_col=map_dict['demand_col']
             )
         st.success("Data preprocessing complete")
@@ -141,12 +247,15 @@ if file:
         st.subheader("🧠 Model Training")
         st.info("Training model... this may take a moment.")
         with st.spinner("Training in progress..."):
-            best_model, y_test, preds, score = model_trainer(
-                preprocessed_df=preprocessed_df,
-                model_config=model_config,
-                map_dict=map_dict
+            training_key = hash_payload(
+                "training", preprocessing_key,
+                {k: v for k, v in model_config.items()
+                 if k not in ("preprocessing", "imputation")}
+            )
+            best_model, y_test, preds, score = cached_stage(
+                stage_cache, "training", training_key,
+                run_training, preprocessed_df, map_dict
             )
-            model_saver(best_model)
 
         st.success("Model training complete")
 
@@ -214,5 +323,16 @@ if file:
 
             st.plotly_chart(fig, use_container_width=True)
 
+    timings = get_run_metrics().records()
+    if timings:
+        with st.expander("⏱️ Timing breakdown"):
+            timings_df = pd.DataFrame(timings)
+            timings_df["fold"] = timings_df["labels"].map(lambda labels: labels.get("fold"))
+            columns = [c for c in (
+                "stage", "fold", "wall_time", "cpu_time",
+                "peak_memory_mb", "peak_rss_mb", "rss_growth_mb"
+            ) if c in timings_df]
+            st.dataframe(timings_df[columns], use_container_width=True, hide_index=True)
+
 else:
     st.info("👆 Upload a dataset to begin forecasting")
@@ -0,0 +1,4 @@
+import sys
+from forecasting_engine.cli import main
+
+sys.exit(main())
@@ -0,0 +1,226 @@
+import time
+import copy
+import pandas as pd
+from typing import Callable
+from forecasting_engine.logger import app_logger, log_context
+from forecasting_engine.utils import forecast_data_saver
+from forecasting_engine.instrumentation import collect_stages, record_stage, save_run_metrics
+from forecasting_engine.data.cleansing import (
+    data_cleanser, check_data_continuity, data_imputer
+)
+from forecasting_engine.data.preprocessing import data_preprocessing
+from forecasting_engine.data.features import feature_engineering, future_features
+from forecasting_engine.training.trainer import model_trainer
+from forecasting_engine.training.racing import uses_exog
+from forecasting_engine.training.executor import parallel_map
+from forecasting_engine.inference.predictor import future_dates, forecast_full_history
+
+logger = app_logger(__name__)
+
+# cleansing quality report counts carried into the per-series summary
+QUALITY_COLUMNS = ("nan_rows", "duplicate_rows", "negative_values", "rows_dropped")
+
+
+def forecast_series(series_id,
+                    series_df: pd.DataFrame,
+                    map_dict: dict,
+                    model_config: dict,
+                    horizon: int) -> dict:
+    """
+    Runs the full single-series pipeline for one series: cleansing,
+    imputation, preprocessing, CV training and a forecast of `horizon` steps
+    past the last observation.
+
+    Failures are captured in the result instead of raised, so one bad series
+    does not abort the batch. Stage timings are collected rather than
+    recorded, since workers do not share the parent's run metrics, and
+    returned for the parent to record.
+
+    Args:
+        series_id: value of the series key column
+        series_df: rows belonging to this series
+        map_dict: column mapping (datetime_col, demand_col, frequency, series_col)
+        model_config: parsed model_params.yaml
+        horizon: number of future steps to forecast
+
+    Returns:
+        result: dict with series_id, status, error, rows, rmse, the cleansing
+            quality counts, elapsed, forecast_df, stage_records
+    """
+
+    # every log line and stage timing of this series carries its key
+    with log_context(series=str(series_id)), collect_stages() as stage_records:
+        result = _forecast_series(series_id, series_df, map_dict, model_config, horizon)
+
+    result["stage_records"] = stage_records
+    return result
+
+
+def _forecast_series(series_id,
+                     series_df: pd.DataFrame,
+                     map_dict: dict,
+                     model_config: dict,
+                     horizon: int) -> dict:
+    start = time.perf_counter()
+    datetime_col = map_dict['datetime_col']
+    demand_col = map_dict['demand_col']
+    quality_report = {}
+
+    try:
+        cleansed_df, quality_report = data_cleanser(
+            series_df,
+            datetime_col=datetime_col,
+            demand_col=demand_col
+        )
+
+        data_continuity = check_data_continuity(
+            cleansed_df=cleansed_df,
+            datetime_col=datetime_col,
+            frequency=map_dict['frequency']
+        )
+
+        imputed_df = data_imputer(
+            cleansed_df=cleansed_df,
+            datetime_col=datetime_col,
+            demand_col=demand_col,
+            frequency=map_dict['frequency'],
+            data_continuity=data_continuity,
+            **model_config.get("imputation", {})
+        )
+
+        preprocessed_df = data_preprocessing(
+            cleansed_df=imputed_df,
+            demand_col=demand_col,
+            save=False
+        ).reset_index(drop=True)  # SARIMAX needs a 0-based RangeIndex to forecast
+
+        features_df = None
+        if uses_exog(model_config):
+            features_df = feature_engineering(
+                preprocessed_df, datetime_col, model_config.get("features")
+            )
+
+        best_model, _, _, score = model_trainer(
+            preprocessed_df=preprocessed_df,
+            model_config=model_config,
+            map_dict=map_dict,
+            exog=features_df
+        )
+
+        dates = future_dates(
+            preprocessed_df[datetime_col].max(), map_dict['frequency'], horizon
+        )
+        forecasts = forecast_full_history(
+            best_model, preprocessed_df[demand_col], horizon, features_df,
+            future_features(dates)
+        )
+
+        forecast_df = pd.DataFrame({
+            map_dict['series_col']: series_id,
+            datetime_col: dates,
+            "Forecast": forecasts.values
+        })
+
+        status, error, rmse_score = "ok", None, score
+
+    except Exception as e:
+        logger.warning(f"Series {series_id} failed: {e}")
+        forecast_df = None
+        status, error, rmse_score = "failed", f"{type(e).__name__}: {e}", None
+
+    return {
+        "series_id": series_id,
+        "status": status,
+        "error": error,
+        "rows": len(series_df),
+        "rmse": rmse_score,
+        **{k: quality_report.get(k) for k in QUALITY_COLUMNS},
+        "elapsed": time.perf_counter() - start,
+        "forecast_df": forecast_df
+    }
+
+
+def batch_forecaster(raw_df: pd.DataFrame,
+                     map_dict: dict,
+                     model_config: dict,
+                     horizon: int,
+                     progress_callback: Callable = None):
+    """
+    Forecasts every series in a long-format dataframe keyed by
+    map_dict['series_col'], spreading series across the configured executor.
+
+    Each series trains its folds serially inside its worker, so parallelism
+    happens at the series level only and workers do not nest pools.
+
+    Args:
+        raw_df: uploaded data holding all series
+        map_dict: column mapping including series_col
+        model_config: parsed model_params.yaml
+        horizon: number of future steps to forecast per series
+        progress_callback: optional callable(completed, total)
+
+    Returns:
+        tuple: consolidated forecast dataframe, per-series summary dataframe,
+            run stats (series, succeeded, failed, elapsed, series_per_second)
+    """
+
+    series_col = map_dict.get('series_col')
+    if not series_col:
+        raise ValueError("series_col is not set in the data mapping")
+
+    series_config = copy.deepcopy(model_config)
+    series_config["execution"] = {"backend": "serial"}
+
+    tasks = [
+        (series_id, series_df, map_dict, series_config, horizon)
+        for series_id, series_df in raw_df.groupby(series_col, sort=False)
+    ]
+
+    logger.info(f"Batch forecasting started | series={len(tasks)}, horizon={horizon}")
+
+    start = time.perf_counter()
+    results = parallel_map(
+        forecast_series,
+        tasks,
+        model_config.get("execution", {}),
+        progress_callback
+    )
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        for stats in result["stage_records"]:
+            record_stage(stats)
+    save_run_metrics()
+
+    forecast_frames = [r["forecast_df"] for r in results if r["forecast_df"] is not None]
+    forecast_df = (
+        pd.concat(forecast_frames, ignore_index=True) if forecast_frames
+        else pd.DataFrame(columns=[series_col, map_dict['datetime_col'], "Forecast"])
+    )
+
+    summary_df = pd.DataFrame(
+        [
+            {k: v for k, v in r.items() if k not in ("forecast_df", "stage_records")}
+            for r in results
+        ]
+    )
+
+    n_failed = int((summary_df["status"] == "failed").sum()) if len(summary_df) else 0
+    stats = {
+        "series": len(results),
+        "succeeded": len(results) - n_failed,
+        "failed": n_failed,
+        "elapsed": elapsed,
+        "series_per_second": len(results) / elapsed if elapsed > 0 else float("nan")
+    }
+
+    logger.info(
+        f"Batch forecasting complete | series={stats['series']}, "
+        f"succeeded={stats['succeeded']}, failed={stats['failed']}, "
+        f"elapsed={elapsed:.2f}s, throughput={stats['series_per_second']:.2f} series/s"
+    )
+
+    if not forecast_df.empty:
+        forecast_data_saver(forecast_df)
+
+    return forecast_df, summary_df, stats
@@ -0,0 +1,93 @@
+import json
+import hashlib
+from typing import Any, Callable
+from forecasting_engine.logger import app_logger
+
+logger = app_logger(__name__)
+
+
+def hash_payload(*parts: Any) -> str:
+    """
+    Builds a stable SHA-256 digest from any mix of bytes, strings and
+    JSON-serialisable objects (dicts, lists, numbers).
+
+    Args:
+        parts: values that together identify a stage input
+
+    Returns:
+        digest: hex digest of the combined payload
+    """
+
+    hasher = hashlib.sha256()
+
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            payload = bytes(part)
+        elif isinstance(part, str):
+            payload = part.encode("utf-8")
+        else:
+            payload = json.dumps(part, sort_keys=True, default=str).encode("utf-8")
+
+        # length prefix keeps ("ab", "c") and ("a", "bc") apart
+        hasher.update(len(payload).to_bytes(8, "little"))
+        hasher.update(payload)
+
+    return hasher.hexdigest()
+
+
+def file_content_hash(file) -> str:
+    """
+    Hashes the contents of an uploaded file (Streamlit UploadedFile or any
+    binary file-like object) without consuming its read position.
+
+    Args:
+        file: uploaded file object
+
+    Returns:
+        digest: hex digest of the file bytes
+    """
+
+    if hasattr(file, "getvalue"):
+        return hash_payload(file.getvalue())
+
+    position = file.tell()
+    file.seek(0)
+    digest = hash_payload(file.read())
+    file.seek(position)
+
+    return digest
+
+
+def cached_stage(cache: dict,
+                 stage: str,
+                 key: str,
+                 func: Callable,
+                 *args,
+                 **kwargs):
+    """
+    Runs a pipeline stage only if its input key changed since the last call.
+
+    Only the most recent result per stage is held, so a session keeps at most
+    one copy of each stage output in memory.
+
+    Args:
+        cache: mutable mapping holding stage results (e.g. st.session_state)
+        stage: stage name, used as the cache slot
+        key: hash of everything the stage depends on
+        func: stage function to call on a miss
+        args, kwargs: forwarded to func
+
+    Returns:
+        result: cached or freshly computed stage output
+    """
+
+    entry = cache.get(stage)
+    if entry is not None and entry["key"] == key:
+        logger.info(f"Stage cache hit | stage={stage}, key={key[:12]}")
+        return entry["result"]
+
+    logger.info(f"Stage cache miss | stage={stage}, key={key[:12]}")
+    result = func(*args, **kwargs)
+    cache[stage] = {"key": key, "result": result}
+
+    return result
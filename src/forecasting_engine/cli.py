@@ -0,0 +1,122 @@
+import os
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="forecasting_engine",
+        description="Run the forecasting pipeline headless: "
+                    "ingest -> cleanse -> impute -> preprocess -> train -> forecast"
+    )
+    parser.add_argument("input", help="path to a CSV / Parquet / Excel file")
+    parser.add_argument("--mapping",
+                        help="data mapping JSON (default: $CONFIG_PATH/data_mapping.json)")
+    parser.add_argument("--model-config",
+                        help="model params YAML (default: $MODEL_CONFIG_PATH)")
+    parser.add_argument("--horizon", type=int, default=12,
+                        help="number of future steps to forecast (default: 12)")
+    parser.add_argument("--run-id", help="run identifier (default: current timestamp)")
+    parser.add_argument("--data-path", help="data directory (default: $DATA_PATH)")
+    parser.add_argument("--artifacts-path", help="artifacts directory (default: $ARTIFACTS_PATH)")
+    parser.add_argument("--output", help="also write the forecast CSV to this path")
+    parser.add_argument("--update", metavar="RUN_ID",
+                        help="treat the input as new observations and update this run's "
+                             "saved model instead of training a new one")
+    return parser.parse_args(argv)
+
+
+def configure_environment(run_id: str = None,
+                          data_path: str = None,
+                          artifacts_path: str = None,
+                          model_config: str = None) -> None:
+    """
+    Fills the environment the pipeline modules read at import time: explicit
+    arguments win, then .env / existing variables, then repo-relative defaults.
+    """
+
+    load_dotenv()
+
+    overrides = {
+        "RUN_ID": run_id,
+        "DATA_PATH": data_path,
+        "ARTIFACTS_PATH": artifacts_path,
+        "MODEL_CONFIG_PATH": model_config
+    }
+    for key, value in overrides.items():
+        if value:
+            os.environ[key] = str(value)
+
+    defaults = {
+        "RUN_ID": datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
+        "DATA_PATH": PROJECT_ROOT / "data",
+        "ARTIFACTS_PATH": PROJECT_ROOT / "artifacts",
+        "CONFIG_PATH": PROJECT_ROOT / "config",
+        "MODEL_CONFIG_PATH": PROJECT_ROOT / "config" / "model_params.yaml"
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, str(value))
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    configure_environment(
+        run_id=args.run_id,
+        data_path=args.data_path,
+        artifacts_path=args.artifacts_path,
+        model_config=args.model_config
+    )
+
+    # pipeline modules read the environment on import, so import after setup
+    from forecasting_engine.utils import load_config
+    from forecasting_engine.logger import app_logger
+    from forecasting_engine.pipeline import run_pipeline, ingestion_settings
+    from forecasting_engine.data.ingestion import data_loader
+    from forecasting_engine.training.updater import model_updater
+
+    logger = app_logger("forecasting_engine.cli")
+
+    mapping_path = Path(args.mapping or Path(os.environ["CONFIG_PATH"]) / "data_mapping.json")
+    with open(mapping_path) as f:
+        map_dict = json.load(f)
+
+    model_config = load_config(os.environ["MODEL_CONFIG_PATH"])
+
+    if args.update:
+        try:
+            _, stats = model_updater(
+                new_df=data_loader(
+                    args.input, map_dict=map_dict, ingestion=ingestion_settings(model_config)
+                ),
+                map_dict=map_dict,
+                model_config=model_config,
+                run_id=args.update
+            )
+        except Exception:
+            logger.exception("Model update failed")
+            return 1
+
+        logger.info(f"Model update complete: {stats}")
+        return 0
+
+    try:
+        result = run_pipeline(
+            file=args.input,
+            map_dict=map_dict,
+            model_config=model_config,
+            horizon=args.horizon
+        )
+    except Exception:
+        logger.exception("Pipeline run failed")
+        return 1
+
+    if args.output:
+        result["forecast_df"].to_csv(args.output, index=False)
+        logger.info(f"Forecast written to {args.output}")
+
+    return 0
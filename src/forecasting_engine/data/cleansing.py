@@ -1,44 +1,120 @@
+import time
+import numpy as np
 import pandas as pd
-import streamlit as st
 
 from forecasting_engine.logger import app_logger 
+from forecasting_engine.reporting import get_reporter
+from forecasting_engine.instrumentation import instrumented
+from forecasting_engine.data.timestamps import parse_timestamps
+from forecasting_engine.data.gaps import PERIOD_FREQ, detect_gaps, impute_gaps
 logger = app_logger(__name__)
 
+def _row_hashes(df: pd.DataFrame, overrides: dict) -> np.ndarray:
+    """
+    One uint64 hash per row over every column, with `overrides` standing in
+    for columns whose parsed values should be compared instead of the raw
+    ones. Lets duplicates be found without materialising a modified frame.
+    """
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        values = overrides[col] if col in overrides else df[col]
+        col_hash = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        hashes = (hashes * np.uint64(1000003)) ^ col_hash
+    return hashes
+
+
+def _duplicated_rows(df: pd.DataFrame, overrides: dict) -> np.ndarray:
+    """
+    Exact duplicate mask (first occurrence kept). Row hashes only pick the
+    candidate rows; those are compared value by value, so a hash collision
+    never drops a distinct row.
+    """
+    candidates = np.flatnonzero(
+        pd.Series(_row_hashes(df, overrides)).duplicated(keep=False).to_numpy()
+    )
+    duplicated = np.zeros(len(df), dtype=bool)
+    if len(candidates):
+        subset = df.take(candidates).assign(**{
+            col: values.to_numpy()[candidates] for col, values in overrides.items()
+        })
+        duplicated[candidates] = subset.duplicated().to_numpy()
+    return duplicated
+
+
+@instrumented("cleansing")
 def data_cleanser(raw_df: pd.DataFrame,
                    datetime_col: str,
-                   demand_col: str) -> pd.DataFrame:
+                   demand_col: str):
     """
-    Cleanses the raw dataframe
+    Cleanses the raw dataframe: drops rows with a missing timestamp or
+    demand, drops duplicate rows and replaces negative demand with the mean
+    of the non-negative demand.
+
+    All masks are computed in one pass over the parsed datetime and demand
+    columns plus one row hash; only rows whose hashes collide are compared
+    exactly, and the kept rows are selected in a single filtered write, so
+    the full frame is never copied.
 
     Args:
         raw_df: raw dataframe
+        datetime_col: name of datetime column
+        demand_col: name of demand column
 
     Returns:
-        cleansed_df: cleansed dataframe
+        tuple: cleansed dataframe, quality report dict (rows_in, nan_rows,
+            duplicate_rows, negative_values, rows_dropped, rows_out, time)
     """
-    
-    ts = raw_df.copy()
 
-    ts[datetime_col] = pd.to_datetime(ts[datetime_col], errors="coerce")
+    reporter = get_reporter()
+    start = time.perf_counter()
+
+    timestamps = parse_timestamps(raw_df[datetime_col])
+    demand = raw_df[demand_col]
+
+    valid = (timestamps.notna() & demand.notna()).to_numpy()
+    duplicated = _duplicated_rows(raw_df, {datetime_col: timestamps})
+    keep = valid & ~duplicated
+    negative = keep & (demand < 0).to_numpy()
+
+    report = {
+        "rows_in": len(raw_df),
+        "nan_rows": int((~valid).sum()),
+        "duplicate_rows": int((valid & duplicated).sum()),
+        "negative_values": int(negative.sum()),
+        "rows_dropped": int((~keep).sum()),
+    }
+
+    ts = raw_df.take(np.flatnonzero(keep)) if report["rows_dropped"] else raw_df.copy(deep=False)
+    ts[datetime_col] = timestamps[keep].to_numpy()
+
+    if report["nan_rows"]:
+        reporter.warning(f"{report['nan_rows']} rows with NaN values found, dropped successfully")
 
-    # dropping NaN / NaT values
-    if ts[[datetime_col, demand_col]].isna().any().any():
-        ts = ts.dropna(subset=[datetime_col, demand_col])
-        st.warning("NaN values found, dropped successfully")
+    if report["duplicate_rows"]:
+        reporter.warning(f"{report['duplicate_rows']} duplicate rows found, dropped successfully")
 
-    # dropping duplicates
-    if ts.duplicated().any():
-        ts = ts.drop_duplicates()
-        st.warning("Duplicate values found, dropped successfully")
+    if report["negative_values"]:
+        reporter.warning(
+            f"{report['negative_values']} negative values found in demand column, replacing with mean"
+        )
+        # a new column rather than an in-place write, which would reach
+        # back into raw_df when no rows were dropped
+        kept_demand = demand.to_numpy()[keep]
+        mean_demand = kept_demand[kept_demand >= 0].mean()
+        ts[demand_col] = np.where(negative[keep], mean_demand, kept_demand)
 
-    # handling negative demand
-    if (ts[demand_col] < 0).any():
-        st.warning("Negative values found in demand column, replacing with mean")
-        mean_demand = ts.loc[ts[demand_col] >= 0, demand_col].mean()
-        ts.loc[ts[demand_col] < 0, demand_col] = mean_demand
+    report["rows_out"] = len(ts)
+    report["time"] = time.perf_counter() - start
+
+    logger.info(
+        "Cleansing report | " + ", ".join(
+            f"{k}={v:.3f}s" if k == "time" else f"{k}={v}" for k, v in report.items()
+        )
+    )
 
-    return ts
+    return ts, report
 
+@instrumented("continuity")
 def check_data_continuity(cleansed_df: pd.DataFrame,
                           datetime_col: str,
                           frequency: str) -> bool:
@@ -46,52 +122,43 @@ def check_data_continuity(cleansed_df: pd.DataFrame,
     Checks if the datetime column is continuous
 
     Args:
-        raw_df: Input raw dataframe
+        cleansed_df: cleansed dataframe
+        datetime_col: name of datetime column
         frequency: frequency of data
     
     Returns:
         bool: True is continuous, False is not
     """
 
-    ts = cleansed_df[datetime_col]
-    ts = pd.to_datetime(ts, errors="coerce")
-    ts = ts.dropna().sort_values().drop_duplicates()
-    
-    if len(ts) < 2:
-        return True
-    
-    frequency_map = {
-        "hourly": "H",
-        "daily": "D",
-        "weekly": "W",
-        "monthly": "M",
-        "quarterly": "Q"
-    }
-
-    if frequency not in frequency_map:
+    if frequency not in PERIOD_FREQ:
         return False
-    
-    expected = pd.date_range(
-        start=ts.min(),
-        end=ts.max(),
-        freq=frequency_map[frequency]
-    )
 
-    return ts.reset_index(drop=True).equals(
-        pd.Series(expected)
-    )
+    report = detect_gaps(cleansed_df, datetime_col, frequency)
+
+    if not report["continuous"]:
+        logger.info(
+            f"Gaps found | gaps={report['gap_count']}, missing={report['missing']}, "
+            f"max_gap={report['max_gap']}"
+        )
+
+    return report["continuous"]
 
+@instrumented("imputation")
 def data_imputer(cleansed_df: pd.DataFrame,
                  datetime_col: str,
                  demand_col: str,
                  frequency: str,
-                 data_continuity: bool) -> pd.DataFrame:
+                 data_continuity: bool,
+                 strategy: str = "linear",
+                 seasonal_period: int = None) -> pd.DataFrame:
     """
     Imputes the data for missing timestamp values to preserve temporal order
 
     Args:
         cleansed_df: Cleansed dataframe
         data_continuity: Boolean value -- result of check_data_continuity method
+        strategy: linear | seasonal_naive | carry_forward | zero
+        seasonal_period: season length for seasonal_naive (default per frequency)
 
     Returns:
         imputed_df: Dataframe after imputation
@@ -100,35 +167,14 @@ def data_imputer(cleansed_df: pd.DataFrame,
     if data_continuity:
         return cleansed_df
 
-    freq_map = {
-        "hourly": "H",
-        "daily": "D",
-        "weekly": "W",
-        "monthly": "M",
-        "quarterly": "Q"
-    }
-
-    if frequency not in freq_map:
+    if frequency not in PERIOD_FREQ:
         return cleansed_df
 
-    df = cleansed_df.copy()
-
-    df[datetime_col] = pd.to_datetime(df[datetime_col], errors="coerce")
-    df = df.dropna(subset=[datetime_col])
-
-    df = df.set_index(datetime_col).sort_index()
-
-    full_index = pd.date_range(
-        start=df.index.min(),
-        end=df.index.max(),
-        freq=freq_map[frequency]
+    return impute_gaps(
+        cleansed_df,
+        datetime_col=datetime_col,
+        demand_col=demand_col,
+        frequency=frequency,
+        strategy=strategy,
+        seasonal_period=seasonal_period
     )
-
-    df = df.reindex(full_index)
-
-    # impute demand (time-series safe default)
-    df[demand_col] = df[demand_col].fillna(0)
-
-    df = df.reset_index().rename(columns={"index": datetime_col})
-
-    return df
@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from forecasting_engine.logger import app_logger
+from forecasting_engine.instrumentation import instrumented
+from forecasting_engine.data.timestamps import parse_timestamps
+
+logger = app_logger(__name__)
+
+FEATURE_DEFAULTS = {
+    "calendar": ["hour", "dayofweek", "month"],
+    "exog_columns": []
+}
+
+CALENDAR_FIELDS = ("hour", "dayofweek", "day", "dayofyear", "month", "quarter")
+ROLLING_STATS = ("mean", "std", "min", "max")
+
+
+def lag_features(values, lags) -> np.ndarray:
+    """
+    Lagged copies of a series gathered from one strided window view.
+
+    Args:
+        values: series values
+        lags: positive lags
+
+    Returns:
+        features: array of shape (len(values), len(lags)); row t holds
+            values[t - lag], NaN before the series starts
+    """
+
+    values = np.asarray(values, dtype=float)
+    lags = np.asarray(lags, dtype=int)
+    max_lag = int(lags.max())
+
+    # row t of the view is values[t - max_lag .. t]
+    padded = np.concatenate([np.full(max_lag, np.nan), values])
+    windows = sliding_window_view(padded, max_lag + 1)
+
+    return windows[:, max_lag - lags]
+
+
+def rolling_features(values, windows, stats) -> np.ndarray:
+    """
+    Rolling statistics over the `window` values before each position,
+    reduced along strided window views (no per-row loop, no window copies).
+
+    Args:
+        values: series values
+        windows: window lengths
+        stats: statistics per window, from ROLLING_STATS
+
+    Returns:
+        features: array of shape (len(values), len(windows) * len(stats));
+            row t summarises values[t - window .. t - 1], NaN until a full
+            window is available
+    """
+
+    unsupported = set(stats) - set(ROLLING_STATS)
+    if unsupported:
+        raise ValueError(f"Unsupported rolling stats: {sorted(unsupported)}. Choose from {ROLLING_STATS}")
+
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    max_window = int(max(windows))
+    padded = np.concatenate([np.full(max_window, np.nan), values])
+
+    columns = []
+    for window in windows:
+        # row t of the view is values[t - window .. t - 1]
+        view = sliding_window_view(padded[max_window - window:max_window + n - 1], window)
+        for stat in stats:
+            columns.append(getattr(view, stat)(axis=1))
+
+    return np.column_stack(columns)
+
+
+def lag_rolling_features(values, lags, windows=(), stats=("mean",)):
+    """
+    Lag and rolling-window features of a series; row t only uses values
+    before t, so the same function builds training rows and, on a history
+    with one NaN appended, the row for the next forecast step.
+
+    Returns:
+        tuple: feature array (len(values), k), feature names
+    """
+
+    blocks = [lag_features(values, lags)]
+    names = [f"lag_{lag}" for lag in lags]
+
+    if len(windows):
+        blocks.append(rolling_features(values, windows, stats))
+        names += [f"rolling_{stat}_{window}" for window in windows for stat in stats]
+
+    return np.hstack(blocks), names
+
+
+def calendar_features(timestamps: pd.Series, fields) -> pd.DataFrame:
+    """
+    Calendar fields of a datetime column (vectorized .dt accessors).
+
+    Args:
+        timestamps: datetime values
+        fields: names from CALENDAR_FIELDS
+
+    Returns:
+        calendar: dataframe with one integer column per field
+    """
+
+    unsupported = set(fields) - set(CALENDAR_FIELDS)
+    if unsupported:
+        raise ValueError(f"Unsupported calendar fields: {sorted(unsupported)}. Choose from {CALENDAR_FIELDS}")
+
+    timestamps = parse_timestamps(timestamps)
+    return pd.DataFrame(
+        {field: getattr(timestamps.dt, field).to_numpy() for field in fields},
+        index=timestamps.index
+    )
+
+
+def known_future_columns(columns) -> list:
+    """
+    Feature columns whose future values are known at forecast time: the
+    calendar fields. Drivers such as Temperature are not, and are left to
+    the model's fallback for unknown values.
+    """
+    return [c for c in columns if c in CALENDAR_FIELDS]
+
+
+def future_features(dates, fields=CALENDAR_FIELDS) -> pd.DataFrame:
+    """
+    Known exogenous features of a forecast horizon, i.e. the calendar
+    fields of its dates (see inference.predictor.future_dates). Models
+    take the columns they were trained on.
+
+    Args:
+        dates: timestamps of the forecast horizon
+        fields: calendar fields to build
+
+    Returns:
+        features: dataframe with one row per date
+    """
+    return calendar_features(pd.Series(dates), list(fields)).reset_index(drop=True)
+
+
+@instrumented("features")
+def feature_engineering(preprocessed_df: pd.DataFrame,
+                        datetime_col: str,
+                        config: dict = None) -> pd.DataFrame:
+    """
+    Exogenous features for the models that use them: calendar fields of the
+    datetime column plus the configured driver columns (e.g. Temperature,
+    Humidity). Rows inserted by imputation have no driver values, so
+    drivers are interpolated. Only the calendar fields are known over a
+    forecast horizon (see future_features). Lag and rolling features of the demand are
+    built by the model itself, since forecasting must regenerate them.
+
+    Args:
+        preprocessed_df: output of data_preprocessing
+        datetime_col: name of datetime column
+        config: `features` section of model_params.yaml
+
+    Returns:
+        features_df: numeric dataframe aligned with preprocessed_df
+    """
+
+    config = {**FEATURE_DEFAULTS, **(config or {})}
+    exog_columns = list(config["exog_columns"] or [])
+
+    # a driver named like a calendar field (e.g. an `hour` column) is
+    # derived from the datetime, so its future values stay known
+    calendar_fields = list(config["calendar"] or [])
+    calendar_fields += [c for c in exog_columns if c in CALENDAR_FIELDS and c not in calendar_fields]
+
+    calendar = calendar_features(preprocessed_df[datetime_col], calendar_fields)
+    calendar.index = preprocessed_df.index
+
+    requested = [c for c in exog_columns if c not in calendar_fields]
+    missing = [c for c in requested if c not in preprocessed_df.columns]
+    if missing:
+        logger.warning(
+            f"Exogenous columns not found, skipped: {missing} "
+            f"(keep them in ingestion.extra_columns)"
+        )
+    drivers = [c for c in requested if c not in missing]
+
+    driver_df = (
+        preprocessed_df[drivers]
+        .apply(pd.to_numeric, errors="coerce")
+        .astype(float)
+        .interpolate(limit_direction="both")
+    )
+
+    features_df = pd.concat([calendar, driver_df], axis=1)
+
+    logger.info(
+        f"Feature engineering | calendar={calendar_fields}, exog={drivers}, "
+        f"rows={len(features_df)}"
+    )
+
+    return features_df
@@ -1,43 +1,170 @@
 import os
 import json
+import time
 import pandas as pd
-import streamlit as st
 from typing import Dict
 from pathlib import Path
 from dotenv import load_dotenv
 from forecasting_engine.logger import app_logger 
+from forecasting_engine.reporting import get_reporter
+from forecasting_engine.instrumentation import instrumented, peak_rss_mb
+from forecasting_engine.data.timestamps import parse_timestamps
 
 load_dotenv()
 
 logger = app_logger(__name__)
 
-CONFIG_PATH = Path(os.getenv("CONFIG_PATH"))
+INGESTION_ENGINES = ("pyarrow", "chunked", "pandas")
 
 
-def data_loader(file) -> pd.DataFrame:
+def ingestion_schema(map_dict: dict, ingestion: dict):
+    """
+    Columns to read and their declared dtypes for a mapped file.
+
+    Args:
+        map_dict: column mapping (datetime_col, demand_col, series_col)
+        ingestion: `ingestion` section of config.yaml
+
+    Returns:
+        tuple: ordered list of columns, dict of column -> dtype
+    """
+
+    columns = [map_dict['datetime_col'], map_dict['demand_col']]
+    if map_dict.get('series_col'):
+        columns.append(map_dict['series_col'])
+    columns += list(ingestion.get("extra_columns") or [])
+    columns = list(dict.fromkeys(columns))
+
+    dtypes = {map_dict['demand_col']: "float64", **(ingestion.get("dtypes") or {})}
+    dtypes = {col: dtype for col, dtype in dtypes.items() if col in columns}
+
+    return columns, dtypes
+
+
+def _parse_datetime(df: pd.DataFrame, datetime_col: str, datetime_format) -> pd.DataFrame:
+    parsed = parse_timestamps(df[datetime_col], datetime_format)
+    # pyarrow may already yield second-resolution timestamps; normalise to
+    # nanoseconds so every reader produces the same dtype
+    if parsed.dt.tz is None:
+        parsed = parsed.astype("datetime64[ns]")
+    df[datetime_col] = parsed
+    return df
+
+
+def _rewind(file):
+    if hasattr(file, "seek"):
+        file.seek(0)
+
+
+def _read_csv(file, columns, dtypes, map_dict, ingestion) -> pd.DataFrame:
+    engine = ingestion.get("engine", "pyarrow")
+    datetime_col = map_dict['datetime_col']
+    datetime_format = ingestion.get("datetime_format")
+
+    if engine not in INGESTION_ENGINES:
+        raise ValueError(f"Unsupported ingestion engine: {engine}")
+
+    if engine == "pyarrow":
+        try:
+            df = pd.read_csv(file, engine="pyarrow", usecols=columns, dtype=dtypes)
+            return _parse_datetime(df, datetime_col, datetime_format)
+        except ImportError:
+            logger.warning("pyarrow is not installed, falling back to chunked CSV reads")
+            _rewind(file)
+            engine = "chunked"
+
+    if engine == "chunked":
+        # datetimes are parsed per chunk so string timestamps never
+        # accumulate for the whole file
+        chunks = [
+            _parse_datetime(chunk, datetime_col, datetime_format)
+            for chunk in pd.read_csv(
+                file,
+                usecols=columns,
+                dtype=dtypes,
+                chunksize=int(ingestion.get("chunk_size", 500000))
+            )
+        ]
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(chunks, ignore_index=True)
+
+    df = pd.read_csv(file, usecols=columns, dtype=dtypes)
+    return _parse_datetime(df, datetime_col, datetime_format)
+
+
+@instrumented("ingestion")
+def data_loader(file, map_dict: dict = None, ingestion: dict = None) -> pd.DataFrame:
+    """
+    Reads an uploaded file object or a path to a CSV / Parquet / Excel file.
+
+    Without a column mapping every column is read with inferred dtypes (the
+    app needs them all to offer the mapping). With one, only the mapped
+    columns plus the configured extra_columns are read, with the declared
+    dtypes and the datetime column parsed on load; CSVs go through the
+    pyarrow or chunked reader from the `ingestion` section of config.yaml.
+
+    Args:
+        file: path or binary file object
+        map_dict: column mapping (datetime_col, demand_col, series_col)
+        ingestion: ingestion settings (default: `ingestion` in config.yaml)
+
+    Returns:
+        raw_df: loaded dataframe, or None for a missing/unsupported file
+    """
     if file is None:
         return None
 
-    st.success("File upload successful")
-    logger.info("File upload successful")
-
-    if file.name.endswith(".csv"):
-        return pd.read_csv(file)
-    elif file.name.endswith(".parquet"):
-        return pd.read_parquet(file)
-    elif file.name.endswith((".xls", ".xlsx")):
-        return pd.read_excel(file)
+    reporter = get_reporter()
+    name = str(getattr(file, "name", file))
+
+    columns, dtypes = None, None
+    if map_dict is not None:
+        if ingestion is None:
+            from forecasting_engine.utils import ingestion_config
+            ingestion = ingestion_config()
+        columns, dtypes = ingestion_schema(map_dict, ingestion)
+
+    start = time.perf_counter()
+
+    if name.endswith(".csv"):
+        if columns is None:
+            df = pd.read_csv(file)
+        else:
+            df = _read_csv(file, columns, dtypes, map_dict, ingestion)
+    elif name.endswith(".parquet"):
+        df = pd.read_parquet(file, columns=columns)
+    elif name.endswith((".xls", ".xlsx")):
+        df = pd.read_excel(file, usecols=columns, dtype=dtypes)
     else:
-        st.error("Unsupported file format")
-        logger.error("Unsupported file format")
+        reporter.error("Unsupported file format")
         return None
 
+    if columns is not None and not name.endswith(".csv"):
+        df = df.astype(dtypes)
+        df = _parse_datetime(df, map_dict['datetime_col'], ingestion.get("datetime_format"))
+
+    elapsed = time.perf_counter() - start
+    peak_rss = peak_rss_mb()
+    logger.info(
+        f"Loaded {name} | rows={len(df)}, columns={df.shape[1]}, "
+        f"time={elapsed:.2f}s, rows_per_second={len(df) / max(elapsed, 1e-9):,.0f}, "
+        f"frame_mb={df.memory_usage(deep=True).sum() / (1024 * 1024):.1f}, "
+        f"peak_rss_mb={'n/a' if peak_rss is None else f'{peak_rss:.1f}'}"
+    )
+
+    reporter.success("File upload successful")
+
+    return df
+
 
 def data_columns_mapper(raw_df: pd.DataFrame) -> Dict:
     """
     Maps the columns from the uploaded data to the schema
     """
 
+    import streamlit as st
+
     df_cols = list(raw_df.columns)
 
     datetime_col = st.selectbox(
@@ -52,6 +179,12 @@ def data_columns_mapper(raw_df: pd.DataFrame) -> Dict:
         options=remaining_cols
     )
 
+    series_col = st.selectbox(
+        "Choose the series ID column (optional, for multi-series data)",
+        options=[None] + [c for c in remaining_cols if c != demand_col],
+        format_func=lambda c: "None (single series)" if c is None else c
+    )
+
     frequency = st.selectbox("Select frequency of your data",
                              options=['hourly', 'daily',
                                       'weekly', 'monthly', 'quarterly', 
@@ -60,12 +193,13 @@ def data_columns_mapper(raw_df: pd.DataFrame) -> Dict:
     map_dict = {
         "datetime_col": datetime_col,
         'frequency': frequency,
-        "demand_col": demand_col
+        "demand_col": demand_col,
+        "series_col": series_col
     }
 
     logger.info('Data Mapping Complete')
 
-    with open(CONFIG_PATH/"data_mapping.json", "w") as f:
+    with open(Path(os.getenv("CONFIG_PATH")) / "data_mapping.json", "w") as f:
         json.dump(map_dict, f, indent=4)
 
     logger.info("Data mapping saved")
@@ -1,71 +1,245 @@
 import os
+import time
+import warnings
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
 from dotenv import load_dotenv
-from statsmodels.tsa.stattools import adfuller
 from forecasting_engine.logger import app_logger 
+from forecasting_engine.cache import hash_payload
+from forecasting_engine.instrumentation import instrumented
 from forecasting_engine.utils import load_config, processed_data_saver
 
 load_dotenv()
 
 logger = app_logger(__name__)
 
-model_config_path = os.getenv("MODEL_CONFIG_PATH")
-if not model_config_path:
-    raise ValueError(
-        "MODEL_CONFIG_PATH is not set. Check .env or environment variables."
-    )
 
-model_config = load_config(model_config_path)
-params = model_config.get("preprocessing", {})
+@lru_cache(maxsize=1)
+def preprocessing_config() -> dict:
+    """
+    `preprocessing` section of $MODEL_CONFIG_PATH, read on first use rather
+    than at import.
+    """
+
+    model_config_path = os.getenv("MODEL_CONFIG_PATH")
+    if not model_config_path:
+        raise ValueError(
+            "MODEL_CONFIG_PATH is not set. Check .env or environment variables."
+        )
+
+    return load_config(model_config_path).get("preprocessing", {}) or {}
+
+
+STATIONARITY_TESTS = ("adf", "kpss")
+STATIONARITY_SUBSETS = ("full", "recent", "decimate")
+STATIONARITY_AUTOLAGS = ("aic", "bic", "t-stat")
+
+STATIONARITY_DEFAULTS = {
+    "test": "adf",
+    "autolag": "AIC",
+    "max_lag": None,
+    "subset": "full",
+    "max_points": 10000
+}
+
+# results keyed on a hash of the tested values and the test settings
+_stationarity_cache = OrderedDict()
+STATIONARITY_CACHE_SIZE = 256
+
+
+def _validate_stationarity_config(config: dict) -> None:
+    """
+    Rejects unsupported test / autolag / subset settings up front, so a
+    configuration error raises instead of passing for a failed test.
+    """
+    if config["test"] not in STATIONARITY_TESTS:
+        raise ValueError(
+            f"Unsupported stationarity test: {config['test']}. Choose one of {STATIONARITY_TESTS}"
+        )
+
+    autolag = config["autolag"]
+    if autolag is not None and str(autolag).lower() not in STATIONARITY_AUTOLAGS:
+        raise ValueError(
+            f"Unsupported stationarity autolag: {autolag}. "
+            f"Choose one of {STATIONARITY_AUTOLAGS} or null"
+        )
 
-min_len = params.get("minimum_length", 20)
-p_thresh = params.get("p_value_threshold", 0.05)
-winsor_thresh = params.get("winsorising_threshold", 1.5)
+    if config["subset"] not in STATIONARITY_SUBSETS:
+        raise ValueError(
+            f"Unsupported stationarity subset: {config['subset']}. Choose one of {STATIONARITY_SUBSETS}"
+        )
+
+
+def _stationarity_subset(ts: np.ndarray, subset: str, max_points: int) -> np.ndarray:
+    """
+    The values actually tested: the full series, its most recent
+    max_points, or every k-th point so that at most max_points remain.
+    """
+    if subset == "full" or not max_points or len(ts) <= max_points:
+        return ts
+    if subset == "recent":
+        return ts[-max_points:]
+    return ts[::-(-len(ts) // max_points)]
+
+
+def _run_stationarity_test(ts: np.ndarray, config: dict, p_thresh: float) -> dict:
+    test = config["test"]
+
+    # statsmodels is the slowest import of the package, so load it on first test
+    from statsmodels.tsa.stattools import adfuller, kpss
+    from statsmodels.tools.sm_exceptions import InterpolationWarning
+
+    if test == "adf":
+        result = adfuller(ts, maxlag=config["max_lag"], autolag=config["autolag"])
+        # ADF null hypothesis: unit root (non-stationary)
+        return {"statistic": result[0], "p_value": result[1], "lags": result[2],
+                "stationary": result[1] <= p_thresh}
+
+    with warnings.catch_warnings():
+        # p-values outside the KPSS lookup table are clipped with a warning
+        warnings.simplefilter("ignore", InterpolationWarning)
+        statistic, p_value, lags, _ = kpss(
+            ts, regression="c",
+            nlags="auto" if config["max_lag"] is None else config["max_lag"]
+        )
+    # KPSS null hypothesis: stationary
+    return {"statistic": statistic, "p_value": p_value, "lags": lags,
+            "stationary": p_value > p_thresh}
 
 
+@instrumented("stationarity")
 def stationarity_check(cleansed_df: pd.DataFrame,
-                       demand_col: str) -> bool:
+                       demand_col: str,
+                       config: dict = None) -> bool:
     """
     Checks stationarity of demand values.
 
+    The test and its cost are set by preprocessing.stationarity in
+    model_params.yaml: ADF (with an AIC/BIC lag search capped at max_lag, or
+    a fixed max_lag when autolag is null) or KPSS, on the full series, its
+    most recent max_points, or a decimated copy. Results are cached by a
+    hash of the tested values and settings.
+
     Args:
         cleansed_df: cleaned dataframe
         demand_col: name of demand column
+        config: stationarity settings (default: preprocessing.stationarity)
 
     Returns:
         bool: True if stationary, False if else
     """
-    
+
+    params = preprocessing_config()
+    p_thresh = params.get("p_value_threshold", 0.05)
+    config = {**STATIONARITY_DEFAULTS, **(params.get("stationarity") or {}), **(config or {})}
+    _validate_stationarity_config(config)
+
     ts = cleansed_df[demand_col].dropna()
-    if len(ts) < min_len:
+    if len(ts) < params.get("minimum_length", 20):
         logger.warning("Time series too short for ADF test, skipping differencing")
         return True
 
-    try:
-        result = adfuller(ts)
-    except ValueError as e:
-        logger.warning(f"ADF test failed: {e}. Treating series as stationary.")
-        return True
+    ts = _stationarity_subset(
+        np.ascontiguousarray(ts.to_numpy(dtype=float)), config["subset"], config["max_points"]
+    )
 
-    logger.info(f"ADF Statistic: {result[0]}")
-    logger.info(f"p-value: {result[1]}")
+    key = hash_payload(ts.tobytes(), config, p_thresh)
+    result = _stationarity_cache.get(key)
 
-    if result[1] > p_thresh:
+    if result is not None:
+        _stationarity_cache.move_to_end(key)
+        logger.info(f"Stationarity result reused from cache | test={config['test']}")
+    else:
+        start = time.perf_counter()
+        try:
+            result = _run_stationarity_test(ts, config, p_thresh)
+        except (ValueError, np.linalg.LinAlgError) as e:
+            # numerical failures only (e.g. too few points for max_lag);
+            # the settings were validated above
+            logger.warning(f"{config['test'].upper()} test failed: {e}. Treating series as stationary.")
+            return True
+        result["time"] = time.perf_counter() - start
+
+        _stationarity_cache[key] = result
+        if len(_stationarity_cache) > STATIONARITY_CACHE_SIZE:
+            _stationarity_cache.popitem(last=False)
+
+    logger.info(
+        f"{config['test'].upper()} Statistic: {result['statistic']} | "
+        f"p-value: {result['p_value']} | lags={result['lags']}, "
+        f"observations={len(ts)}, subset={config['subset']}, time={result['time']:.3f}s"
+    )
+
+    if not result["stationary"]:
         logger.info("Series is non-stationary, differencing is needed")
         return False
     else:
         logger.info("Series is stationary, no differencing is needed")
         return True
 
+def _winsor_bounds(values: pd.Series, threshold: float):
+    q1 = values.quantile(0.25)
+    q3 = values.quantile(0.75)
+    iqr = q3 - q1
+    return q1, q3, q1 - threshold * iqr, q3 + threshold * iqr
+
+
+def preprocess_increment(new_df: pd.DataFrame,
+                         history_df: pd.DataFrame,
+                         demand_col: str) -> pd.DataFrame:
+    """
+    Preprocesses rows that extend an already preprocessed history the way
+    data_preprocessing treated that history: clipped to its winsorisation
+    bounds and differenced only if it was. Clipping leaves the quartiles in
+    place, so bounds recomputed from the stored history reproduce the ones
+    used when it was preprocessed (up to the rows differencing dropped).
+
+    Args:
+        new_df: cleansed rows following the history
+        history_df: output of data_preprocessing for the earlier rows
+        demand_col: name of demand column
+
+    Returns:
+        preprocessed_df: new_df with the demand and differenced columns set
+    """
+    params = preprocessing_config()
+    _, _, lower_bound, upper_bound = _winsor_bounds(
+        history_df[demand_col], params.get("winsorising_threshold", 1.5)
+    )
+
+    preprocessed_df = new_df.copy()
+    preprocessed_df[demand_col] = preprocessed_df[demand_col].astype(float).clip(
+        lower=lower_bound, upper=upper_bound
+    )
+
+    diff_col = f"{demand_col}_diff"
+    if history_df[diff_col].equals(history_df[demand_col]):
+        preprocessed_df[diff_col] = preprocessed_df[demand_col]
+    else:
+        order = params.get("differencing_order", 1)
+        demand = pd.concat(
+            [history_df[demand_col].iloc[-order:], preprocessed_df[demand_col]],
+            ignore_index=True
+        )
+        preprocessed_df[diff_col] = demand.diff(order).to_numpy()[order:]
+
+    return preprocessed_df
+
+
+@instrumented("preprocessing")
 def data_preprocessing(cleansed_df: pd.DataFrame,
-                       demand_col: str) -> pd.DataFrame:
+                       demand_col: str,
+                       save: bool = True) -> pd.DataFrame:
     """
     Data preprocessing module, winsorises data and applies differencing if necessary.
 
     Args:
         cleansed_df: cleansed dataframe
         demand_col: name of demand column
+        save: persist the result via processed_data_saver
 
     Returns:
         preprocessed_df: processed dataframe
@@ -73,17 +247,15 @@ def data_preprocessing(cleansed_df: pd.DataFrame,
     Order: Raw Demand -> Outlier Handling(Winsorize/Cap) -> Stationarity Check(ADF) -> Differencing(if needed) -> Model
 
     """
+    params = preprocessing_config()
+    winsor_thresh = params.get("winsorising_threshold", 1.5)
+
     preprocessed_df = cleansed_df.copy()
 
     # --- Winsorization ---
-    q1 = preprocessed_df[demand_col].quantile(0.25)
-    q3 = preprocessed_df[demand_col].quantile(0.75)
+    q1, q3, lower_bound, upper_bound = _winsor_bounds(preprocessed_df[demand_col], winsor_thresh)
     iqr = q3 - q1
 
-    threshold = winsor_thresh
-    lower_bound = q1 - threshold * iqr
-    upper_bound = q3 + threshold * iqr
-
     num_winsorized = (
         (preprocessed_df[demand_col] < lower_bound) |
         (preprocessed_df[demand_col] > upper_bound)
@@ -110,12 +282,14 @@ def data_preprocessing(cleansed_df: pd.DataFrame,
         preprocessed_df[f"{demand_col}_diff"] = (
             preprocessed_df[demand_col].diff(order)
         )
-        preprocessed_df = preprocessed_df.dropna()
+        # only the rows differencing emptied; exogenous columns may have gaps
+        preprocessed_df = preprocessed_df.dropna(subset=[f"{demand_col}_diff"])
     else:
         preprocessed_df[f"{demand_col}_diff"] = preprocessed_df[demand_col]
 
 
-    processed_data_saver(preprocessed_df)
+    if save:
+        processed_data_saver(preprocessed_df)
 
     logger.info(
         f"Preprocessing summary | "
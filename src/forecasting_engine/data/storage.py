@@ -0,0 +1,151 @@
+import os
+import json
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.feather as feather
+from pathlib import Path
+from forecasting_engine.logger import app_logger
+
+logger = app_logger(__name__)
+
+STORAGE_FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow"
+}
+
+
+def frame_content_hash(df: pd.DataFrame) -> str:
+    """
+    Content hash of a dataframe: column names, dtypes and values.
+    Uses pandas' vectorised row hashing, so it is one pass over the data.
+
+    Args:
+        df: dataframe to fingerprint
+
+    Returns:
+        digest: hex SHA-256 digest
+    """
+
+    hasher = hashlib.sha256()
+    hasher.update(json.dumps(
+        [(str(col), str(dtype)) for col, dtype in df.dtypes.items()]
+    ).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+
+    return hasher.hexdigest()
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # uploads can hold mixed-type object columns; store those as strings
+        object_cols = df.select_dtypes(include="object").columns
+        df = df.astype({col: str for col in object_cols})
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_table(table: pa.Table, path: Path, storage_format: str, compression: str):
+    # write to a temp file first so a crashed run never leaves a half-written object
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    if compression in (None, "none"):
+        compression = None if storage_format == "parquet" else "uncompressed"
+
+    if storage_format == "parquet":
+        pq.write_table(table, tmp_path, compression=compression)
+    else:
+        feather.write_feather(table, tmp_path, compression=compression)
+
+    os.replace(tmp_path, path)
+
+
+def save_frame(df: pd.DataFrame,
+               stage_dir: Path,
+               run_id: str,
+               storage_format: str = "parquet",
+               compression: str = "zstd") -> Path:
+    """
+    Stores a dataframe as a content-addressed Parquet / Arrow IPC object and
+    records which object a run used in a small <run_id>.json manifest.
+    Identical frames are written once; later runs only write the manifest.
+
+    Args:
+        df: dataframe to persist
+        stage_dir: directory for this stage (e.g. data/raw)
+        run_id: run identifier
+        storage_format: parquet | arrow
+        compression: codec passed to pyarrow (zstd, lz4, snappy, none)
+
+    Returns:
+        object_path: path of the stored object
+    """
+
+    if storage_format not in STORAGE_FORMATS:
+        raise ValueError(
+            f"Unsupported storage format: {storage_format}. "
+            f"Choose one of {list(STORAGE_FORMATS)}"
+        )
+
+    digest = frame_content_hash(df)
+
+    objects_dir = Path(stage_dir) / "objects"
+    objects_dir.mkdir(parents=True, exist_ok=True)
+    object_path = objects_dir / f"{digest}{STORAGE_FORMATS[storage_format]}"
+
+    if object_path.exists():
+        logger.info(f"Identical data already stored, reusing {object_path}")
+    else:
+        table = _to_arrow(df)
+        _write_table(table, object_path, storage_format, compression)
+        logger.info(
+            f"Stored {len(df)} rows as {storage_format} ({compression}) at {object_path}"
+        )
+
+    manifest = {
+        "run_id": run_id,
+        "hash": digest,
+        "format": storage_format,
+        "path": str(object_path.relative_to(stage_dir)),
+        "rows": len(df),
+        "columns": [str(c) for c in df.columns]
+    }
+    with open(Path(stage_dir) / f"{run_id}.json", "w") as f:
+        json.dump(manifest, f, indent=4)
+
+    return object_path
+
+
+def load_frame(stage_dir: Path,
+               run_id: str,
+               columns: list = None) -> pd.DataFrame:
+    """
+    Loads the dataframe a run stored in stage_dir, memory-mapping the file
+    so only the requested columns are paged in.
+
+    Args:
+        stage_dir: directory for the stage (e.g. data/processed)
+        run_id: run identifier
+        columns: optional subset of columns to read
+
+    Returns:
+        df: stored dataframe with its original dtypes
+    """
+
+    manifest_path = Path(stage_dir) / f"{run_id}.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No stored data for run {run_id} in {stage_dir}")
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    object_path = Path(stage_dir) / manifest["path"]
+
+    if manifest["format"] == "parquet":
+        table = pq.read_table(object_path, columns=columns, memory_map=True)
+    else:
+        table = feather.read_table(object_path, columns=columns, memory_map=True)
+
+    return table.to_pandas()
@@ -0,0 +1,154 @@
+import re
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+from forecasting_engine.logger import app_logger
+
+logger = app_logger(__name__)
+
+# tried after pandas' own guesses, which miss e.g. "01-Jan-20"
+COMMON_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y-%m",
+    "%Y%m%d",
+    "%d-%b-%y",
+    "%d-%b-%Y",
+    "%d-%b-%y %H:%M",
+    "%b-%y",
+    "%b %Y",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%d.%m.%Y",
+    "%d-%m-%Y",
+]
+
+# directives pyarrow's vectorized strptime parses the same way as pandas;
+# pandas falls back to per-element strptime for non-ISO formats
+ARROW_DIRECTIVES = set("YmdHMS")
+
+# head-of-column distinct/total ratio below which values are parsed once per
+# distinct value and broadcast back
+REPEAT_RATIO = 0.5
+
+
+def _sample(values: np.ndarray, sample_size: int) -> list:
+    """
+    Evenly spaced string values from across the column, so a format that
+    only breaks late in the file (e.g. day > 12) is still caught.
+    """
+    if len(values) > sample_size:
+        values = values[np.linspace(0, len(values) - 1, sample_size).astype(int)]
+    return [v for v in values if isinstance(v, str) and v.strip()]
+
+
+def infer_datetime_format(values, sample_size: int = 1000, min_parse_rate: float = 0.95):
+    """
+    Infers one strftime format that parses every sampled value.
+
+    Args:
+        values: array-like of timestamp strings
+        sample_size: number of values checked
+        min_parse_rate: share of the sample a format must parse when none
+            parses all of it
+
+    Returns:
+        format string, or None when no single format fits (or the values
+        are not strings)
+    """
+
+    sample = _sample(np.asarray(values, dtype=object), sample_size)
+    if not sample:
+        return None
+
+    guesses = [guess_datetime_format(v) for v in sample[:20]]
+    candidates = dict.fromkeys([g for g in guesses if g] + COMMON_FORMATS)
+
+    best_fmt, best_rate = None, 0.0
+    for fmt in candidates:
+        rate = pd.to_datetime(pd.Index(sample), format=fmt, errors="coerce").notna().mean()
+        if rate == 1.0:
+            return fmt
+        if rate > best_rate:
+            best_fmt, best_rate = fmt, rate
+
+    # tolerate a few junk values, which become NaT either way
+    return best_fmt if best_rate >= min_parse_rate else None
+
+
+def _arrow_strptime(values: np.ndarray, datetime_format: str):
+    """
+    Vectorized parse through pyarrow for purely numeric formats; None when
+    pyarrow is missing or the format needs pandas.
+    """
+    if not datetime_format or not set(re.findall(r"%(.)", datetime_format)) <= ARROW_DIRECTIVES:
+        return None
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+
+    try:
+        strings = pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed non-string values
+        return None
+
+    parsed = pc.strptime(strings, format=datetime_format, unit="ns", error_is_null=True)
+    return pd.DatetimeIndex(parsed.to_numpy(zero_copy_only=False))
+
+
+def parse_timestamps(values, datetime_format: str = None, sample_size: int = 1000) -> pd.Series:
+    """
+    Parses a timestamp column once, fast.
+
+    Columns that are already datetime64 are returned unchanged, so later
+    stages reuse the parse made by the first one. Otherwise each distinct
+    value is parsed a single time (hourly data repeats every date string)
+    with a format inferred from a sample unless one is given, and the result
+    is broadcast back to the rows. Unparseable values become NaT.
+
+    Args:
+        values: series (or array-like) of timestamps
+        datetime_format: strftime format; inferred when None
+        sample_size: number of distinct values used for format inference
+
+    Returns:
+        parsed: datetime64 series aligned with the input
+    """
+
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    # factorizing only pays off when values repeat; judge that from the head
+    head = values.iloc[:sample_size]
+    repeated = len(head) > 0 and head.nunique() <= len(head) * REPEAT_RATIO
+
+    if repeated:
+        codes, uniques = pd.factorize(values)
+    else:
+        codes, uniques = None, values.to_numpy()
+
+    if datetime_format is None:
+        datetime_format = infer_datetime_format(uniques, sample_size)
+        if datetime_format is None and values.dtype == object and len(uniques):
+            logger.info(f"No single datetime format fits column {values.name!r}, parsing per value")
+
+    parsed = _arrow_strptime(uniques, datetime_format)
+    if parsed is None:
+        parsed = pd.to_datetime(pd.Index(uniques), format=datetime_format, errors="coerce")
+    if parsed.tz is None:
+        parsed = parsed.astype("datetime64[ns]")
+
+    if repeated:
+        parsed = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+
+    return pd.Series(parsed, index=values.index, name=values.name)
@@ -0,0 +1,143 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from collections import OrderedDict
+from forecasting_engine.logger import app_logger
+from forecasting_engine.utils import model_loader
+
+logger = app_logger(__name__)
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def _artifact_mtime(run_id: str) -> float:
+    model_dir = Path(os.getenv("ARTIFACTS_PATH", "")) / "models" / run_id
+    return max((p.stat().st_mtime for p in model_dir.glob("model.*")), default=0.0)
+
+
+def _model_size(model, run_id: str) -> int:
+    """
+    Approximate resident size of a loaded model: the nbytes of its compact
+    artifact arrays, or the on-disk artifact size for joblib-only models.
+    """
+
+    try:
+        _, arrays = model.to_artifact()
+        return int(sum(np.asarray(a).nbytes for a in arrays.values()))
+    except NotImplementedError:
+        model_dir = Path(os.getenv("ARTIFACTS_PATH", "")) / "models" / run_id
+        return int(sum(p.stat().st_size for p in model_dir.glob("model.*")))
+
+
+class ModelCache:
+    """
+    Thread-safe LRU cache of loaded models, bounded by total model size.
+
+    Each entry also memoizes the longest forecast computed so far, so any
+    shorter horizon is a slice rather than another forecast call.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "forecast_hits": 0}
+
+    def get(self, run_id: str):
+        """
+        Returns the model for run_id, loading it on a miss or when the
+        artifact on disk was rewritten since it was cached.
+        """
+        with self.lock:
+            mtime = _artifact_mtime(run_id)
+
+            entry = self.entries.get(run_id)
+            if entry is not None and entry["mtime"] == mtime:
+                self.entries.move_to_end(run_id)
+                self.stats["hits"] += 1
+                return entry["model"]
+
+            self.invalidate(run_id)
+            self.stats["misses"] += 1
+            model = model_loader(run_id)
+            size = _model_size(model, run_id)
+
+            self.entries[run_id] = {
+                "model": model, "size": size, "mtime": mtime, "forecast": None
+            }
+            self.total_bytes += size
+            self._evict()
+
+            return model
+
+    def _evict(self):
+        # always keep the most recent entry, even if it alone exceeds the budget
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            run_id, entry = self.entries.popitem(last=False)
+            self.total_bytes -= entry["size"]
+            self.stats["evictions"] += 1
+            logger.info(f"Evicted model {run_id} from cache ({entry['size']} bytes)")
+
+    def forecast(self, run_id: str, steps: int, exog: pd.DataFrame = None) -> pd.Series:
+        """
+        Forecast of `steps` periods for run_id, served from the memoized
+        longest forecast when it already covers the horizon.
+
+        Args:
+            run_id: run whose saved model forecasts
+            steps: forecast horizon
+            exog: known features of the horizon (see data.features.future_features),
+                used by models that take exogenous features
+        """
+        if steps < 1:
+            raise ValueError("steps must be a positive integer")
+
+        with self.lock:
+            model = self.get(run_id)
+            entry = self.entries[run_id]
+
+            memo = entry["forecast"]
+            if memo is not None and len(memo) >= steps:
+                self.stats["forecast_hits"] += 1
+                return memo.iloc[:steps]
+
+            if exog is not None and model.uses_exog:
+                forecasts = model.predict(steps=steps, exog=exog)
+            else:
+                forecasts = model.predict(steps=steps)
+            entry["forecast"] = forecasts
+            return forecasts
+
+    def invalidate(self, run_id: str) -> None:
+        """
+        Drops run_id from the cache, e.g. after its model was retrained.
+        """
+        with self.lock:
+            entry = self.entries.pop(run_id, None)
+            if entry is not None:
+                self.total_bytes -= entry["size"]
+
+    def info(self) -> dict:
+        with self.lock:
+            return {
+                **self.stats,
+                "models": list(self.entries),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+_model_cache = None
+
+
+def get_model_cache() -> ModelCache:
+    """
+    Process-wide model cache shared by the predictor and the serving API.
+    """
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = ModelCache()
+    return _model_cache
@@ -1,6 +1,99 @@
+import os
 import pandas as pd
-from forecasting_engine.utils import model_loader
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.inference.model_cache import get_model_cache
+from forecasting_engine.instrumentation import instrumented
+from forecasting_engine.data.features import future_features
 
+FREQ_MAP = {
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "ME",
+    "quarterly": "Q",
+    "hourly": "H"
+}
+
+
+def future_dates(last_date, frequency: str, periods: int) -> pd.DatetimeIndex:
+    """
+    Builds the datetime index for a forecast horizon following last_date.
+
+    Args:
+        last_date: last observed timestamp
+        frequency: Time frequency (daily, weekly, etc.)
+        periods: number of future steps
+
+    Returns:
+        dates: DatetimeIndex of length periods, excluding last_date
+    """
+
+    freq = FREQ_MAP.get(frequency)
+    if not freq:
+        raise ValueError(f"Unsupported frequency: {frequency}")
+
+    return pd.date_range(
+        start=last_date,
+        periods=periods + 1,
+        freq=freq
+    )[1:]
+
+@instrumented("full_history")
+def full_history_model(best_model: SARIMAXModel,
+                       y: pd.Series,
+                       exog: pd.DataFrame = None) -> SARIMAXModel:
+    """
+    Extends the best CV fold's model to the full history. SARIMAX models
+    re-filter the history with the fold's parameters held fixed (one Kalman
+    pass) instead of refitting by maximum likelihood; the cheaper models
+    are refitted on the full history with the same spec.
+
+    Args:
+        best_model: fitted model selected by model_trainer
+        y: full demand history with a 0-based RangeIndex
+        exog: exogenous features aligned with y, for models that use them
+
+    Returns:
+        model: model whose state sits at the end of y
+    """
+
+    if not isinstance(best_model, SARIMAXModel):
+        model = type(best_model)(**best_model.get_params())
+        if exog is not None and model.uses_exog:
+            return model.fit(y, exog=exog)
+        return model.fit(y)
+
+    return SARIMAXModel(
+        order=best_model.order,
+        seasonal_order=best_model.seasonal_order,
+        fourier=best_model.fourier
+    ).fit(
+        y,
+        start_params=best_model.params.values,
+        filter_only=True
+    )
+
+
+def forecast_full_history(best_model: SARIMAXModel,
+                          y: pd.Series,
+                          steps: int,
+                          exog: pd.DataFrame = None,
+                          future_exog: pd.DataFrame = None) -> pd.Series:
+    """
+    Forecasts `steps` periods past the end of the full history using the
+    best CV fold's parameters (see full_history_model).
+
+    Args:
+        exog: exogenous features aligned with y
+        future_exog: known features of the horizon (see data.features.future_features)
+    """
+
+    model = full_history_model(best_model, y, exog)
+    if future_exog is not None and model.uses_exog:
+        return model.predict(steps=steps, exog=future_exog)
+    return model.predict(steps=steps)
+
+
+@instrumented("forecast_plot")
 def generate_forecast_plot_df(
     plot_df: pd.DataFrame,
     preprocessed_df: pd.DataFrame,
@@ -24,31 +117,16 @@ def generate_forecast_plot_df(
         combined_df: DataFrame containing history + forecast horizon
     """
 
-    model = model_loader()
-    forecasts = model.predict(steps=window_size)
-
     last_date = preprocessed_df.loc[y_test_index, datetime_col].max()
+    dates = future_dates(last_date, frequency, window_size)
 
-    freq_map = {
-        "daily": "D",
-        "weekly": "W",
-        "monthly": "ME",
-        "quarterly": "Q",
-        "hourly": "H"
-    }
-
-    freq = freq_map.get(frequency)
-    if not freq:
-        raise ValueError(f"Unsupported frequency: {frequency}")
-
-    future_dates = pd.date_range(
-        start=last_date,
-        periods=window_size + 1,
-        freq=freq
-    )[1:]
+    # cached model + memoized longest forecast: slider moves are slices
+    forecasts = get_model_cache().forecast(
+        os.getenv("RUN_ID"), window_size, exog=future_features(dates)
+    )
 
     future_df = pd.DataFrame({
-        datetime_col: future_dates,
+        datetime_col: dates,
         "Actual": [None] * len(forecasts),
         "Forecast": forecasts
     })
@@ -0,0 +1,176 @@
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+from collections import deque
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FORECAST_ROUTE = re.compile(r"^/forecast/(?P<run_id>[\w\-.]+)$")
+
+
+class LatencyMetrics:
+    """
+    Per-route request counts, error counts and latency percentiles over a
+    bounded window of recent requests.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.latencies = {}
+        self.counts = {}
+        self.errors = {}
+        self.lock = threading.Lock()
+
+    def record(self, route: str, seconds: float, error: bool = False):
+        with self.lock:
+            self.latencies.setdefault(route, deque(maxlen=self.window)).append(seconds)
+            self.counts[route] = self.counts.get(route, 0) + 1
+            if error:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+    def summary(self) -> dict:
+        with self.lock:
+            summary = {}
+            for route, values in self.latencies.items():
+                ordered = sorted(values)
+                pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+                summary[route] = {
+                    "requests": self.counts[route],
+                    "errors": self.errors.get(route, 0),
+                    "p50_ms": pick(0.50) * 1000,
+                    "p95_ms": pick(0.95) * 1000,
+                    "p99_ms": pick(0.99) * 1000,
+                    "max_ms": ordered[-1] * 1000
+                }
+            return summary
+
+
+def make_handler(cache, metrics: LatencyMetrics, max_horizon: int):
+    """
+    Builds the request handler bound to a model cache and metrics sink.
+
+    Routes:
+        GET /health
+        GET /forecast/<run_id>?horizon=N
+        GET /models
+        GET /metrics
+    """
+
+    class ForecastHandler(BaseHTTPRequestHandler):
+
+        def _send(self, status: int, payload: dict):
+            body = json.dumps(payload, default=float).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _forecast(self, run_id: str, query: dict):
+            try:
+                horizon = int(query.get("horizon", ["1"])[0])
+            except ValueError:
+                return 400, {"error": "horizon must be an integer"}
+
+            if not 1 <= horizon <= max_horizon:
+                return 400, {"error": f"horizon must be between 1 and {max_horizon}"}
+
+            try:
+                forecasts = cache.forecast(run_id, horizon)
+            except FileNotFoundError:
+                return 404, {"error": f"No model found for run_id {run_id}"}
+            except ValueError as e:
+                # e.g. a model that needs the horizon's exogenous features
+                return 400, {"error": str(e)}
+
+            return 200, {
+                "run_id": run_id,
+                "horizon": horizon,
+                "forecast": [float(v) for v in forecasts.values]
+            }
+
+        def do_GET(self):
+            start = time.perf_counter()
+            url = urlparse(self.path)
+            match = FORECAST_ROUTE.match(url.path)
+            route = "/forecast" if match else url.path
+
+            try:
+                if match:
+                    status, payload = self._forecast(match["run_id"], parse_qs(url.query))
+                elif url.path == "/health":
+                    status, payload = 200, {"status": "ok"}
+                elif url.path == "/models":
+                    status, payload = 200, cache.info()
+                elif url.path == "/metrics":
+                    status, payload = 200, {
+                        "latency": metrics.summary(),
+                        "cache": cache.info()
+                    }
+                else:
+                    route = "unmatched"
+                    status, payload = 404, {"error": f"Unknown route: {url.path}"}
+            except Exception as e:
+                status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+            self._send(status, payload)
+            metrics.record(route, time.perf_counter() - start, error=status >= 500)
+
+        def log_message(self, format, *args):
+            # silence the default stderr access log; latency is tracked in /metrics
+            pass
+
+    return ForecastHandler
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="forecasting_engine.inference.server",
+        description="Serve forecasts for saved runs over local HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--artifacts-path", help="artifacts directory (default: $ARTIFACTS_PATH)")
+    parser.add_argument("--cache-mb", type=float, default=256,
+                        help="model cache budget in MB (default: 256)")
+    parser.add_argument("--max-horizon", type=int, default=10000,
+                        help="largest horizon a request may ask for")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    from forecasting_engine.cli import configure_environment
+
+    args = parse_args(argv)
+    configure_environment(artifacts_path=args.artifacts_path)
+
+    # imported after the environment is configured
+    from forecasting_engine.logger import app_logger
+    from forecasting_engine.inference.model_cache import ModelCache
+
+    logger = app_logger(__name__)
+
+    cache = ModelCache(max_bytes=int(args.cache_mb * 1024 * 1024))
+    metrics = LatencyMetrics()
+    server = ThreadingHTTPServer(
+        (args.host, args.port),
+        make_handler(cache, metrics, args.max_horizon)
+    )
+
+    logger.info(f"Serving forecasts on http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import functools
+import threading
+import contextvars
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+from typing import Callable
+from forecasting_engine.logger import app_logger, log_context, current_context
+
+logger = app_logger(__name__)
+
+MEMORY_MODES = ("rss", "tracemalloc", "none")
+
+_MB = 1024 * 1024
+
+# open tracemalloc frames per thread, so nested stages report their own peak
+_frames = threading.local()
+
+# stages open in the current context; the metrics file is rewritten when the
+# outermost one exits, so a stage group costs one write, not one per stage
+_open_stages = contextvars.ContextVar("open_stages", default=0)
+
+# list collecting measurements in a worker (see collect_stages)
+_collector = contextvars.ContextVar("stage_collector", default=None)
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process so far, in MB (None where the
+    resource module is unavailable, e.g. Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+class RunMetrics:
+    """
+    Stage timings of one run, written to $ARTIFACTS_PATH/metrics/<run_id>.json.
+
+    A stage recorded again with the same labels (e.g. after a Streamlit
+    rerun) replaces its previous record, so the file holds the latest timing
+    of every stage.
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def add(self, record: dict) -> None:
+        key = (record["stage"], json.dumps(record.get("labels", {}), sort_keys=True, default=str))
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = record
+
+    def records(self) -> list:
+        with self.lock:
+            return list(self.entries.values())
+
+    def path(self):
+        artifacts_path = os.getenv("ARTIFACTS_PATH")
+        if not artifacts_path:
+            return None
+        return Path(artifacts_path) / "metrics" / f"{self.run_id}.json"
+
+    def save(self):
+        """
+        Rewrites the metrics file; no-op when ARTIFACTS_PATH is not set.
+
+        Writes go through a temp file of their own and happen under the lock,
+        so concurrent saves from one process never interleave.
+        """
+
+        path = self.path()
+        if path is None:
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            payload = {"run_id": self.run_id, "stages": list(self.entries.values())}
+            tmp_file = tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+            )
+            try:
+                with tmp_file as f:
+                    json.dump(payload, f, indent=2, default=str)
+                os.replace(tmp_file.name, path)
+            except BaseException:
+                Path(tmp_file.name).unlink(missing_ok=True)
+                raise
+
+        return path
+
+
+_run_metrics = {}
+_run_metrics_lock = threading.Lock()
+
+
+def get_run_metrics(run_id: str = None) -> RunMetrics:
+    """
+    Metrics collector of a run (default: the current RUN_ID).
+    """
+    run_id = run_id or os.getenv("RUN_ID") or "unknown"
+    with _run_metrics_lock:
+        if run_id not in _run_metrics:
+            _run_metrics[run_id] = RunMetrics(run_id)
+        return _run_metrics[run_id]
+
+
+def save_run_metrics(run_id: str = None):
+    """
+    Rewrites the run's metrics file when `instrumentation.save` is on. A
+    failed write is logged, not raised: metrics must never fail the stage
+    they measure.
+
+    Returns:
+        path: metrics file, or None when not written
+    """
+    settings = _settings()
+    if not (settings["enabled"] and settings["save"]):
+        return None
+
+    try:
+        return get_run_metrics(run_id).save()
+    except OSError as e:
+        logger.warning(f"Run metrics not saved: {e}")
+        return None
+
+
+@contextmanager
+def collect_stages():
+    """
+    Collects the measurements of stage_timer / record_stage in the enclosed
+    block instead of recording them, for work running in pool workers that
+    do not share the parent's run metrics. The parent adds them with
+    record_stage and saves once, as it does for fold timings.
+
+    Yields:
+        records: list filled with the stage measurements
+    """
+    records = []
+    token = _collector.set(records)
+    try:
+        yield records
+    finally:
+        _collector.reset(token)
+
+
+def _settings() -> dict:
+    from forecasting_engine.utils import instrumentation_config
+    return instrumentation_config()
+
+
+def _memory_start(mode: str) -> dict:
+    if mode == "rss":
+        return {"rss": peak_rss_mb()}
+
+    if mode != "tracemalloc":
+        return {}
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    stack = getattr(_frames, "stack", None)
+    if stack is None:
+        stack = _frames.stack = []
+
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        # the parent's peak so far, before the child resets the counter
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+
+    frame = {"base": current, "peak": 0, "started": started}
+    stack.append(frame)
+    return frame
+
+
+def _memory_stop(mode: str, state: dict) -> dict:
+    if mode == "rss":
+        after = peak_rss_mb()
+        if after is None:
+            return {}
+        return {"peak_rss_mb": after, "rss_growth_mb": after - state["rss"]}
+
+    if mode != "tracemalloc":
+        return {}
+
+    _, peak = tracemalloc.get_traced_memory()
+    stack = _frames.stack
+    stack.pop()
+    peak = max(state["peak"], peak)
+
+    if stack:
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    if state["started"]:
+        tracemalloc.stop()
+
+    return {"peak_memory_mb": max(peak - state["base"], 0) / _MB}
+
+
+@contextmanager
+def stage_timer(stage: str, record: bool = True, **labels):
+    """
+    Measures wall time, process CPU time and memory of the enclosed block.
+
+    Memory follows the `instrumentation.memory` setting of config.yaml: the
+    process peak RSS and how much the stage raised it (rss), the peak of
+    traced allocations during the stage (tracemalloc), or nothing (none).
+
+    Args:
+        stage: stage name
+        record: add the measurement to the run's metrics; False only fills
+            the yielded dict (e.g. inside process pool workers). The metrics
+            file is rewritten when the outermost open stage exits
+        labels: extra keys identifying the record, e.g. fold=2; the
+            series of the surrounding log context is added when set
+
+    Yields:
+        stats: dict filled with the measurement when the block exits
+    """
+
+    settings = _settings()
+    stats = {}
+
+    if not settings["enabled"]:
+        with log_context(stage=stage):
+            yield stats
+        return
+
+    series = current_context().get("series")
+    if series is not None:
+        labels.setdefault("series", series)
+
+    mode = settings["memory"]
+    if mode not in MEMORY_MODES:
+        raise ValueError(f"Unsupported instrumentation memory mode: {mode}")
+
+    started_at = datetime.now().isoformat(timespec="milliseconds")
+    memory_state = _memory_start(mode)
+    depth = _open_stages.set(_open_stages.get() + 1)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        with log_context(stage=stage):
+            yield stats
+    finally:
+        _open_stages.reset(depth)
+        stats.update({
+            "stage": stage,
+            "labels": labels,
+            "started_at": started_at,
+            "wall_time": time.perf_counter() - wall_start,
+            "cpu_time": time.process_time() - cpu_start,
+            "memory_mode": mode,
+            **_memory_stop(mode, memory_state)
+        })
+
+        if record:
+            record_stage(stats, save=_open_stages.get() == 0)
+
+
+def record_stage(stats: dict, save: bool = False) -> None:
+    """
+    Adds a stage_timer measurement to the run's metrics and logs it. Used
+    directly for measurements taken in workers (fold timings, collected
+    series stages). Inside collect_stages the measurement is collected
+    instead.
+
+    Args:
+        stats: dict filled by stage_timer; empty when instrumentation is off
+        save: rewrite the metrics file now (see save_run_metrics); callers
+            recording many measurements save once after the last
+    """
+
+    if not stats:
+        return
+
+    collector = _collector.get()
+    if collector is not None:
+        collector.append(stats)
+        return
+
+    metrics = get_run_metrics()
+    metrics.add(stats)
+
+    labels = "".join(f", {k}={v}" for k, v in stats["labels"].items())
+    memory = "".join(
+        f", {k}={stats[k]:.1f}" for k in ("peak_memory_mb", "peak_rss_mb", "rss_growth_mb")
+        if stats.get(k) is not None
+    )
+    logger.info(
+        f"Stage timing | stage={stats['stage']}{labels}, "
+        f"wall={stats['wall_time']:.3f}s, cpu={stats['cpu_time']:.3f}s{memory}"
+    )
+
+    if save:
+        save_run_metrics(metrics.run_id)
+
+
+def instrumented(stage: str) -> Callable:
+    """
+    Decorator form of stage_timer for a whole function.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
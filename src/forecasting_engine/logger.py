@@ -1,52 +1,362 @@
 import os
+import json
+import queue
+import atexit
 import logging
+import threading
+import contextvars
 from datetime import datetime
+from contextlib import contextmanager
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+ROOT_LOGGER = "forecasting_engine"
 
-def app_logger(name: str) -> logging.Logger:
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+# context keys carried on every record and into the JSON log lines
+CONTEXT_KEYS = ("run_id", "stage", "series")
+
+# run log files kept open at once; older runs are closed and reopened on demand
+MAX_OPEN_RUN_FILES = 8
+
+_context = contextvars.ContextVar("log_context", default={})
+
+_setup_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+# multiprocessing queue of records sent by process pool workers, and the
+# thread moving them onto this process's log queue (see worker_log_queue)
+_worker_queue = None
+_forwarder = None
+
+
+def log_settings() -> dict:
     """
-    Creates and returns a logger instance with:
-    - one log file per run
-    - shared RUN_ID across the application
+    Logging settings from the environment, read once when logging starts
+    (config files are not available this early in the import chain).
+
+    - LOG_LEVEL: minimum level (default INFO)
+    - LOG_DIR: directory of the per-run log files (default <project>/logs)
+    - LOG_FORMAT: json | text, format of the run log files (default json)
+    - LOG_MAX_BYTES: size at which a run log file rotates (default 10 MB)
+    - LOG_BACKUP_COUNT: rotated files kept per run (default 5)
+    - LOG_CONSOLE: 0 disables the console handler (default 1)
     """
 
-    # Read RUN_ID from environment (set once by app)
-    run_id = os.getenv("RUN_ID")
-    if not run_id:
-        run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return {
+        "level": os.getenv("LOG_LEVEL", "INFO").upper(),
+        "log_dir": os.getenv("LOG_DIR", os.path.join(PROJECT_ROOT, "logs")),
+        "format": os.getenv("LOG_FORMAT", "json"),
+        "max_bytes": int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024)),
+        "backup_count": int(os.getenv("LOG_BACKUP_COUNT", 5)),
+        "console": os.getenv("LOG_CONSOLE", "1") != "0",
+    }
+
 
-    project_root = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../../")
-    )
+@contextmanager
+def log_context(**fields):
+    """
+    Attaches fields (stage, series, ...) to every record logged inside the
+    block, in this thread or task only.
+    """
 
-    log_dir = os.path.join(project_root, "logs")
-    os.makedirs(log_dir, exist_ok=True)
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
 
-    log_file = os.path.join(log_dir, f"run_{run_id}.log")
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
+def current_context() -> dict:
+    return dict(_context.get())
+
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    Stamps records with the caller's run_id and log context, then hands
+    them to the listener thread. Only the message is merged here; all
+    formatting and I/O happen on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        context = _context.get()
+        record.run_id = context.get("run_id") or os.getenv("RUN_ID") or "unknown"
+        record.stage = context.get("stage")
+        record.series = context.get("series")
+        record.context = {k: v for k, v in context.items() if k not in CONTEXT_KEYS}
+
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line with the run/stage/series keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "run_id": getattr(record, "run_id", None),
+        }
+        for key in ("stage", "series"):
+            value = getattr(record, key, None)
+            if value is not None:
+                payload[key] = value
+        payload.update(getattr(record, "context", None) or {})
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+
+        return json.dumps(payload, default=str)
+
+
+class TextFormatter(logging.Formatter):
+
+    def __init__(self):
+        super().__init__("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        context = [
+            f"{key}={getattr(record, key)}" for key in ("stage", "series")
+            if getattr(record, key, None) is not None
+        ]
+        return f"{line} | {', '.join(context)}" if context else line
+
+
+class RunFileHandler(logging.Handler):
+    """
+    Routes each record to logs/run_<run_id>.log by the record's run_id, so
+    consecutive runs in one process (Streamlit sessions, batch jobs) each get
+    their own file. Files rotate by size.
+    """
+
+    def __init__(self, log_dir: str, formatter: logging.Formatter,
+                 max_bytes: int, backup_count: int):
+        super().__init__()
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.setFormatter(formatter)
+        self.handlers = OrderedDict()
+
+    def _handler(self, run_id: str) -> RotatingFileHandler:
+        handler = self.handlers.get(run_id)
+        if handler is not None:
+            self.handlers.move_to_end(run_id)
+            return handler
+
+        os.makedirs(self.log_dir, exist_ok=True)
+        handler = RotatingFileHandler(
+            os.path.join(self.log_dir, f"run_{run_id}.log"),
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            delay=True
+        )
+        handler.setFormatter(self.formatter)
+        self.handlers[run_id] = handler
+
+        while len(self.handlers) > MAX_OPEN_RUN_FILES:
+            _, oldest = self.handlers.popitem(last=False)
+            oldest.close()
+
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # only the listener thread emits, so no locking beyond Handler's own
+        self._handler(getattr(record, "run_id", None) or "unknown").handle(record)
+
+    def close(self) -> None:
+        for handler in self.handlers.values():
+            handler.close()
+        self.handlers.clear()
+        super().close()
+
+
+def _start_listener(log_queue) -> QueueListener:
+    settings = log_settings()
+
+    handlers = [RunFileHandler(
+        settings["log_dir"],
+        JsonFormatter() if settings["format"] == "json" else TextFormatter(),
+        settings["max_bytes"],
+        settings["backup_count"]
+    )]
+    if settings["console"]:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(TextFormatter())
+        handlers.append(console_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _start_logging() -> QueueHandler:
+    """
+    Builds the shared handler set once per process: callers only enqueue
+    records, and a single listener thread formats them and writes the console
+    and the per-run files.
+    """
+
+    global _queue_handler, _listener
 
-    if logger.handlers:
-        return logger
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
 
-    formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
-    )
+        log_queue = queue.SimpleQueue()
+        _listener = _start_listener(log_queue)
+        atexit.register(stop_logging)
 
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
+        _queue_handler = _ContextQueueHandler(log_queue)
 
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(log_settings()["level"])
+        root.addHandler(_queue_handler)
+        root.propagate = False
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+        return _queue_handler
+
+
+class _ForwardHandler(logging.Handler):
+    """
+    Puts records received from worker processes on this process's log
+    queue. Workers already stamped and prepared them, so they skip
+    _ContextQueueHandler.prepare and keep the worker's run/stage/series.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__()
+        self.log_queue = log_queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.log_queue.put_nowait(record)
+
+
+def worker_log_queue():
+    """
+    Multiprocessing queue for process pool workers (see forward_to_parent).
+    Their records are written by this process's listener, so every run log
+    file has a single writer and rotation never races between processes.
+    """
+
+    global _worker_queue, _forwarder
+
+    queue_handler = _start_logging()
+
+    with _setup_lock:
+        if _worker_queue is None:
+            import multiprocessing
+
+            _worker_queue = multiprocessing.Queue()
+            _forwarder = QueueListener(_worker_queue, _ForwardHandler(queue_handler.queue))
+            _forwarder.start()
+
+        return _worker_queue
+
+
+def forward_to_parent(log_queue) -> None:
+    """
+    Process pool initializer: sends this worker's records to the parent's
+    worker_log_queue instead of writing the run log files itself.
+    """
+
+    global _listener
+
+    queue_handler = _start_logging()
+
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+        queue_handler.queue = log_queue
+
+
+def _restart_after_fork() -> None:
+    """
+    The listener thread does not survive fork, so a forked child starts its
+    own on the inherited queue. Process pool workers then hand their records
+    to the parent instead (see forward_to_parent).
+    """
+
+    global _setup_lock, _listener, _worker_queue, _forwarder
+
+    _setup_lock = threading.Lock()
+    _worker_queue = None
+    _forwarder = None
+    if _listener is None:
+        return
+
+    # records still queued at fork time are the parent's to write
+    log_queue = _queue_handler.queue
+    while not log_queue.empty():
+        log_queue.get_nowait()
+
+    _listener = _start_listener(log_queue)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def stop_logging() -> None:
+    """
+    Flushes queued records and stops the listener thread.
+    """
+
+    global _queue_handler, _listener, _worker_queue, _forwarder
+
+    with _setup_lock:
+        if _forwarder is not None:
+            # workers' records first, while the listener still writes
+            _forwarder.stop()
+            _worker_queue = None
+            _forwarder = None
+
+        if _listener is None:
+            return
+
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+        _listener = None
+
+
+def app_logger(name: str) -> logging.Logger:
+    """
+    Returns a logger writing through the shared, queue-backed handler set:
+    - one log file per RUN_ID, chosen per record
+    - JSON lines carrying run_id / stage / series (see log_context)
+    - size-based rotation and non-blocking writes from the caller's side
+    """
+
+    queue_handler = _start_logging()
+
+    logger = logging.getLogger(name)
 
-    logger.propagate = False
+    # package loggers propagate to the root handler; anything else gets it directly
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + ".") \
+            and queue_handler not in logger.handlers:
+        logger.setLevel(logging.getLogger(ROOT_LOGGER).level)
+        logger.addHandler(queue_handler)
+        logger.propagate = False
 
-    run_id = os.getenv("RUN_ID", "unknown")
-    logger.info(f"Logger initialized | run_id={run_id}")
-    
     return logger
@@ -1,9 +1,12 @@
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 
 
 class BaseTimeSeriesModel(ABC):
+    # models that take exogenous features: fit(y, exog=...) and predict(steps, exog=...)
+    uses_exog = False
+
     @abstractmethod
     def fit(self, y: pd.Series):
         pass
@@ -14,4 +17,47 @@ class BaseTimeSeriesModel(ABC):
 
     @abstractmethod
     def summary(self):
-        pass
\ No newline at end of file
+        pass
+
+    def get_params(self) -> dict:
+        """
+        Constructor arguments that rebuild an unfitted model of the same spec.
+        """
+        raise NotImplementedError
+
+    def update(self, y_new: pd.Series):
+        """
+        Appends observations that follow the training data without refitting.
+        """
+        raise NotImplementedError
+
+    def origin_forecasts(self, y, origins, horizon: int):
+        """
+        Forecasts `horizon` steps from every origin o in `origins` using
+        y[:o], with the fitted params held fixed; shape (len(origins), horizon).
+        """
+        raise NotImplementedError
+
+    def to_artifact(self):
+        """
+        Returns (metadata, arrays) for compact persistence. Models that do not
+        override this are saved with joblib instead.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_artifact(cls, metadata: dict, arrays: dict):
+        raise NotImplementedError
+
+
+def forecast_series(values, nobs: int) -> pd.Series:
+    """
+    Wraps forecast values the way SARIMAXModel.predict returns them: indexed
+    by the positions following the nobs training observations.
+    """
+    values = np.asarray(values, dtype=float)
+    return pd.Series(
+        values,
+        index=pd.RangeIndex(nobs, nobs + len(values)),
+        name="predicted_mean"
+    )
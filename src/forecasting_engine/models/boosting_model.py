@@ -0,0 +1,312 @@
+import time
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+from forecasting_engine.logger import app_logger
+from forecasting_engine.models.base import BaseTimeSeriesModel, forecast_series
+from forecasting_engine.data.features import lag_rolling_features
+
+logger = app_logger(__name__)
+
+BOOSTING_ENGINES = ("xgboost", "sklearn")
+FORECAST_STRATEGIES = ("recursive", "direct")
+
+
+class GradientBoostingModel(BaseTimeSeriesModel):
+    """
+    Gradient-boosted trees on lag, rolling-window and exogenous features
+    (calendar fields, drivers such as Temperature).
+
+    - recursive: one model for the next step, fed its own forecasts
+    - direct: one model per step up to direct_horizon, all from the same
+      origin; longer horizons continue block by block from the forecasts
+    """
+
+    uses_exog = True
+
+    def __init__(self,
+                 lags=(1, 2, 3),
+                 seasonal_lags: int = 1,
+                 rolling_windows=None,
+                 rolling_stats=("mean", "std"),
+                 season_length: int = 1,
+                 exog_season: int = None,
+                 strategy: str = "recursive",
+                 direct_horizon: int = 24,
+                 engine: str = "xgboost",
+                 n_estimators: int = 300,
+                 learning_rate: float = 0.05,
+                 max_depth: int = 6,
+                 random_state: int = 0):
+        """
+        Args:
+            lags: demand lags used as features
+            seasonal_lags: multiples of season_length added as lags (s, 2s, ...)
+            rolling_windows: rolling window lengths (null: [season_length])
+            rolling_stats: statistics per window (mean, std, min, max)
+            season_length: season length in periods
+            exog_season: rows of the last exogenous values repeated over the
+                horizon for columns without future values, e.g. drivers
+                (null: season_length)
+            strategy: recursive | direct
+            direct_horizon: steps with their own model (direct strategy)
+            engine: xgboost | sklearn (HistGradientBoostingRegressor)
+            n_estimators, learning_rate, max_depth, random_state: booster settings
+        """
+        if strategy not in FORECAST_STRATEGIES:
+            raise ValueError(f"Unsupported strategy: {strategy}. Choose one of {FORECAST_STRATEGIES}")
+        if engine not in BOOSTING_ENGINES:
+            raise ValueError(f"Unsupported boosting engine: {engine}. Choose one of {BOOSTING_ENGINES}")
+
+        self.lags = list(lags)
+        self.seasonal_lags = int(seasonal_lags or 0)
+        self.season_length = max(int(season_length or 1), 1)
+        self.rolling_windows = (
+            list(rolling_windows) if rolling_windows is not None
+            else ([self.season_length] if self.season_length > 1 else [])
+        )
+        self.rolling_stats = list(rolling_stats)
+        self.exog_season = int(exog_season or self.season_length)
+        self.strategy = strategy
+        self.direct_horizon = int(direct_horizon)
+        self.engine = engine
+        self.n_estimators = int(n_estimators)
+        self.learning_rate = float(learning_rate)
+        self.max_depth = int(max_depth)
+        self.random_state = random_state
+
+        self.regressors = None
+        self.fitted_lags = None
+        self.fitted_windows = None
+        self.feature_names = None
+        self.exog_columns = None
+        self.history = None
+        self.exog_tail = None
+        self.fit_stats = {}
+        self.nobs = None
+
+    def get_params(self) -> dict:
+        return {
+            "lags": self.lags,
+            "seasonal_lags": self.seasonal_lags,
+            "rolling_windows": self.rolling_windows,
+            "rolling_stats": self.rolling_stats,
+            "season_length": self.season_length,
+            "exog_season": self.exog_season,
+            "strategy": self.strategy,
+            "direct_horizon": self.direct_horizon,
+            "engine": self.engine,
+            "n_estimators": self.n_estimators,
+            "learning_rate": self.learning_rate,
+            "max_depth": self.max_depth,
+            "random_state": self.random_state
+        }
+
+    def _regressor(self):
+        # imported on first fit so importing the model stays cheap
+        if self.engine == "xgboost":
+            from xgboost import XGBRegressor
+
+            return XGBRegressor(
+                n_estimators=self.n_estimators,
+                learning_rate=self.learning_rate,
+                max_depth=self.max_depth,
+                tree_method="hist",
+                random_state=self.random_state
+            )
+
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        return HistGradientBoostingRegressor(
+            max_iter=self.n_estimators,
+            learning_rate=self.learning_rate,
+            max_depth=self.max_depth,
+            random_state=self.random_state
+        )
+
+    def _feature_spec(self, n: int):
+        lags = set(self.lags)
+        if self.season_length > 1:
+            lags.update(self.season_length * k for k in range(1, self.seasonal_lags + 1))
+
+        # leave at least half the series as training rows
+        limit = n // 2
+        fitted_lags = sorted(lag for lag in lags if lag <= limit)
+        fitted_windows = sorted(w for w in set(self.rolling_windows) if w <= limit)
+
+        dropped = sorted(lags - set(fitted_lags)) + sorted(set(self.rolling_windows) - set(fitted_windows))
+        if dropped:
+            logger.warning(f"Boosting: {n} rows are too few for lags/windows {dropped}; fitting without them")
+        if not fitted_lags:
+            raise ValueError(f"Boosting: {n} rows are too few to fit any lag")
+
+        return fitted_lags, fitted_windows
+
+    def _features(self, values) -> np.ndarray:
+        return lag_rolling_features(
+            values, self.fitted_lags, self.fitted_windows, self.rolling_stats
+        )[0]
+
+    def _next_row(self, history) -> np.ndarray:
+        # the row for the step after `history`, built like the training rows
+        return self._features(np.append(history, np.nan))[-1]
+
+    def fit(self, y: pd.Series, exog: pd.DataFrame = None, **fit_options):
+        """
+        Builds the lag/rolling feature matrix in one vectorized pass, joins
+        the exogenous columns and fits the booster(s). Optimizer options
+        (start_params, maxiter, ...) are accepted for interface
+        compatibility and ignored.
+
+        Args:
+            y: training series
+            exog: exogenous features aligned with y (see feature_engineering)
+
+        Returns:
+            self
+        """
+        start = time.perf_counter()
+
+        values = np.asarray(y, dtype=float)
+        n = len(values)
+        self.fitted_lags, self.fitted_windows = self._feature_spec(n)
+        warmup = max(self.fitted_lags + self.fitted_windows)
+
+        base, names = lag_rolling_features(
+            values, self.fitted_lags, self.fitted_windows, self.rolling_stats
+        )
+
+        exog_values = None
+        self.exog_columns = []
+        if exog is not None and exog.shape[1]:
+            exog_values = exog.to_numpy(dtype=float)
+            self.exog_columns = list(exog.columns)
+            if len(exog_values) != n:
+                raise ValueError(f"exog has {len(exog_values)} rows for {n} observations")
+
+        horizons = self.direct_horizon if self.strategy == "direct" else 1
+        if n - warmup - horizons + 1 < 2 * (base.shape[1] + len(self.exog_columns)):
+            raise ValueError(f"Boosting: {n} rows are too few for the feature set")
+
+        # step h regresses values[t + h - 1] on features known at t
+        self.regressors = []
+        for h in range(1, horizons + 1):
+            rows = slice(warmup, n - h + 1)
+            design = base[rows]
+            if exog_values is not None:
+                design = np.hstack([design, exog_values[warmup + h - 1:]])
+            target = values[warmup + h - 1:]
+
+            valid = np.isfinite(target)
+            regressor = self._regressor()
+            regressor.fit(design[valid], target[valid])
+            self.regressors.append(regressor)
+
+        self.feature_names = names + self.exog_columns
+        self.history = values[-warmup:]
+        self.exog_tail = exog_values[-self.exog_season:] if exog_values is not None else None
+        self.nobs = n
+
+        self.fit_stats = {
+            "iterations": None,
+            "converged": True,
+            "warm_start": False,
+            "fit_time": time.perf_counter() - start
+        }
+
+        logger.info(
+            f"Boosting fitted | engine={self.engine}, strategy={self.strategy}, "
+            f"models={len(self.regressors)}, features={len(self.feature_names)}, "
+            f"rows={n - warmup}, fit_time={self.fit_stats['fit_time']:.2f}s"
+        )
+
+        return self
+
+    def _future_exog(self, steps: int, exog: pd.DataFrame = None):
+        if self.exog_tail is None:
+            return None
+
+        if exog is None:
+            raise ValueError(
+                f"Boosting was fitted with exogenous features {self.exog_columns}; "
+                f"pass the horizon's values (see data.features.future_features)"
+            )
+        if len(exog) < steps:
+            raise ValueError(f"exog has {len(exog)} rows for {steps} forecast steps")
+
+        # columns without future values repeat their last exog_season rows
+        future = self.exog_tail[np.arange(steps) % len(self.exog_tail)]
+
+        known = [i for i, c in enumerate(self.exog_columns) if c in exog.columns]
+        missing = [c for c in self.exog_columns if c not in exog.columns]
+        if missing:
+            logger.warning(
+                f"Boosting: no future values for {missing}; repeating their last "
+                f"{len(self.exog_tail)} values over the horizon"
+            )
+        future[:, known] = exog[[self.exog_columns[i] for i in known]].to_numpy(dtype=float)[:steps]
+
+        return future
+
+    def _block_size(self) -> int:
+        # rows whose features are all known before any of them is forecast:
+        # a direct block shares one origin; recursive rows up to the
+        # shortest lag, unless a rolling window needs the step just before
+        if self.strategy == "direct":
+            return len(self.regressors)
+        return 1 if self.fitted_windows else min(self.fitted_lags)
+
+    def predict(self, steps: int, exog: pd.DataFrame = None):
+        """
+        Forecasts `steps` periods. The design matrix of the horizon is
+        allocated once with its exogenous columns; lag and rolling columns
+        are filled block by block from the forecasts themselves, and each
+        block is predicted in one call per regressor.
+
+        Args:
+            steps: forecast horizon
+            exog: known exogenous features of the horizon (see
+                data.features.future_features), required when the model was
+                fitted with exog; training columns it lacks, such as
+                drivers, repeat their last exog_season rows with a warning
+
+        Returns:
+            forecasts: series indexed by the positions after the training data
+        """
+        if self.regressors is None:
+            raise RuntimeError("Model must be fitted before calling predict()")
+
+        future_exog = self._future_exog(steps, exog)
+        warmup = len(self.history)
+        buffer = np.concatenate([self.history, np.full(steps, np.nan)])
+
+        n_base = len(self.feature_names) - len(self.exog_columns)
+        design = np.empty((steps, len(self.feature_names)))
+        if future_exog is not None:
+            design[:, n_base:] = future_exog
+
+        # blocks are a handful of rows: a parallel region per tree (sklearn)
+        # or per call (xgboost) costs more than it saves
+        block = self._block_size()
+        with threadpool_limits(limits=1, user_api="openmp"):
+            for origin in range(0, steps, block):
+                k = min(block, steps - origin)
+                rows = design[origin:origin + k]
+
+                if self.strategy == "direct":
+                    rows[:, :n_base] = self._next_row(buffer[origin:warmup + origin])
+                    for h, regressor in enumerate(self.regressors[:k]):
+                        buffer[warmup + origin + h] = regressor.predict(rows[h:h + 1])[0]
+                else:
+                    rows[:, :n_base] = self._features(buffer[origin:warmup + origin + k])[-k:]
+                    buffer[warmup + origin:warmup + origin + k] = self.regressors[0].predict(rows)
+
+        return forecast_series(buffer[warmup:], self.nobs)
+
+    def summary(self):
+        if self.regressors is None:
+            raise RuntimeError("Model must be fitted before calling summary()")
+        return (
+            f"GradientBoosting(engine={self.engine}, strategy={self.strategy}, "
+            f"models={len(self.regressors)}, features={self.feature_names}, nobs={self.nobs})"
+        )
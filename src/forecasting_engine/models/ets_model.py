@@ -0,0 +1,93 @@
+import time
+import numpy as np
+import pandas as pd
+from forecasting_engine.logger import app_logger
+from forecasting_engine.models.base import BaseTimeSeriesModel, forecast_series
+
+logger = app_logger(__name__)
+
+
+class ExponentialSmoothingModel(BaseTimeSeriesModel):
+    """
+    Additive Holt-Winters exponential smoothing (ETS without the error
+    distribution): level, optional (damped) trend and optional seasonality,
+    smoothing parameters estimated by statsmodels.
+    """
+
+    def __init__(self,
+                 trend: str = "add",
+                 damped_trend: bool = True,
+                 seasonal: str = "add",
+                 season_length: int = 1,
+                 initialization_method: str = "estimated"):
+        self.trend = trend
+        self.damped_trend = bool(damped_trend) and trend is not None
+        self.seasonal = seasonal
+        self.season_length = max(int(season_length or 1), 1)
+        self.initialization_method = initialization_method
+        self.model_fit = None
+        self.fit_stats = {}
+        self.nobs = None
+
+    def get_params(self) -> dict:
+        return {
+            "trend": self.trend,
+            "damped_trend": self.damped_trend,
+            "seasonal": self.seasonal,
+            "season_length": self.season_length,
+            "initialization_method": self.initialization_method
+        }
+
+    def fit(self, y: pd.Series, **fit_options):
+        """
+        Fits the smoothing parameters. Seasonality is dropped when the series
+        holds fewer than two full seasons. Optimizer options (start_params,
+        maxiter, ...) are accepted for interface compatibility and ignored.
+
+        Returns:
+            self
+        """
+        # imported on first fit so importing the model stays cheap
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+        values = np.asarray(y, dtype=float)
+
+        seasonal = self.seasonal if self.season_length > 1 else None
+        if seasonal and len(values) < 2 * self.season_length:
+            logger.warning(
+                f"ETS: {len(values)} rows cover fewer than two seasons of "
+                f"{self.season_length}; fitting without seasonality"
+            )
+            seasonal = None
+
+        start = time.perf_counter()
+
+        self.model_fit = ExponentialSmoothing(
+            values,
+            trend=self.trend,
+            damped_trend=self.damped_trend,
+            seasonal=seasonal,
+            seasonal_periods=self.season_length if seasonal else None,
+            initialization_method=self.initialization_method
+        ).fit(optimized=True)
+        self.nobs = len(values)
+
+        retvals = self.model_fit.mle_retvals
+        self.fit_stats = {
+            "iterations": int(retvals.nit) if hasattr(retvals, "nit") else None,
+            "converged": bool(getattr(retvals, "success", True)),
+            "warm_start": False,
+            "fit_time": time.perf_counter() - start
+        }
+
+        return self
+
+    def predict(self, steps: int):
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling predict()")
+        return forecast_series(self.model_fit.forecast(steps), self.nobs)
+
+    def summary(self):
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling summary()")
+        return self.model_fit.summary()
@@ -0,0 +1,71 @@
+import numpy as np
+from functools import lru_cache
+
+
+def fourier_spec(spec) -> dict:
+    """
+    Normalises the `fourier` model param: {"periods": [...], "K": [...]}
+    with one harmonic count per period (a single K applies to all).
+
+    Args:
+        spec: dict with periods (list or int) and K (list or int)
+
+    Returns:
+        spec: dict of equal-length integer lists, or None when spec is empty
+    """
+
+    if not spec:
+        return None
+
+    periods = spec["periods"]
+    periods = [periods] if np.isscalar(periods) else list(periods)
+    orders = spec.get("K", 1)
+    orders = [orders] * len(periods) if np.isscalar(orders) else list(orders)
+
+    if len(orders) != len(periods):
+        raise ValueError(f"fourier: K {orders} does not match periods {periods}")
+
+    for period, K in zip(periods, orders):
+        # sin(pi * t) vanishes on integer t, so 2K must stay below the period
+        if K < 1 or 2 * K >= period:
+            raise ValueError(
+                f"fourier: K={K} is invalid for period {period}; use 1 <= K < period / 2"
+            )
+
+    return {"periods": [int(p) for p in periods], "K": [int(k) for k in orders]}
+
+
+@lru_cache(maxsize=32)
+def _fourier_table(length: int, periods: tuple, orders: tuple, start: int) -> np.ndarray:
+    t = np.arange(start, start + length)
+    columns = []
+
+    for period, K in zip(periods, orders):
+        # phase from t mod period keeps the angles exact for long series
+        angle = 2 * np.pi * np.outer((t % period) / period, np.arange(1, K + 1))
+        columns += [np.sin(angle), np.cos(angle)]
+
+    table = np.hstack(columns)
+    table.flags.writeable = False
+    return table
+
+
+def fourier_terms(length: int, periods, orders, start: int = 0) -> np.ndarray:
+    """
+    Fourier seasonality regressors sin/cos(2 pi k t / period), k = 1..K, for
+    positions t = start .. start + length - 1: the training span (start 0)
+    or a forecast horizon (start = observations seen). Built in one
+    vectorized pass per period and cached per (length, periods, K, start),
+    so every fold, refit and forecast of the same span reuses one array.
+
+    Args:
+        length: number of rows
+        periods: seasonal periods, e.g. [24, 168]
+        orders: harmonics K per period
+        start: position of the first row
+
+    Returns:
+        terms: read-only array of shape (length, 2 * sum(K))
+    """
+
+    return _fourier_table(int(length), tuple(periods), tuple(orders), int(start))
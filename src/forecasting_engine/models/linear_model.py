@@ -0,0 +1,168 @@
+import time
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from forecasting_engine.logger import app_logger
+from forecasting_engine.models.base import BaseTimeSeriesModel, forecast_series
+
+logger = app_logger(__name__)
+
+
+class LagLinearModel(BaseTimeSeriesModel):
+    """
+    Linear autoregression on selected lags, fitted by ridge-regularised least
+    squares and forecast recursively. The lag matrix is gathered from a
+    strided window view of the series, so fitting is one pass of BLAS.
+    """
+
+    def __init__(self,
+                 lags=3,
+                 seasonal_lags: int = 1,
+                 season_length: int = 1,
+                 ridge: float = 1e-6):
+        """
+        Args:
+            lags: number of recent lags (1..lags) or an explicit list of lags
+            seasonal_lags: multiples of season_length added as lags (s, 2s, ...)
+            season_length: season length in periods; 1 disables seasonal lags
+            ridge: L2 penalty on the lag coefficients (not the intercept)
+        """
+        self.lags = list(range(1, int(lags) + 1)) if np.isscalar(lags) else list(lags)
+        self.seasonal_lags = int(seasonal_lags or 0)
+        self.season_length = max(int(season_length or 1), 1)
+        self.ridge = float(ridge)
+        self.intercept = None
+        self.coef = None
+        self.fitted_lags = None
+        self.history = None
+        self.fit_stats = {}
+        self.nobs = None
+
+    def get_params(self) -> dict:
+        return {
+            "lags": self.lags,
+            "seasonal_lags": self.seasonal_lags,
+            "season_length": self.season_length,
+            "ridge": self.ridge
+        }
+
+    def _lag_list(self, n: int) -> np.ndarray:
+        lags = set(self.lags)
+        if self.season_length > 1:
+            lags.update(self.season_length * k for k in range(1, self.seasonal_lags + 1))
+
+        # keep at least two rows per coefficient
+        usable = sorted(lag for lag in lags if n - lag >= 2 * (len(lags) + 1))
+        if len(usable) < len(lags):
+            logger.warning(
+                f"Linear lags: {n} rows are too few for lags "
+                f"{sorted(lags - set(usable))}; fitting without them"
+            )
+        if not usable:
+            raise ValueError(f"Linear lags: {n} rows are too few to fit any lag")
+
+        return np.array(usable)
+
+    def fit(self, y: pd.Series, **fit_options):
+        """
+        Solves the ridge normal equations for the intercept and lag
+        coefficients. Rows with a missing target or lag are skipped.
+        Optimizer options (start_params, maxiter, ...) are accepted for
+        interface compatibility and ignored.
+
+        Returns:
+            self
+        """
+        start = time.perf_counter()
+
+        values = np.asarray(y, dtype=float)
+        lags = self._lag_list(len(values))
+        max_lag = int(lags.max())
+
+        # row t holds y[t .. t + max_lag]; the last column is the target
+        windows = sliding_window_view(values, max_lag + 1)
+        target = windows[:, max_lag]
+        design = np.column_stack([np.ones(len(target)), windows[:, max_lag - lags]])
+
+        valid = np.isfinite(target) & np.isfinite(design).all(axis=1)
+        design, target = design[valid], target[valid]
+
+        penalty = np.full(design.shape[1], self.ridge)
+        penalty[0] = 0.0
+        coef = np.linalg.solve(
+            design.T @ design + np.diag(penalty),
+            design.T @ target
+        )
+
+        self.intercept, self.coef = float(coef[0]), coef[1:]
+        self.fitted_lags = lags
+        self.history = values[-max_lag:]
+        self.nobs = len(values)
+
+        self.fit_stats = {
+            "iterations": None,
+            "converged": True,
+            "warm_start": False,
+            "fit_time": time.perf_counter() - start
+        }
+
+        return self
+
+    def predict(self, steps: int):
+        if self.coef is None:
+            raise RuntimeError("Model must be fitted before calling predict()")
+
+        max_lag = len(self.history)
+        buffer = np.empty(max_lag + steps)
+        buffer[:max_lag] = self.history
+
+        # recursive: each step feeds the next one's short lags
+        for t in range(max_lag, max_lag + steps):
+            buffer[t] = self.intercept + self.coef @ buffer[t - self.fitted_lags]
+
+        return forecast_series(buffer[max_lag:], self.nobs)
+
+    def to_artifact(self):
+        if self.coef is None:
+            raise RuntimeError("Model must be fitted before calling to_artifact()")
+
+        metadata = {
+            "model": "linear_lags",
+            **self.get_params(),
+            "intercept": self.intercept,
+            "nobs": int(self.nobs),
+            "fit_stats": self.fit_stats
+        }
+
+        arrays = {
+            "coef": np.asarray(self.coef, dtype=float),
+            "fitted_lags": np.asarray(self.fitted_lags, dtype=int),
+            "history": np.asarray(self.history, dtype=float)
+        }
+
+        return metadata, arrays
+
+    @classmethod
+    def from_artifact(cls, metadata: dict, arrays: dict):
+        model = cls(
+            lags=metadata["lags"],
+            seasonal_lags=metadata["seasonal_lags"],
+            season_length=metadata["season_length"],
+            ridge=metadata["ridge"]
+        )
+        model.intercept = metadata["intercept"]
+        model.coef = arrays["coef"]
+        model.fitted_lags = arrays["fitted_lags"]
+        model.history = arrays["history"]
+        model.nobs = metadata["nobs"]
+        model.fit_stats = metadata.get("fit_stats", {})
+        return model
+
+    def summary(self):
+        if self.coef is None:
+            raise RuntimeError("Model must be fitted before calling summary()")
+
+        terms = ", ".join(
+            f"lag{lag}={c:.4f}" for lag, c in zip(self.fitted_lags, self.coef)
+        )
+        return f"LagLinear(intercept={self.intercept:.4f}, {terms}, nobs={self.nobs})"
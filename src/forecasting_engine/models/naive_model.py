@@ -0,0 +1,81 @@
+import time
+import numpy as np
+import pandas as pd
+from forecasting_engine.models.base import BaseTimeSeriesModel, forecast_series
+
+
+class SeasonalNaiveModel(BaseTimeSeriesModel):
+    """
+    Repeats the last observed season: the forecast for step h is the value
+    one season before it. season_length=1 gives the plain naive forecast.
+    """
+
+    def __init__(self, season_length: int = 1):
+        self.season_length = max(int(season_length or 1), 1)
+        self.last_season = None
+        self.fit_stats = {}
+        self.nobs = None
+
+    def get_params(self) -> dict:
+        return {"season_length": self.season_length}
+
+    def fit(self, y: pd.Series, **fit_options):
+        """
+        Stores the last season of y. Optimizer options (start_params,
+        maxiter, ...) are accepted for interface compatibility and ignored.
+
+        Returns:
+            self
+        """
+        start = time.perf_counter()
+
+        values = np.asarray(y, dtype=float)
+        if len(values) == 0:
+            raise ValueError("Cannot fit a seasonal naive model on an empty series")
+
+        # a history shorter than one season repeats what there is
+        self.last_season = values[-self.season_length:]
+        self.nobs = len(values)
+
+        self.fit_stats = {
+            "iterations": None,
+            "converged": True,
+            "warm_start": False,
+            "fit_time": time.perf_counter() - start
+        }
+
+        return self
+
+    def predict(self, steps: int):
+        if self.last_season is None:
+            raise RuntimeError("Model must be fitted before calling predict()")
+
+        return forecast_series(
+            np.resize(self.last_season, steps), self.nobs
+        )
+
+    def to_artifact(self):
+        if self.last_season is None:
+            raise RuntimeError("Model must be fitted before calling to_artifact()")
+
+        metadata = {
+            "model": "seasonal_naive",
+            "season_length": self.season_length,
+            "nobs": int(self.nobs),
+            "fit_stats": self.fit_stats
+        }
+
+        return metadata, {"last_season": np.asarray(self.last_season, dtype=float)}
+
+    @classmethod
+    def from_artifact(cls, metadata: dict, arrays: dict):
+        model = cls(season_length=metadata["season_length"])
+        model.last_season = arrays["last_season"]
+        model.nobs = metadata["nobs"]
+        model.fit_stats = metadata.get("fit_stats", {})
+        return model
+
+    def summary(self):
+        if self.last_season is None:
+            raise RuntimeError("Model must be fitted before calling summary()")
+        return f"SeasonalNaive(season_length={self.season_length}, nobs={self.nobs})"
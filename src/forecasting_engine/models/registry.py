@@ -0,0 +1,34 @@
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.models.naive_model import SeasonalNaiveModel
+from forecasting_engine.models.ets_model import ExponentialSmoothingModel
+from forecasting_engine.models.theta_model import ThetaForecastModel
+from forecasting_engine.models.linear_model import LagLinearModel
+from forecasting_engine.models.boosting_model import GradientBoostingModel
+
+# maps the `model` name stored in compact artifacts / model_params.yaml to its class
+MODEL_REGISTRY = {
+    "sarimax": SARIMAXModel,
+    "seasonal_naive": SeasonalNaiveModel,
+    "ets": ExponentialSmoothingModel,
+    "theta": ThetaForecastModel,
+    "linear_lags": LagLinearModel,
+    "boosting": GradientBoostingModel
+}
+
+
+def get_model_class(name: str):
+    """
+    Looks up a model class by its registry name.
+    """
+    if name not in MODEL_REGISTRY:
+        raise ValueError(
+            f"Unknown model: {name}. Choose one of {list(MODEL_REGISTRY)}"
+        )
+    return MODEL_REGISTRY[name]
+
+
+def build_model(name: str, params: dict):
+    """
+    Unfitted model from its registry name and constructor params.
+    """
+    return get_model_class(name)(**(params or {}))
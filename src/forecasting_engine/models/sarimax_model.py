@@ -1,34 +1,337 @@
+import time
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 from forecasting_engine.models.base import BaseTimeSeriesModel
+from forecasting_engine.models.fourier import fourier_spec, fourier_terms
+
 
 class SARIMAXModel(BaseTimeSeriesModel):
 
-    def __init__(self, order, seasonal_order=None):
-        self.order = order
-        self.seasonal_order = seasonal_order
+    def __init__(self, order, seasonal_order=None, fourier=None):
+        """
+        Args:
+            order: (p, d, q)
+            seasonal_order: (P, D, Q, s)
+            fourier: {"periods": [...], "K": [...]} to model seasonality with
+                Fourier regressors instead of seasonal ARIMA terms, which
+                keeps the state small for long periods (24 and 168 hourly);
+                seasonal_order is then ignored
+        """
+        self.order = tuple(order)
+        self.fourier = fourier_spec(fourier)
+        if self.fourier:
+            seasonal_order = (0, 0, 0, 0)
+        self.seasonal_order = tuple(seasonal_order) if seasonal_order is not None else None
+        self.time_offset = 0
         self.model = None
         self.model_fit = None
+        self.fit_stats = {}
+        self.nobs = None
+        self.observations_since_fit = 0
+        self.update_stats = {}
+        self._compact = False
+
+    def __setstate__(self, state):
+        # joblib artifacts saved before compact artifacts existed lack these
+        state.setdefault("fit_stats", {})
+        state.setdefault("_compact", False)
+        state.setdefault("observations_since_fit", 0)
+        state.setdefault("update_stats", {})
+        state.setdefault("fourier", None)
+        state.setdefault("time_offset", 0)
+        if state.get("nobs") is None and state.get("model_fit") is not None:
+            state["nobs"] = int(state["model_fit"].nobs)
+        self.__dict__.update(state)
+
+    def _exog(self, start: int, length: int):
+        """
+        Fourier regressors for `length` positions from `start` (counted from
+        the first training observation), or None outside Fourier mode.
+        """
+        if not self.fourier or length <= 0:
+            return None
+        return fourier_terms(
+            length, self.fourier["periods"], self.fourier["K"], self.time_offset + start
+        )
 
-    def fit(self, y: pd.Series):
-        self.model = SARIMAX(
-            y,
+    def _build(self, endog, start: int = 0):
+        # imported on first fit/load so importing the model stays cheap
+        from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+        return SARIMAX(
+            endog,
+            exog=self._exog(start, len(endog)),
             order=self.order,
             seasonal_order=self.seasonal_order,
             enforce_stationarity=False,
             enforce_invertibility=False
         )
-        self.model_fit = self.model.fit(disp=False)
+
+    def fit(self,
+            y: pd.Series,
+            start_params=None,
+            method: str = "lbfgs",
+            maxiter: int = 50,
+            filter_only: bool = False,
+            time_offset: int = 0):
+        """
+        Fits the SARIMAX model.
+
+        Args:
+            y: training series
+            start_params: initial parameter vector (e.g. from a previous fold)
+            method: scipy optimizer used for maximum likelihood
+            maxiter: maximum optimizer iterations
+            filter_only: run the Kalman filter with start_params held fixed
+                instead of estimating them
+            time_offset: position of y's first observation in the full
+                series, so the Fourier phases of a CV fold match those of
+                the full-history model reusing its params
+
+        Returns:
+            self
+        """
+        self.time_offset = int(time_offset) if self.fourier else 0
+        self.model = self._build(y)
+        self.nobs = len(y)
+        self.observations_since_fit = 0
+        self._compact = False
+
+        if filter_only and start_params is None:
+            raise ValueError("filter_only requires start_params")
+
+        start = time.perf_counter()
+
+        if filter_only:
+            self.model_fit = self.model.filter(start_params)
+            iterations, converged = 0, True
+        else:
+            self.model_fit = self.model.fit(
+                start_params=start_params,
+                method=method,
+                maxiter=maxiter,
+                disp=False
+            )
+            retvals = self.model_fit.mle_retvals or {}
+            iterations = retvals.get("iterations")
+            iterations = None if iterations is None else int(iterations)
+            converged = bool(retvals.get("converged"))
+
+        self.fit_stats = {
+            "iterations": iterations,
+            "converged": converged,
+            "warm_start": start_params is not None,
+            "fit_time": time.perf_counter() - start
+        }
+
         return self
 
+    def get_params(self) -> dict:
+        return {
+            "order": list(self.order),
+            "seasonal_order": list(self.seasonal_order) if self.seasonal_order else None,
+            "fourier": self.fourier
+        }
+
+    @property
+    def params(self):
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before accessing params")
+        return self.model_fit.params
+
     def predict(self, steps: int):
         if self.model_fit is None:
             raise RuntimeError("Model must be fitted before calling predict()")
-        return self.model_fit.forecast(steps=steps)
 
+        if self._compact:
+            # the compact model's single (missing) observation sits at the
+            # first out-of-sample step, so its in-sample prediction is step 1
+            forecasts = self.model_fit.predict(
+                start=0, end=steps - 1, exog=self._exog(self.nobs + 1, steps - 1)
+            )
+            return pd.Series(
+                np.asarray(forecasts),
+                index=pd.RangeIndex(self.nobs, self.nobs + steps),
+                name="predicted_mean"
+            )
+
+        return self.model_fit.forecast(steps=steps, exog=self._exog(self.nobs, steps))
+
+    def to_artifact(self):
+        """
+        Compact representation for persistence: spec, fitted params and the
+        one-step-ahead state/covariance after the last observation - all that
+        is needed to forecast, independent of series length.
+
+        Returns:
+            tuple: metadata dict (JSON-serialisable), dict of numpy arrays
+        """
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling to_artifact()")
+
+        if self._compact:
+            state, state_cov = self._state, self._state_cov
+        else:
+            state = self.model_fit.predicted_state[:, -1]
+            state_cov = self.model_fit.predicted_state_cov[:, :, -1]
+
+        metadata = {
+            "model": "sarimax",
+            "order": list(self.order),
+            "seasonal_order": list(self.seasonal_order) if self.seasonal_order else None,
+            "fourier": self.fourier,
+            "time_offset": int(self.time_offset),
+            "param_names": list(self.model_fit.model.param_names),
+            "nobs": int(self.nobs),
+            "observations_since_fit": int(self.observations_since_fit),
+            "fit_stats": self.fit_stats
+        }
+
+        arrays = {
+            "params": np.asarray(self.params, dtype=float),
+            "state": np.asarray(state, dtype=float),
+            "state_cov": np.asarray(state_cov, dtype=float)
+        }
+
+        return metadata, arrays
+
+    @classmethod
+    def from_artifact(cls, metadata: dict, arrays: dict):
+        """
+        Rebuilds a forecast-ready model from to_artifact() output without any
+        training data: a one-observation model initialised at the stored state.
+        """
+
+        model = cls(
+            order=tuple(metadata["order"]),
+            seasonal_order=(
+                tuple(metadata["seasonal_order"]) if metadata["seasonal_order"] else None
+            ),
+            fourier=metadata.get("fourier")
+        )
+        model.time_offset = metadata.get("time_offset", 0)
+
+        model.model = model._build(np.array([np.nan]), metadata["nobs"])
+        model.model.initialize_known(arrays["state"], arrays["state_cov"])
+        model._state, model._state_cov = arrays["state"], arrays["state_cov"]
+        model.model_fit = model.model.filter(arrays["params"])
+        model.nobs = metadata["nobs"]
+        model.fit_stats = metadata.get("fit_stats", {})
+        model.observations_since_fit = metadata.get("observations_since_fit", 0)
+        model._compact = True
+
+        return model
+
+    def update(self, y_new: pd.Series):
+        """
+        Appends new observations with the fitted params held fixed. Only the
+        new points are filtered, starting from the stored end-of-sample state,
+        so the cost is O(len(y_new)) regardless of history length.
+
+        Records update_stats with a drift score: the mean squared standardized
+        one-step-ahead error on the new points (about 1 when the model still
+        describes the data, growing as it drifts).
+
+        Args:
+            y_new: observations following the last one the model has seen
+
+        Returns:
+            self, in compact form
+        """
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling update()")
+
+        y_new = np.asarray(y_new, dtype=float)
+        if len(y_new) == 0:
+            return self
+
+        metadata, arrays = self.to_artifact()
+
+        start = time.perf_counter()
+
+        new_model = self._build(y_new, self.nobs)
+        new_model.initialize_known(arrays["state"], arrays["state_cov"])
+        new_fit = new_model.filter(arrays["params"])
+
+        errors = np.asarray(new_fit.standardized_forecasts_error)[0]
+        drift_score = float(np.nanmean(errors ** 2)) if np.isfinite(errors).any() else None
+
+        arrays["state"] = new_fit.predicted_state[:, -1]
+        arrays["state_cov"] = new_fit.predicted_state_cov[:, :, -1]
+        metadata["nobs"] += len(y_new)
+        metadata["observations_since_fit"] += len(y_new)
+
+        updated = type(self).from_artifact(metadata, arrays)
+        self.__dict__.update(updated.__dict__)
+
+        self.update_stats = {
+            "new_observations": len(y_new),
+            "drift_score": drift_score,
+            "observations_since_fit": self.observations_since_fit,
+            "update_time": time.perf_counter() - start
+        }
+
+        return self
+
+    def origin_forecasts(self, y, origins, horizon: int) -> np.ndarray:
+        """
+        Multi-step forecasts from many origins with the fitted params held
+        fixed. One Kalman filter pass over y gives the predicted state at
+        every origin; the state-space recursion then advances all origins
+        together, so the cost is one filter pass plus `horizon` small matrix
+        products instead of a fit per origin.
+
+        In Fourier mode the regression part of the forecast is added from the
+        cached Fourier terms at each origin's horizon.
+
+        Args:
+            y: full series the origins index into, starting at the first
+                training observation
+            origins: positions o; forecasts from o use y[:o] only
+            horizon: steps forecast from each origin
+
+        Returns:
+            forecasts: array of shape (len(origins), horizon)
+        """
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling origin_forecasts()")
+
+        y = np.asarray(y, dtype=float)
+        origins = np.asarray(origins, dtype=int)
+        if len(origins) == 0:
+            return np.empty((0, horizon))
+
+        params = np.asarray(self.params, dtype=float)
+        filtered = self._build(y[:int(origins.max())]).filter(params)
+
+        # time-invariant system matrices, already set to the fitted params
+        ssm = filtered.model.ssm
+        design = np.asarray(ssm["design"])[0]
+        targets = origins[:, None] + np.arange(horizon)
+
+        if self.fourier:
+            # the exog regression is a time-varying observation intercept
+            k_trend, k_exog = filtered.model.k_trend, filtered.model.k_exog
+            beta = params[k_trend:k_trend + k_exog]
+            obs_intercept = self._exog(0, int(targets.max()) + 1)[targets] @ beta
+        else:
+            obs_intercept = np.full(targets.shape, np.asarray(ssm["obs_intercept"]).ravel()[0])
+        transition = np.asarray(ssm["transition"])
+        state_intercept = np.asarray(ssm["state_intercept"]).reshape(-1, 1)
+
+        # predicted_state[:, o] is the state given y[:o]
+        states = np.asarray(filtered.predicted_state)[:, origins]
+
+        forecasts = np.empty((len(origins), horizon))
+        for step in range(horizon):
+            forecasts[:, step] = design @ states + obs_intercept[:, step]
+            states = transition @ states + state_intercept
+
+        return forecasts
 
     def summary(self):
         if self.model_fit is None:
             raise RuntimeError("Model must be fitted before calling summary()")
+        if self._compact:
+            raise RuntimeError("summary() is not available for models loaded from compact artifacts")
         return self.model_fit.summary()
-
@@ -0,0 +1,69 @@
+import time
+import numpy as np
+import pandas as pd
+from forecasting_engine.models.base import BaseTimeSeriesModel, forecast_series
+
+
+class ThetaForecastModel(BaseTimeSeriesModel):
+    """
+    Theta method (Assimakopoulos & Nikolopoulos): simple exponential
+    smoothing plus half the linear trend, on the deseasonalized series.
+    """
+
+    def __init__(self, season_length: int = 1, theta: float = 2.0):
+        self.season_length = max(int(season_length or 1), 1)
+        self.theta = float(theta)
+        self.model_fit = None
+        self.fit_stats = {}
+        self.nobs = None
+
+    def get_params(self) -> dict:
+        return {"season_length": self.season_length, "theta": self.theta}
+
+    def fit(self, y: pd.Series, **fit_options):
+        """
+        Fits the theta model. The series is deseasonalized only when it holds
+        at least two full seasons and the seasonality test accepts it.
+        Optimizer options (start_params, maxiter, ...) are accepted for
+        interface compatibility and ignored.
+
+        Returns:
+            self
+        """
+        # imported on first fit so importing the model stays cheap
+        from statsmodels.tsa.forecasting.theta import ThetaModel
+
+        values = np.asarray(y, dtype=float)
+        deseasonalize = (
+            self.season_length > 1 and len(values) >= 2 * self.season_length
+        )
+
+        start = time.perf_counter()
+
+        self.model_fit = ThetaModel(
+            values,
+            period=self.season_length if deseasonalize else 1,
+            deseasonalize=deseasonalize
+        ).fit()
+        self.nobs = len(values)
+
+        self.fit_stats = {
+            "iterations": None,
+            "converged": True,
+            "warm_start": False,
+            "fit_time": time.perf_counter() - start
+        }
+
+        return self
+
+    def predict(self, steps: int):
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling predict()")
+        return forecast_series(
+            self.model_fit.forecast(steps, theta=self.theta), self.nobs
+        )
+
+    def summary(self):
+        if self.model_fit is None:
+            raise RuntimeError("Model must be fitted before calling summary()")
+        return self.model_fit.summary()
@@ -0,0 +1,200 @@
+import pandas as pd
+from forecasting_engine.logger import app_logger
+from forecasting_engine.reporting import Reporter, get_reporter, set_reporter
+from forecasting_engine.instrumentation import stage_timer, get_run_metrics
+from forecasting_engine.utils import (
+    raw_data_saver, model_saver, forecast_data_saver, ingestion_config
+)
+from forecasting_engine.data.ingestion import data_loader
+from forecasting_engine.data.cleansing import (
+    data_cleanser, check_data_continuity, data_imputer
+)
+from forecasting_engine.data.preprocessing import data_preprocessing
+from forecasting_engine.data.features import feature_engineering, future_features
+from forecasting_engine.training.trainer import model_trainer
+from forecasting_engine.training.racing import uses_exog
+from forecasting_engine.training.evaluator import model_evaluator
+from forecasting_engine.training.backtest import rolling_backtest
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.batch.engine import batch_forecaster
+from forecasting_engine.inference.predictor import future_dates, full_history_model
+
+logger = app_logger(__name__)
+
+
+def ingestion_settings(model_config: dict) -> dict:
+    """
+    The `ingestion` section of config.yaml, with the exogenous drivers added
+    to extra_columns when the configured model uses them, so they survive
+    the column-pruned read.
+    """
+
+    ingestion = ingestion_config()
+    if uses_exog(model_config):
+        exog_columns = (model_config.get("features") or {}).get("exog_columns") or []
+        ingestion = {
+            **ingestion,
+            "extra_columns": [*(ingestion["extra_columns"] or []), *exog_columns]
+        }
+
+    return ingestion
+
+
+def run_pipeline(file,
+                 map_dict: dict,
+                 model_config: dict,
+                 horizon: int,
+                 reporter: Reporter = None) -> dict:
+    """
+    Headless end-to-end run: ingest -> cleanse -> impute -> preprocess ->
+    features (exogenous models only) -> train -> forecast. Does not import Streamlit; progress goes through the
+    given reporter (defaults to the active one, which only logs).
+
+    Args:
+        file: path or binary file object of the input data
+        map_dict: column mapping (datetime_col, demand_col, frequency, series_col)
+        model_config: parsed model_params.yaml
+        horizon: number of future steps to forecast
+        reporter: progress/status sink
+
+    Returns:
+        result: dict with forecast_df plus metrics, quality_report,
+            per-stage timings and, when backtest.enabled, the rolling-origin
+            backtest (single series) or summary_df and stats (multi-series)
+    """
+
+    if reporter is not None:
+        set_reporter(reporter)
+    reporter = get_reporter()
+
+    datetime_col = map_dict['datetime_col']
+    demand_col = map_dict['demand_col']
+
+    reporter.stage("ingestion")
+    raw_df = data_loader(file, map_dict=map_dict, ingestion=ingestion_settings(model_config))
+    if raw_df is None:
+        raise ValueError(f"Could not read input data: {file}")
+    raw_data_saver(raw_df)
+
+    if map_dict.get('series_col'):
+        reporter.stage("batch forecasting")
+        forecast_df, summary_df, stats = batch_forecaster(
+            raw_df=raw_df,
+            map_dict=map_dict,
+            model_config=model_config,
+            horizon=horizon,
+            progress_callback=reporter.progress
+        )
+        reporter.success(
+            f"Batch complete: {stats['succeeded']}/{stats['series']} series, "
+            f"{stats['series_per_second']:.2f} series/s"
+        )
+        return {"forecast_df": forecast_df, "summary_df": summary_df, "stats": stats}
+
+    reporter.stage("cleansing")
+    cleansed_df, quality_report = data_cleanser(
+        raw_df,
+        datetime_col=datetime_col,
+        demand_col=demand_col
+    )
+
+    reporter.stage("imputation")
+    data_continuity = check_data_continuity(
+        cleansed_df=cleansed_df,
+        datetime_col=datetime_col,
+        frequency=map_dict['frequency']
+    )
+    reporter.info(f"Data continuity before imputation: {data_continuity}")
+
+    imputed_df = data_imputer(
+        cleansed_df=cleansed_df,
+        datetime_col=datetime_col,
+        demand_col=demand_col,
+        frequency=map_dict['frequency'],
+        data_continuity=data_continuity,
+        **model_config.get("imputation", {})
+    )
+
+    reporter.stage("preprocessing")
+    preprocessed_df = data_preprocessing(
+        cleansed_df=imputed_df,
+        demand_col=demand_col
+    ).reset_index(drop=True)
+
+    features_df = None
+    if uses_exog(model_config):
+        reporter.stage("features")
+        features_df = feature_engineering(
+            preprocessed_df, datetime_col, model_config.get("features")
+        )
+
+    reporter.stage("training")
+    best_model, y_test, preds, score = model_trainer(
+        preprocessed_df=preprocessed_df,
+        model_config=model_config,
+        map_dict=map_dict,
+        exog=features_df
+    )
+
+    mae, rmse, wmape = model_evaluator(
+        y_true=y_test.values,
+        y_pred=preds.values
+    )
+    reporter.success(f"Training complete | MAE={mae:.2f}, RMSE={rmse:.2f}, WMAPE={wmape:.2f}%")
+
+    backtest = None
+    backtest_enabled = model_config.get("backtest", {}).get("enabled", False)
+    if backtest_enabled and not isinstance(best_model, SARIMAXModel):
+        reporter.warning(
+            f"Backtest skipped: it re-filters SARIMAX models, selected {type(best_model).__name__}"
+        )
+    elif backtest_enabled:
+        reporter.stage("backtesting")
+        # backtest the selected spec, which auto_order may have changed
+        backtest_config = {
+            **model_config,
+            "model": {
+                **model_config["model"],
+                "params": best_model.get_params()
+            }
+        }
+        backtest = rolling_backtest(
+            {demand_col: preprocessed_df[demand_col].to_numpy()}, backtest_config
+        )
+        by_step = backtest["metrics"]["by_step"]
+        reporter.info(
+            f"Backtest over {backtest['stats']['origins']} origins | "
+            f"RMSE step 1={by_step['rmse'][0]:.2f}, "
+            f"step {len(by_step['rmse'])}={by_step['rmse'][-1]:.2f}"
+        )
+
+    reporter.stage("forecasting")
+    dates = future_dates(
+        preprocessed_df[datetime_col].max(), map_dict['frequency'], horizon
+    )
+    with stage_timer("forecasting"):
+        # persist the model at the end of the full history so forecasts and
+        # incremental updates continue from the last observation
+        final_model = full_history_model(
+            best_model, preprocessed_df[demand_col], exog=features_df
+        )
+        model_saver(final_model)
+        if final_model.uses_exog:
+            forecasts = final_model.predict(steps=horizon, exog=future_features(dates))
+        else:
+            forecasts = final_model.predict(steps=horizon)
+
+    forecast_df = pd.DataFrame({
+        datetime_col: dates,
+        "Forecast": forecasts.values
+    })
+    forecast_path = forecast_data_saver(forecast_df)
+    reporter.success(f"Forecast saved to {forecast_path}")
+
+    return {
+        "forecast_df": forecast_df,
+        "metrics": {"mae": mae, "rmse": rmse, "wmape": wmape},
+        "quality_report": quality_report,
+        "timings": get_run_metrics().records(),
+        "backtest": backtest
+    }
@@ -0,0 +1,70 @@
+from forecasting_engine.logger import app_logger
+
+logger = app_logger(__name__)
+
+
+class Reporter:
+    """
+    Pipeline progress/status sink. The default implementation only logs, so
+    pipeline modules can run headless (CLI, cron, process pool workers);
+    front-ends subclass it to surface messages in their own UI.
+    """
+
+    def stage(self, name: str):
+        logger.info(f"Stage started: {name}")
+
+    def info(self, message: str):
+        logger.info(message)
+
+    def success(self, message: str):
+        logger.info(message)
+
+    def warning(self, message: str):
+        logger.warning(message)
+
+    def error(self, message: str):
+        logger.error(message)
+
+    def progress(self, completed: int, total: int):
+        logger.info(f"Progress: {completed}/{total}")
+
+
+class StreamlitReporter(Reporter):
+    """
+    Mirrors pipeline messages into the Streamlit page as well as the logs.
+    Streamlit is imported on construction so headless runs never load it.
+    """
+
+    def __init__(self):
+        import streamlit as st
+        self.st = st
+
+    def success(self, message: str):
+        super().success(message)
+        self.st.success(message)
+
+    def warning(self, message: str):
+        super().warning(message)
+        self.st.warning(message)
+
+    def error(self, message: str):
+        super().error(message)
+        self.st.error(message)
+
+
+_reporter = Reporter()
+
+
+def get_reporter() -> Reporter:
+    """
+    Returns the active reporter used by pipeline modules.
+    """
+    return _reporter
+
+
+def set_reporter(reporter: Reporter) -> None:
+    """
+    Replaces the active reporter (e.g. StreamlitReporter in the app).
+    """
+    global _reporter
+    _reporter = reporter
@@ -0,0 +1,181 @@
+import time
+import numpy as np
+import pandas as pd
+from typing import Callable
+from forecasting_engine.logger import app_logger
+from forecasting_engine.instrumentation import instrumented
+from forecasting_engine.training.executor import parallel_map
+from forecasting_engine.training.evaluator import batch_evaluator, mase_scale
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.training.racing import season_length
+
+logger = app_logger(__name__)
+
+BACKTEST_DEFAULTS = {
+    "origins": 100,
+    "step": 1,
+    "horizon": 12,
+    "refit_every": 0,
+    "min_train": 50
+}
+
+
+def backtest_origins(n: int, config: dict) -> np.ndarray:
+    """
+    Rolling forecast origins for a series of length n: `origins` positions
+    spaced `step` apart, the last one leaving a full horizon of actuals.
+    Origins before `min_train` are -1, so every series yields the same
+    number of slots, aligned on the most recent origin.
+    """
+
+    count, step = config["origins"], config["step"]
+    last = n - config["horizon"]
+
+    origins = last - step * np.arange(count - 1, -1, -1)
+    origins[origins < max(config["min_train"], 1)] = -1
+
+    return origins
+
+
+def backtest_series(y,
+                    model_params: dict,
+                    config: dict,
+                    optimizer: dict = None) -> dict:
+    """
+    Rolling-origin backtest of one series. Parameters are estimated by
+    maximum likelihood at the first origin and then every `refit_every`
+    origins (0: never again), each refit warm-started from the previous
+    params. Between refits every origin reuses the params and is forecast by
+    filtering forward (SARIMAXModel.origin_forecasts).
+
+    Kept at module level so it can be shipped to process pool workers.
+
+    Args:
+        y: series values (NaNs allowed, the Kalman filter skips them)
+        model_params: `model.params` section of model_params.yaml
+        config: backtest settings (see BACKTEST_DEFAULTS)
+        optimizer: keyword arguments forwarded to SARIMAXModel.fit
+
+    Returns:
+        result: dict with origins (O,), actuals and forecasts (O, horizon),
+            MASE scale, fits, elapsed
+    """
+
+    start = time.perf_counter()
+    y = np.asarray(y, dtype=float)
+    horizon = config["horizon"]
+
+    origins = backtest_origins(len(y), config)
+    valid = np.flatnonzero(origins >= 0)
+
+    actuals = np.full((len(origins), horizon), np.nan)
+    forecasts = np.full((len(origins), horizon), np.nan)
+    scale = np.nan
+    fits = 0
+
+    if len(valid):
+        targets = origins[valid, None] + np.arange(horizon)
+        actuals[valid] = y[targets]
+
+        scale = float(mase_scale(y[:origins[valid[0]]], season_length(model_params)))
+
+        refit_every = config["refit_every"] or len(valid)
+        params = None
+
+        for first in range(0, len(valid), refit_every):
+            block = valid[first:first + refit_every]
+
+            model = SARIMAXModel(
+                order=model_params["order"],
+                seasonal_order=model_params["seasonal_order"],
+                fourier=model_params.get("fourier")
+            ).fit(pd.Series(y[:origins[block[0]]]), start_params=params, **(optimizer or {}))
+            params = model.params.values
+            fits += 1
+
+            forecasts[block] = model.origin_forecasts(y, origins[block], horizon)
+
+    return {
+        "origins": origins,
+        "actuals": actuals,
+        "forecasts": forecasts,
+        "scale": scale,
+        "fits": fits,
+        "elapsed": time.perf_counter() - start
+    }
+
+
+@instrumented("backtest")
+def rolling_backtest(series: dict,
+                     model_config: dict,
+                     progress_callback: Callable = None) -> dict:
+    """
+    Rolling-origin backtest of many series, spread across the configured
+    executor, scored in one batch_evaluator call.
+
+    Args:
+        series: series id -> values
+        model_config: parsed model_params.yaml (model, backtest, execution)
+        progress_callback: optional callable(completed, total)
+
+    Returns:
+        result: dict with
+            - series_ids: list of S ids
+            - origins: (S, O) origin positions, -1 where a series is too short
+            - actuals, forecasts, errors: (S, O, horizon), errors = actual - forecast
+            - metrics: batch_evaluator output per series x origin, plus by_step
+            - stats: series, origins, fits, elapsed, origins_per_second
+    """
+
+    config = {**BACKTEST_DEFAULTS, **(model_config.get("backtest") or {})}
+    model_params = model_config["model"]["params"]
+    optimizer = model_config["model"].get("optimizer", {})
+
+    series_ids = list(series)
+    tasks = [(series[sid], model_params, config, optimizer) for sid in series_ids]
+
+    logger.info(
+        f"Backtest started | series={len(tasks)}, origins={config['origins']}, "
+        f"horizon={config['horizon']}, refit_every={config['refit_every']}"
+    )
+
+    start = time.perf_counter()
+    results = parallel_map(
+        backtest_series,
+        tasks,
+        model_config.get("execution", {}),
+        progress_callback
+    )
+    elapsed = time.perf_counter() - start
+
+    origins = np.stack([r["origins"] for r in results])
+    actuals = np.stack([r["actuals"] for r in results])
+    forecasts = np.stack([r["forecasts"] for r in results])
+    scale = np.array([r["scale"] for r in results])
+
+    metrics = batch_evaluator(actuals, forecasts, scale=scale[:, None])
+
+    n_origins = int((origins >= 0).sum())
+    stats = {
+        "series": len(results),
+        "origins": n_origins,
+        "fits": int(sum(r["fits"] for r in results)),
+        "elapsed": elapsed,
+        "origins_per_second": n_origins / elapsed if elapsed > 0 else float("nan")
+    }
+
+    logger.info(
+        f"Backtest complete | series={stats['series']}, origins={n_origins}, "
+        f"fits={stats['fits']}, elapsed={elapsed:.2f}s, "
+        f"throughput={stats['origins_per_second']:.1f} origins/s"
+    )
+
+    return {
+        "series_ids": series_ids,
+        "origins": origins,
+        "actuals": actuals,
+        "forecasts": forecasts,
+        "errors": actuals - forecasts,
+        "metrics": metrics,
+        "stats": stats
+    }
@@ -79,4 +79,135 @@ def model_evaluator(y_true, y_pred):
 
     logger.info(f"Model evaluation complete. Metrics: {eval_dict}")
 
-    return mae_score, rmse_score, wmape_score
\ No newline at end of file
+    return mae_score, rmse_score, wmape_score
+
+def pad_stack(arrays, length: int = None) -> np.ndarray:
+    """
+    Stacks 1-D arrays of possibly different lengths into a 2-D float array,
+    padding the end of shorter rows with NaN (which batch_evaluator masks).
+
+    Args:
+        arrays: sequence of 1-D arrays / Series
+        length: row length (default: the longest array)
+
+    Returns:
+        stacked: array of shape (len(arrays), length)
+    """
+
+    arrays = [np.asarray(a, dtype=float).ravel() for a in arrays]
+    length = length or max((len(a) for a in arrays), default=0)
+
+    stacked = np.full((len(arrays), length), np.nan)
+    for row, values in zip(stacked, arrays):
+        row[:min(len(values), length)] = values[:length]
+
+    return stacked
+
+
+def mase_scale(y_train, season: int = 1) -> np.ndarray:
+    """
+    In-sample MAE of the seasonal naive forecast, the MASE denominator,
+    computed over the last axis and ignoring NaNs.
+
+    Args:
+        y_train: training values, shape (..., n_train)
+        season: seasonal lag m of the naive forecast y[t] = y[t - m]
+
+    Returns:
+        scale: array of shape y_train.shape[:-1]
+    """
+
+    y_train = np.asarray(y_train, dtype=float)
+    diffs = np.abs(y_train[..., season:] - y_train[..., :-season])
+    mask = np.isfinite(diffs)
+    count = mask.sum(axis=-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, np.where(mask, diffs, 0.0).sum(axis=-1) / count, np.nan)
+
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray, axis) -> np.ndarray:
+    count = mask.sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, np.where(mask, values, 0.0).sum(axis=axis) / count, np.nan)
+
+
+def batch_evaluator(y_true, y_pred, scale=None) -> dict:
+    """
+    Computes MAE, RMSE, WMAPE, sMAPE and MASE for many forecasts at once.
+
+    Inputs are arrays whose last axis is the forecast horizon and whose
+    leading axes are anything (series x fold, origins, ...). Pairs where
+    either value is NaN/inf are masked out, so ragged horizons can be
+    NaN-padded (see pad_stack). Everything is a handful of NumPy reductions,
+    with no Python loop over series or folds.
+
+    WMAPE divides by the sum of |y_true|, which equals the sum of y_true for
+    demand data; sMAPE counts a pair where both values are 0 as no error.
+
+    Args:
+        y_true: actuals, shape (..., horizon)
+        y_pred: forecasts, same shape
+        scale: MASE denominators, broadcastable to shape (...), e.g. from
+            mase_scale on the training windows; MASE is NaN without it
+
+    Returns:
+        metrics: dict with
+            - mae, rmse, wmape, smape, mase: arrays of shape (...), one value
+              per forecast over its horizon
+            - by_step: dict of the same metrics, arrays of shape (horizon,),
+              each pooled over all leading axes
+            - count: valid pairs per forecast, shape (...)
+    """
+
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+
+    if y_true.shape != y_pred.shape:
+        raise ValueError("y_true and y_pred must have the same shape")
+
+    if y_true.ndim == 1:
+        y_true, y_pred = y_true[None, :], y_pred[None, :]
+        squeeze = True
+    else:
+        squeeze = False
+
+    mask = np.isfinite(y_true) & np.isfinite(y_pred)
+    error = np.where(mask, y_true - y_pred, 0.0)
+    abs_error = np.abs(error)
+    abs_true = np.where(mask, np.abs(y_true), 0.0)
+    abs_pred = np.where(mask, np.abs(y_pred), 0.0)
+
+    denominator = abs_true + abs_pred
+    with np.errstate(invalid="ignore", divide="ignore"):
+        smape_terms = np.where(denominator > 0, 2 * abs_error / denominator, 0.0)
+
+    if scale is None:
+        scaled_error = np.full_like(abs_error, np.nan)
+    else:
+        scale = np.broadcast_to(np.asarray(scale, dtype=float), y_true.shape[:-1])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scaled_error = np.where(scale[..., None] > 0, abs_error / scale[..., None], np.nan)
+
+    def _metrics(axis):
+        count = mask.sum(axis=axis)
+        total_true = abs_true.sum(axis=axis)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wmape_score = np.where(total_true > 0, abs_error.sum(axis=axis) / total_true * 100, np.nan)
+        return {
+            "mae": _masked_mean(abs_error, mask, axis),
+            "rmse": np.sqrt(_masked_mean(error ** 2, mask, axis)),
+            "wmape": wmape_score,
+            "smape": _masked_mean(smape_terms, mask, axis) * 100,
+            "mase": _masked_mean(scaled_error, mask, axis),
+            "count": count
+        }
+
+    metrics = _metrics(axis=-1)
+    by_step = _metrics(axis=tuple(range(y_true.ndim - 1)))
+
+    if squeeze:
+        metrics = {k: v[0] for k, v in metrics.items()}
+
+    metrics["by_step"] = by_step
+    return metrics
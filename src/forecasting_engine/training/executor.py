@@ -0,0 +1,114 @@
+import os
+from typing import Callable, Iterable, List
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from threadpoolctl import threadpool_limits
+from forecasting_engine.logger import app_logger, worker_log_queue, forward_to_parent
+
+logger = app_logger(__name__)
+
+EXECUTION_BACKENDS = ("serial", "threads", "processes")
+
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS"
+)
+
+
+def _init_worker(blas_threads: int, log_queue) -> None:
+    """
+    Process pool initializer: caps BLAS/OpenMP threads inside a worker so
+    that n workers do not each spin up one thread per core, and sends the
+    worker's log records to the parent, the only writer of the run log.
+    """
+
+    forward_to_parent(log_queue)
+
+    for var in BLAS_ENV_VARS:
+        os.environ[var] = str(blas_threads)
+
+    # env vars only affect libraries loaded later; numpy is already loaded
+    threadpool_limits(limits=blas_threads)
+
+
+def _resolve_workers(max_workers, n_tasks: int) -> int:
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(int(max_workers), n_tasks))
+
+
+def _collect(futures: list, progress_callback: Callable = None) -> List:
+    """
+    Waits for futures, reporting progress as they finish, and returns their
+    results in submission order.
+    """
+
+    if progress_callback is not None:
+        for completed, _ in enumerate(as_completed(futures), start=1):
+            progress_callback(completed, len(futures))
+
+    return [future.result() for future in futures]
+
+
+def parallel_map(func: Callable,
+                 tasks: Iterable[tuple],
+                 execution_config: dict = None,
+                 progress_callback: Callable = None) -> List:
+    """
+    Applies func to every argument tuple in tasks using the configured
+    executor and returns the results in task order.
+
+    Args:
+        func: module-level callable (must be picklable for the process backend)
+        tasks: iterable of positional-argument tuples
+        execution_config: `execution` section of model_params.yaml with keys
+            backend (serial / threads / processes), max_workers, blas_threads
+        progress_callback: optional callable(completed, total), called from
+            the calling thread as tasks finish
+
+    Returns:
+        results: list of func outputs, same order as tasks
+    """
+
+    execution_config = execution_config or {}
+    backend = execution_config.get("backend", "serial")
+    blas_threads = execution_config.get("blas_threads", 1)
+
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(
+            f"Unsupported execution backend: {backend}. "
+            f"Choose one of {EXECUTION_BACKENDS}"
+        )
+
+    tasks = list(tasks)
+    n_workers = _resolve_workers(execution_config.get("max_workers"), len(tasks))
+
+    if backend == "serial" or n_workers == 1 or len(tasks) <= 1:
+        results = []
+        for completed, task in enumerate(tasks, start=1):
+            results.append(func(*task))
+            if progress_callback is not None:
+                progress_callback(completed, len(tasks))
+        return results
+
+    logger.info(
+        f"Running {len(tasks)} tasks | backend={backend}, "
+        f"workers={n_workers}, blas_threads={blas_threads}"
+    )
+
+    if backend == "threads":
+        # BLAS pools are process-wide, so cap them once for all threads
+        with threadpool_limits(limits=blas_threads):
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = [executor.submit(func, *task) for task in tasks]
+                return _collect(futures, progress_callback)
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(blas_threads, worker_log_queue())
+    ) as executor:
+        futures = [executor.submit(func, *task) for task in tasks]
+        return _collect(futures, progress_callback)
@@ -0,0 +1,72 @@
+import pandas as pd
+from forecasting_engine.logger import app_logger
+from forecasting_engine.training.evaluator import rmse
+from forecasting_engine.instrumentation import stage_timer
+from forecasting_engine.models.registry import build_model
+from forecasting_engine.data.features import known_future_columns
+
+logger = app_logger(__name__)
+
+
+def fit_fold(fold: int,
+             y_train: pd.Series,
+             y_test: pd.Series,
+             model_params: dict,
+             fit_options: dict = None,
+             start_params=None,
+             model_name: str = "sarimax",
+             exog: pd.DataFrame = None):
+    """
+    Fits one CV fold and scores it on the held-out window.
+
+    Kept at module level so it can be shipped to process pool workers.
+
+    Args:
+        fold: fold number (1-based)
+        y_train: training window, indexed by position in the full series
+            (see model_trainer); its first position is the fit's time offset
+        y_test: held-out window
+        model_params: constructor params of the model (`model.params` for SARIMAX)
+        fit_options: keyword arguments forwarded to the model's fit
+        start_params: warm-start parameters from another fold
+        model_name: registry name of the model (see models.registry)
+        exog: exogenous features of the whole series (see feature_engineering),
+            sliced to the fold by index for models that use them; the
+            held-out window only gets the columns known at forecast time,
+            so folds score the forecast as production runs it
+
+    Returns:
+        tuple: fold number, trained model, predictions, RMSE; the fold's
+            stage timing is left in the model's fit_stats["timing"] for the
+            parent process to record
+    """
+
+    # not recorded here: workers do not share the parent's run metrics
+    with stage_timer("fold", record=False, fold=fold, model=model_name) as timing:
+        model = build_model(model_name, model_params)
+        use_exog = exog is not None and model.uses_exog
+
+        trained_model = model.fit(
+            y_train,
+            start_params=start_params,
+            time_offset=int(y_train.index[0]),
+            **({"exog": exog.loc[y_train.index]} if use_exog else {}),
+            **(fit_options or {})
+        )
+        preds = trained_model.predict(
+            steps=len(y_test),
+            **({"exog": exog.loc[y_test.index, known_future_columns(exog.columns)]} if use_exog else {})
+        )
+
+        score = rmse(y_test.values, preds.values)
+
+    stats = trained_model.fit_stats
+    stats["timing"] = timing
+    logger.info(
+        f"Fold {fold} fitted | model={model_name}, rows={len(y_train)}, "
+        f"warm_start={stats['warm_start']}, iterations={stats['iterations']}, "
+        f"converged={stats['converged']}, fit_time={stats['fit_time']:.2f}s, "
+        f"rmse={score:.4f}"
+    )
+
+    return fold, trained_model, preds, score
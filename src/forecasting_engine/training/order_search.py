@@ -0,0 +1,250 @@
+import math
+import time
+import itertools
+import numpy as np
+import pandas as pd
+from forecasting_engine.logger import app_logger
+from forecasting_engine.training.folds import fit_fold
+from forecasting_engine.training.executor import parallel_map
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+
+logger = app_logger(__name__)
+
+CRITERIA = ("aic", "bic")
+
+
+def candidate_orders(search_space: dict, fourier: dict = None) -> list:
+    """
+    Expands the (p,d,q)(P,D,Q,s) search space into candidate model params.
+
+    With Fourier seasonality the Fourier terms model the seasons, so the
+    seasonal P/D/Q/s grid is ignored and every candidate carries `fourier`.
+
+    Args:
+        search_space: `model.auto_order` section with lists under
+            p, d, q, P, D, Q and s
+        fourier: `model.params.fourier`, if set
+
+    Returns:
+        candidates: list of {"order": [...], "seasonal_order": [...]} dicts,
+            plus "fourier" when set
+    """
+
+    if fourier:
+        seasonal_grid = [(0, 0, 0, 0)]
+    else:
+        seasonal_grid = itertools.product(
+            search_space.get("P", [0, 1]),
+            search_space.get("D", [0, 1]),
+            search_space.get("Q", [0, 1]),
+            search_space.get("s", [12])
+        )
+
+    grid = itertools.product(
+        search_space.get("p", [0, 1, 2]),
+        search_space.get("d", [0, 1]),
+        search_space.get("q", [0, 1, 2]),
+        list(seasonal_grid)
+    )
+
+    candidates = []
+    for p, d, q, (P, D, Q, s) in grid:
+        # a seasonal period without any seasonal terms is the same model as s=0
+        if P == D == Q == 0:
+            s = 0
+        candidate = {"order": [p, d, q], "seasonal_order": [P, D, Q, s]}
+        if fourier:
+            candidate["fourier"] = fourier
+        if candidate not in candidates:
+            candidates.append(candidate)
+
+    return candidates
+
+
+def _candidate_label(candidate: dict) -> str:
+    label = f"{tuple(candidate['order'])}{tuple(candidate['seasonal_order'])}"
+    return f"{label}+fourier" if candidate.get("fourier") else label
+
+
+def score_information_criterion(candidate: dict,
+                                y_train: pd.Series,
+                                criterion: str,
+                                maxiter: int):
+    """
+    Cheap first-pass fit of one candidate, scored by AIC or BIC.
+
+    Failed fits score +inf instead of raising, so one bad candidate cannot
+    abort the search.
+
+    Returns:
+        tuple: information criterion value, fit time in seconds
+    """
+
+    start = time.perf_counter()
+
+    try:
+        model = SARIMAXModel(
+            order=tuple(candidate["order"]),
+            seasonal_order=tuple(candidate["seasonal_order"]),
+            fourier=candidate.get("fourier")
+        ).fit(y_train, maxiter=maxiter)
+        value = float(getattr(model.model_fit, criterion))
+    except Exception as e:
+        logger.warning(f"Order search fit failed for {_candidate_label(candidate)}: {e}")
+        value = float("inf")
+
+    if not np.isfinite(value):
+        value = float("inf")
+
+    return value, time.perf_counter() - start
+
+
+def score_fold(fold: int,
+               y_train: pd.Series,
+               y_test: pd.Series,
+               candidate: dict,
+               fit_options: dict):
+    """
+    Runs one candidate through one CV fold; failed fits score +inf.
+
+    Returns:
+        tuple: fit_fold result (or None on failure), fit time in seconds
+    """
+
+    start = time.perf_counter()
+
+    try:
+        result = fit_fold(fold, y_train, y_test, candidate, fit_options)
+    except Exception as e:
+        logger.warning(
+            f"Order search fold {fold} failed for {_candidate_label(candidate)}: {e}"
+        )
+        result = None
+
+    return result, time.perf_counter() - start
+
+
+def search_orders(tasks: list,
+                  search_config: dict,
+                  optimizer: dict,
+                  execution_config: dict,
+                  fourier: dict = None):
+    """
+    Automatic SARIMAX order selection.
+
+    1. Every candidate in the search space is fitted in parallel on the first
+       fold's training window with a small optimizer budget and ranked by
+       AIC/BIC; only the best `survivors` move on.
+    2. Survivors go through the CV folds one fold at a time (successive
+       halving): after each fold the worst candidates by mean RMSE are
+       dropped, keeping 1/halving_factor of them, until one remains.
+
+    Args:
+        tasks: fold tasks as built by model_trainer, (fold, y_train, y_test, params)
+        search_config: `model.auto_order` section of model_params.yaml
+        optimizer: `model.optimizer` section, used for the fold fits
+        execution_config: `execution` section, used for parallel fits
+        fourier: `model.params.fourier`; when set, only (p,d,q) is searched
+            and every candidate keeps the Fourier terms
+
+    Returns:
+        tuple: winning model params, the winner's fold results,
+            per-candidate report (criterion, folds evaluated, mean RMSE, time)
+    """
+
+    criterion = search_config.get("criterion", "aic")
+    if criterion not in CRITERIA:
+        raise ValueError(f"Unsupported criterion: {criterion}. Choose one of {CRITERIA}")
+
+    n_survivors = search_config.get("survivors", 4)
+    halving_factor = search_config.get("halving_factor", 2)
+    first_pass_maxiter = search_config.get("first_pass_maxiter", 20)
+
+    candidates = candidate_orders(search_config, fourier)
+    if fourier:
+        logger.info("Order search with Fourier seasonality: the seasonal P/D/Q/s grid is ignored")
+    report = {
+        _candidate_label(c): {
+            "candidate": c,
+            criterion: None,
+            "folds_evaluated": 0,
+            "fold_scores": [],
+            "time": 0.0
+        }
+        for c in candidates
+    }
+
+    # --- pass 1: information criterion on the smallest training window ---
+    y_first_train = tasks[0][1]
+    ic_results = parallel_map(
+        score_information_criterion,
+        [(c, y_first_train, criterion, first_pass_maxiter) for c in candidates],
+        execution_config
+    )
+
+    for candidate, (value, elapsed) in zip(candidates, ic_results):
+        entry = report[_candidate_label(candidate)]
+        entry[criterion] = value
+        entry["time"] += elapsed
+
+    ranked = sorted(
+        (c for c, (value, _) in zip(candidates, ic_results) if np.isfinite(value)),
+        key=lambda c: report[_candidate_label(c)][criterion]
+    )
+    if not ranked:
+        raise RuntimeError("Order search failed: no candidate could be fitted")
+
+    survivors = ranked[:n_survivors]
+    logger.info(
+        f"Order search first pass | candidates={len(candidates)}, "
+        f"criterion={criterion}, survivors={[_candidate_label(c) for c in survivors]}"
+    )
+
+    # --- pass 2: successive halving over the CV folds ---
+    fold_results = {_candidate_label(c): [] for c in survivors}
+
+    for fold, y_train, y_test, _ in tasks:
+        round_results = parallel_map(
+            score_fold,
+            [(fold, y_train, y_test, c, optimizer) for c in survivors],
+            execution_config
+        )
+
+        for candidate, (result, elapsed) in zip(survivors, round_results):
+            label = _candidate_label(candidate)
+            entry = report[label]
+            entry["time"] += elapsed
+            entry["folds_evaluated"] += 1
+            entry["fold_scores"].append(result[3] if result else float("inf"))
+            fold_results[label].append(result)
+
+        survivors = sorted(
+            survivors,
+            key=lambda c: np.mean(report[_candidate_label(c)]["fold_scores"])
+        )
+
+        is_last_fold = fold == tasks[-1][0]
+        if not is_last_fold:
+            keep = max(1, math.ceil(len(survivors) / halving_factor))
+            survivors = survivors[:keep]
+
+    winner = survivors[0]
+    winner_label = _candidate_label(winner)
+    winner_results = fold_results[winner_label]
+
+    if any(result is None for result in winner_results):
+        raise RuntimeError("Order search failed: no candidate fitted on every fold")
+
+    for label, entry in report.items():
+        entry["mean_rmse"] = (
+            float(np.mean(entry["fold_scores"])) if entry["fold_scores"] else None
+        )
+        logger.info(
+            f"Order search candidate {label} | {criterion}={entry[criterion]}, "
+            f"folds_evaluated={entry['folds_evaluated']}, "
+            f"mean_rmse={entry['mean_rmse']}, time={entry['time']:.2f}s"
+        )
+
+    logger.info(f"Order search selected {winner_label}")
+
+    return winner, winner_results, list(report.values())
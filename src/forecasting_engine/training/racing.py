@@ -0,0 +1,207 @@
+import time
+import numpy as np
+import pandas as pd
+from forecasting_engine.logger import app_logger
+from forecasting_engine.training.folds import fit_fold
+from forecasting_engine.training.executor import parallel_map
+from forecasting_engine.models.registry import get_model_class
+
+logger = app_logger(__name__)
+
+# cheapest first, so ties on accuracy and latency keep the simpler model
+RACE_CANDIDATES = ["seasonal_naive", "linear_lags", "theta", "ets", "boosting", "sarimax"]
+
+# models whose params carry a season length that defaults to the SARIMAX period
+SEASONAL_MODELS = ("seasonal_naive", "ets", "theta", "linear_lags", "boosting")
+
+
+def season_length(sarimax_params: dict) -> int:
+    """
+    Season length of the data from the SARIMAX params: the seasonal_order
+    period, else the shortest Fourier period, else 1.
+    """
+
+    seasonal_order = sarimax_params.get("seasonal_order")
+    if seasonal_order and len(seasonal_order) > 3 and seasonal_order[3]:
+        return int(seasonal_order[3])
+
+    fourier = sarimax_params.get("fourier")
+    if fourier and fourier.get("periods"):
+        periods = fourier["periods"]
+        return int(min(periods) if isinstance(periods, (list, tuple)) else periods)
+
+    return 1
+
+
+def candidate_params(model_config: dict, name: str) -> dict:
+    """
+    Constructor params of a registered model: `model.params` for SARIMAX,
+    the `model.<name>` section for the others, with a missing season_length
+    taken from the SARIMAX seasonal period (see season_length).
+
+    Args:
+        model_config: parsed model_params.yaml
+        name: registry name of the model
+
+    Returns:
+        params: dict of constructor keyword arguments
+    """
+
+    if name == "sarimax":
+        return dict(model_config["model"]["params"])
+
+    params = dict(model_config["model"].get(name) or {})
+    if name in SEASONAL_MODELS and not params.get("season_length"):
+        params["season_length"] = season_length(model_config["model"]["params"])
+
+    return params
+
+
+def uses_exog(model_config: dict) -> bool:
+    """
+    Whether the configured model, or any race candidate, takes exogenous
+    features, i.e. whether feature_engineering has to run before training.
+    """
+
+    name = model_config["model"].get("name", "sarimax")
+    if name == "race":
+        names = (model_config["model"].get("race") or {}).get("candidates") or RACE_CANDIDATES
+    else:
+        names = [name]
+
+    return any(get_model_class(n).uses_exog for n in names)
+
+
+def race_fold(fold: int,
+              y_train: pd.Series,
+              y_test: pd.Series,
+              name: str,
+              params: dict,
+              fit_options: dict,
+              exog: pd.DataFrame = None):
+    """
+    Runs one model through one CV fold; failed fits score +inf.
+
+    Returns:
+        tuple: fit_fold result (or None on failure), fit time in seconds
+    """
+
+    start = time.perf_counter()
+
+    try:
+        result = fit_fold(fold, y_train, y_test, params, fit_options, None, name, exog)
+    except Exception as e:
+        logger.warning(f"Model race fold {fold} failed for {name}: {e}")
+        result = None
+
+    return result, time.perf_counter() - start
+
+
+def race_models(tasks: list,
+                model_config: dict,
+                execution_config: dict,
+                exog: pd.DataFrame = None):
+    """
+    Model selection by racing the registered models on the CV folds.
+
+    1. Every surviving candidate is fitted on one fold at a time, in
+       parallel. After each fold but the last, candidates whose mean RMSE so
+       far exceeds the leader's by more than `drop_ratio` are dropped, so
+       clearly losing (and usually slow) models stop consuming fits early.
+    2. Among the candidates that completed every fold, the fastest one
+       whose mean RMSE is within `tolerance` of the best is selected.
+
+    SARIMAX folds start cold here; warm starts apply to single-model runs.
+
+    Args:
+        tasks: fold tasks as built by model_trainer, (fold, y_train, y_test, params)
+        model_config: parsed model_params.yaml; `model.race` holds candidates,
+            drop_ratio and tolerance
+        execution_config: `execution` section, used for parallel fits
+        exog: exogenous features for the models that use them
+
+    Returns:
+        tuple: winning model name, its params, its fold results,
+            per-candidate report (folds evaluated, mean RMSE, mean fit time)
+    """
+
+    race_config = model_config["model"].get("race") or {}
+    candidates = race_config.get("candidates") or RACE_CANDIDATES
+    drop_ratio = race_config.get("drop_ratio", 1.25)
+    tolerance = race_config.get("tolerance", 0.02)
+    optimizer = model_config["model"].get("optimizer", {})
+
+    params = {name: candidate_params(model_config, name) for name in candidates}
+    report = {
+        name: {
+            "model": name,
+            "params": params[name],
+            "folds_evaluated": 0,
+            "fold_scores": [],
+            "fit_time": 0.0,
+            "dropped_after_fold": None
+        }
+        for name in candidates
+    }
+    fold_results = {name: [] for name in candidates}
+    survivors = list(candidates)
+
+    for fold, y_train, y_test, _ in tasks:
+        round_results = parallel_map(
+            race_fold,
+            [(fold, y_train, y_test, name, params[name], optimizer, exog) for name in survivors],
+            execution_config
+        )
+
+        for name, (result, elapsed) in zip(survivors, round_results):
+            entry = report[name]
+            entry["fit_time"] += elapsed
+            entry["folds_evaluated"] += 1
+            entry["fold_scores"].append(result[3] if result else float("inf"))
+            fold_results[name].append(result)
+
+        if fold == tasks[-1][0]:
+            break
+
+        mean_scores = {name: np.mean(report[name]["fold_scores"]) for name in survivors}
+        leader = min(mean_scores.values())
+        if not np.isfinite(leader):
+            raise RuntimeError(f"Model race failed: no candidate could be fitted on fold {fold}")
+
+        dropped = [name for name in survivors if mean_scores[name] > leader * drop_ratio]
+        for name in dropped:
+            report[name]["dropped_after_fold"] = fold
+        survivors = [name for name in survivors if name not in dropped]
+
+        logger.info(
+            f"Model race fold {fold} | leader_rmse={leader:.4f}, "
+            f"dropped={dropped}, survivors={survivors}"
+        )
+
+    for entry in report.values():
+        entry["mean_rmse"] = float(np.mean(entry["fold_scores"]))
+        entry["mean_fit_time"] = entry["fit_time"] / max(entry["folds_evaluated"], 1)
+
+    finished = [name for name in survivors if np.isfinite(report[name]["mean_rmse"])]
+    if not finished:
+        raise RuntimeError("Model race failed: no candidate fitted on every fold")
+
+    # accuracy first; within the tolerance band the fastest model wins
+    best_rmse = min(report[name]["mean_rmse"] for name in finished)
+    eligible = [name for name in finished if report[name]["mean_rmse"] <= best_rmse * (1 + tolerance)]
+    winner = min(eligible, key=lambda name: report[name]["mean_fit_time"])
+
+    for name, entry in report.items():
+        logger.info(
+            f"Model race candidate {name} | folds_evaluated={entry['folds_evaluated']}, "
+            f"mean_rmse={entry['mean_rmse']:.4f}, "
+            f"mean_fit_time={entry['mean_fit_time']:.3f}s, "
+            f"dropped_after_fold={entry['dropped_after_fold']}"
+        )
+
+    logger.info(
+        f"Model race selected {winner} | mean_rmse={report[winner]['mean_rmse']:.4f}, "
+        f"best_rmse={best_rmse:.4f}, tolerance={tolerance}"
+    )
+
+    return winner, params[winner], fold_results[winner], list(report.values())
@@ -1,19 +1,67 @@
+import numpy as np
 import pandas as pd
 from forecasting_engine.logger import app_logger
-from sklearn.model_selection import TimeSeriesSplit
 
 logger = app_logger(__name__)
 
+SPLIT_WINDOWS = ("expanding", "sliding")
+
+
 def time_series_split(
     y: pd.Series,
-    n_splits: int
+    n_splits: int,
+    test_size: int = None,
+    gap: int = 0,
+    max_train_size: int = None,
+    window: str = "expanding"
 ):
     """
     Generator yielding train/test indices for time series CV.
+
+    The last n_splits * test_size rows are cut into consecutive test windows
+    (as in sklearn's TimeSeriesSplit). Each fold trains on the rows before
+    its test window minus `gap`: all of them (expanding, capped at
+    max_train_size when set) or a fixed-length window of max_train_size
+    rows, defaulting to the first fold's training length (sliding). With a
+    cap or a sliding window the per-fold fit cost no longer grows with the
+    history.
+
+    Args:
+        y: series to split
+        n_splits: number of folds
+        test_size: rows per test window (default: len(y) // (n_splits + 1))
+        gap: rows left out between each training and test window
+        max_train_size: cap on training rows per fold
+        window: expanding | sliding
     """
-    tscv = TimeSeriesSplit(n_splits=n_splits)
 
-    for train_idx, test_idx in tscv.split(y):
-        yield train_idx, test_idx
+    if window not in SPLIT_WINDOWS:
+        raise ValueError(f"Unsupported split window: {window}. Choose one of {SPLIT_WINDOWS}")
+
+    n = len(y)
+    gap = gap or 0
+    test_size = test_size or n // (n_splits + 1)
+
+    first_train_end = n - n_splits * test_size - gap
+    if test_size < 1 or first_train_end < 1:
+        raise ValueError(
+            f"Cannot make {n_splits} folds with test_size={test_size} and gap={gap} "
+            f"from {n} rows"
+        )
+
+    if window == "sliding" and not max_train_size:
+        max_train_size = first_train_end
+
+    for test_start in range(n - n_splits * test_size, n, test_size):
+        train_end = test_start - gap
+        train_start = max(0, train_end - max_train_size) if max_train_size else 0
+
+        yield (
+            np.arange(train_start, train_end),
+            np.arange(test_start, test_start + test_size)
+        )
 
-    logger.info("Data splitted into train-test partitions")
\ No newline at end of file
+    logger.info(
+        f"Data splitted into train-test partitions | folds={n_splits}, "
+        f"test_size={test_size}, gap={gap}, window={window}, max_train_size={max_train_size}"
+    )
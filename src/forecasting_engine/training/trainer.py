@@ -1,42 +1,184 @@
 import numpy as np
 import pandas as pd
-from forecasting_engine.training.evaluator import rmse
-from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.logger import app_logger
+from forecasting_engine.instrumentation import instrumented, record_stage
+from forecasting_engine.training.folds import fit_fold
+from forecasting_engine.training.evaluator import batch_evaluator, mase_scale, pad_stack
+from forecasting_engine.training.executor import parallel_map
 from forecasting_engine.training.splitter import time_series_split
+from forecasting_engine.training.order_search import search_orders
+from forecasting_engine.training.racing import (
+    candidate_params, race_models, season_length, uses_exog
+)
+from forecasting_engine.data.features import feature_engineering
 
+logger = app_logger(__name__)
+
+
+def _warm_fit_options(optimizer: dict, warm_start: dict) -> dict:
+    """
+    Fit options for folds started from another fold's parameters: either a
+    short optimizer refinement or a pure Kalman filter pass with fixed params.
+    """
+
+    if warm_start.get("mode", "refine") == "filter":
+        return {"filter_only": True}
+
+    return {
+        **optimizer,
+        "maxiter": warm_start.get("refine_maxiter", optimizer.get("maxiter", 50))
+    }
+
+
+def _run_folds(tasks: list,
+               optimizer: dict,
+               warm_start: dict,
+               execution_config: dict) -> list:
+    """
+    Fits every fold task, honouring the warm-start strategy.
+
+    - disabled: every fold starts cold, folds run through the executor
+    - chain: fold k+1 starts from fold k's params, folds run serially
+    - first: fold 1 starts cold, the rest start from its params in parallel
+    """
+
+    if not warm_start.get("enabled", False):
+        return parallel_map(
+            fit_fold,
+            [task + (optimizer,) for task in tasks],
+            execution_config
+        )
+
+    strategy = warm_start.get("strategy", "chain")
+    warm_options = _warm_fit_options(optimizer, warm_start)
+
+    first_result = fit_fold(*tasks[0], optimizer)
+    seed_params = first_result[1].params.values
+
+    if strategy == "first":
+        rest = parallel_map(
+            fit_fold,
+            [task + (warm_options, seed_params) for task in tasks[1:]],
+            execution_config
+        )
+        return [first_result] + rest
+
+    if strategy != "chain":
+        raise ValueError(f"Unsupported warm start strategy: {strategy}")
+
+    results = [first_result]
+    for task in tasks[1:]:
+        result = fit_fold(*task, warm_options, seed_params)
+        seed_params = result[1].params.values
+        results.append(result)
+
+    return results
+
+
+@instrumented("training")
 def model_trainer(preprocessed_df: pd.DataFrame,
                   model_config: dict,
-                  map_dict: dict):
+                  map_dict: dict,
+                  exog: pd.DataFrame = None):
 
-    y = preprocessed_df[map_dict['demand_col']]
-    n_splits = model_config["splitting"]["n_splits"]
+    # folds are indexed by position, not by the frame's labels, so each
+    # knows where it starts in the series (see fit_fold)
+    labels = preprocessed_df.index
+    y = preprocessed_df[map_dict['demand_col']].reset_index(drop=True)
+    splitting = model_config["splitting"]
+    model_name = model_config["model"].get("name", "sarimax")
     model_params = model_config["model"]["params"]
+    optimizer = model_config["model"].get("optimizer", {})
+    warm_start = model_config["model"].get("warm_start", {})
+    auto_order = model_config["model"].get("auto_order", {})
+    execution_config = model_config.get("execution", {})
 
-    best_score = float("inf")
-    best_model = None
-    best_y_test = None
-    best_preds = None
+    # calendar / driver features, built here unless the caller already did
+    if exog is None and uses_exog(model_config):
+        exog = feature_engineering(
+            preprocessed_df, map_dict['datetime_col'], model_config.get("features")
+        )
+    if exog is not None:
+        exog = exog.reset_index(drop=True)
 
-    for fold, (train_idx, test_idx) in enumerate(
-        time_series_split(y=y, n_splits=n_splits), start=1
-    ):
-        y_train = y.iloc[train_idx]
-        y_test = y.iloc[test_idx]
+    tasks = [
+        (fold, y.iloc[train_idx], y.iloc[test_idx], model_params)
+        for fold, (train_idx, test_idx) in enumerate(
+            time_series_split(
+                y=y,
+                n_splits=splitting["n_splits"],
+                test_size=splitting.get("test_size"),
+                gap=splitting.get("gap", 0),
+                max_train_size=splitting.get("max_train_size"),
+                window=splitting.get("window", "expanding")
+            ),
+            start=1
+        )
+    ]
 
-        model = SARIMAXModel(
-            order=tuple(model_params["order"]),
-            seasonal_order=tuple(model_params["seasonal_order"])
+    if model_name == "race":
+        model_name, model_params, fold_results, _ = race_models(
+            tasks, model_config, execution_config, exog
+        )
+        logger.info(f"Model race selected {model_name} with params: {model_params}")
+    elif model_name != "sarimax":
+        model_params = candidate_params(model_config, model_name)
+        fold_results = parallel_map(
+            fit_fold,
+            [task[:3] + (model_params, None, None, model_name, exog) for task in tasks],
+            execution_config
+        )
+    elif auto_order.get("enabled", False):
+        model_params, fold_results, _ = search_orders(
+            tasks, auto_order, optimizer, execution_config, model_params.get("fourier")
         )
+        logger.info(f"Auto order selected model params: {model_params}")
+    else:
+        fold_results = _run_folds(tasks, optimizer, warm_start, execution_config)
 
-        trained_model = model.fit(y_train)
-        preds = trained_model.predict(steps=len(y_test))
+    for _, model, _, _ in fold_results:
+        record_stage(model.fit_stats.get("timing"))
 
-        score = rmse(y_test.values, preds.values)
+    total_iterations = sum(
+        model.fit_stats["iterations"] or 0 for _, model, _, _ in fold_results
+    )
+    total_fit_time = sum(model.fit_stats["fit_time"] for _, model, _, _ in fold_results)
+    logger.info(
+        f"CV training complete | model={model_name}, folds={len(fold_results)}, "
+        f"warm_start={warm_start.get('enabled', False)}, "
+        f"total_iterations={total_iterations}, total_fit_time={total_fit_time:.2f}s"
+    )
 
+    # every fold scored in one vectorized pass, MASE against the seasonal naive
+    season = int(model_params.get("season_length") or season_length(model_params))
+    fold_metrics = batch_evaluator(
+        pad_stack([y_test for _, _, y_test, _ in tasks]),
+        pad_stack([preds for _, _, preds, _ in fold_results]),
+        scale=mase_scale(pad_stack([y_train for _, y_train, _, _ in tasks]), season)
+    )
+    for i, (fold, _, _, _) in enumerate(tasks):
+        logger.info(
+            f"Fold {fold} metrics | " + ", ".join(
+                f"{name}={fold_metrics[name][i]:.4f}"
+                for name in ("mae", "rmse", "wmape", "smape", "mase")
+            )
+        )
+
+    best_score = float("inf")
+    best_model = None
+    best_y_test = None
+    best_preds = None
+
+    # results come back in fold order, so ties resolve as in the serial loop
+    for (fold, _, y_test, _), (_, trained_model, preds, score) in zip(
+        tasks, fold_results
+    ):
         if score < best_score:
             best_score = score
             best_model = trained_model
             best_y_test = y_test
             best_preds = preds
 
+    best_y_test = best_y_test.set_axis(labels[best_y_test.index])
+
     return best_model, best_y_test, best_preds, best_score
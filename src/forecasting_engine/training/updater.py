@@ -0,0 +1,199 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from forecasting_engine.logger import app_logger
+from forecasting_engine.models.sarimax_model import SARIMAXModel
+from forecasting_engine.data.gaps import periods_after
+from forecasting_engine.data.cleansing import data_cleanser, check_data_continuity, data_imputer
+from forecasting_engine.data.preprocessing import preprocess_increment
+from forecasting_engine.data.features import feature_engineering
+from forecasting_engine.utils import (
+    model_loader, model_saver, stored_data_loader, processed_data_saver
+)
+
+logger = app_logger(__name__)
+
+
+def _refit_reason(model, update_config: dict):
+    """
+    Returns why the updated model should be refitted, or None.
+    """
+
+    stats = model.update_stats
+    drift_threshold = update_config.get("drift_threshold")
+    staleness_threshold = update_config.get("staleness_threshold")
+
+    if (drift_threshold is not None and stats.get("drift_score") is not None
+            and stats["drift_score"] > drift_threshold):
+        return f"drift_score {stats['drift_score']:.2f} > {drift_threshold}"
+
+    if (staleness_threshold is not None
+            and model.observations_since_fit >= staleness_threshold):
+        return (
+            f"observations_since_fit {model.observations_since_fit} "
+            f">= {staleness_threshold}"
+        )
+
+    return None
+
+
+def _prepare_new_rows(new_df: pd.DataFrame,
+                      history: pd.DataFrame,
+                      map_dict: dict,
+                      model_config: dict) -> pd.DataFrame:
+    """
+    Runs new rows through cleansing, imputation and preprocessing as the
+    stored history was, after checking they continue it: rows at or before
+    the last stored timestamp are dropped, and a gap between the history and
+    the first new row is rejected.
+    """
+
+    datetime_col = map_dict['datetime_col']
+    demand_col = map_dict['demand_col']
+    frequency = map_dict['frequency']
+
+    cleansed_df, _ = data_cleanser(new_df, datetime_col=datetime_col, demand_col=demand_col)
+    cleansed_df = cleansed_df.sort_values(datetime_col)
+
+    last_timestamp = history[datetime_col].max()
+    offsets = periods_after(last_timestamp, cleansed_df[datetime_col], frequency)
+
+    overlapping = int((offsets <= 0).sum())
+    if overlapping:
+        logger.warning(
+            f"Dropped {overlapping} new rows at or before the last stored timestamp {last_timestamp}"
+        )
+        cleansed_df, offsets = cleansed_df[offsets > 0], offsets[offsets > 0]
+
+    if not len(cleansed_df):
+        raise ValueError(f"No new observations after the last stored timestamp {last_timestamp}")
+    if offsets.min() > 1:
+        raise ValueError(
+            f"New rows start {int(offsets.min()) - 1} periods after the last stored "
+            f"timestamp {last_timestamp}; supply the missing observations first"
+        )
+
+    data_continuity = check_data_continuity(
+        cleansed_df=cleansed_df, datetime_col=datetime_col, frequency=frequency
+    )
+    imputed_df = data_imputer(
+        cleansed_df=cleansed_df,
+        datetime_col=datetime_col,
+        demand_col=demand_col,
+        frequency=frequency,
+        data_continuity=data_continuity,
+        **model_config.get("imputation", {})
+    )
+
+    return preprocess_increment(imputed_df, history, demand_col).reset_index(drop=True)
+
+
+def model_updater(new_df: pd.DataFrame,
+                  map_dict: dict,
+                  model_config: dict,
+                  run_id: str = None):
+    """
+    Folds newly arrived observations into a saved run's model.
+
+    New rows are checked against the run's stored processed history (they
+    must start at the period after its last timestamp; earlier rows are
+    dropped) and go through the same cleansing, imputation and
+    preprocessing. The model is then re-filtered over the new points only,
+    with its params held fixed; models without incremental updates (see
+    BaseTimeSeriesModel.update), and models that were not fitted on the
+    full stored history, are refitted instead. If the drift or staleness
+    threshold from the `update` section of model_params.yaml is crossed, it
+    is refitted on the stored processed history plus the new points,
+    warm-started from the current params; models that use exogenous
+    features get them rebuilt from that history. The updated model replaces
+    artifacts/models/<run_id>/model.*, and the artifact it replaced is kept
+    as previous_model.* in the same directory.
+
+    Args:
+        new_df: new rows with the mapped datetime and demand columns, plus
+            the `features.exog_columns` drivers for exogenous models
+        map_dict: column mapping (datetime_col, demand_col, frequency)
+        model_config: parsed model_params.yaml
+        run_id: run whose model to update (default RUN_ID)
+
+    Returns:
+        tuple: updated model, update stats dict
+    """
+
+    run_id = run_id or os.getenv("RUN_ID")
+    update_config = model_config.get("update", {})
+    demand_col = map_dict['demand_col']
+
+    try:
+        history = stored_data_loader("processed", run_id)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No processed history stored for run {run_id}; new rows cannot be checked against it"
+        ) from None
+
+    new_rows = _prepare_new_rows(new_df, history, map_dict, model_config)
+    y_new = new_rows[demand_col].astype(float)
+
+    model = model_loader(run_id)
+    previous_params = (
+        np.asarray(model.params, dtype=float) if isinstance(model, SARIMAXModel) else None
+    )
+
+    stats = {
+        "new_observations": len(y_new), "drift_score": None,
+        "refit": False, "refit_reason": None
+    }
+    if model.nobs != len(history):
+        # e.g. a CV fold's model: its state does not end at the last stored row
+        reason = (
+            f"saved model covers {model.nobs} observations, "
+            f"the stored history {len(history)}"
+        )
+    else:
+        try:
+            model.update(y_new)
+            stats = {**model.update_stats, "refit": False, "refit_reason": None}
+            logger.info(
+                f"Model {run_id} re-filtered | new_observations={stats['new_observations']}, "
+                f"drift_score={stats['drift_score']}, "
+                f"observations_since_fit={stats['observations_since_fit']}, "
+                f"update_time={stats['update_time'] * 1000:.1f}ms"
+            )
+            reason = _refit_reason(model, update_config)
+        except NotImplementedError:
+            # models without incremental updates are cheap to refit instead
+            reason = f"{type(model).__name__} does not support incremental updates"
+
+    # keep the processed history in step with the model for later refits
+    history = pd.concat([history, new_rows], ignore_index=True)
+    processed_data_saver(history, run_id)
+
+    if reason and update_config.get("refit", True):
+        logger.info(f"Refitting model {run_id}: {reason}")
+        refit_options = {}
+        if model.uses_exog:
+            refit_options["exog"] = feature_engineering(
+                history, map_dict['datetime_col'], model_config.get("features")
+            )
+        model = type(model)(**model.get_params()).fit(
+            history[demand_col].astype(float).reset_index(drop=True),
+            start_params=previous_params,
+            **refit_options,
+            **model_config["model"].get("optimizer", {})
+        )
+        stats.update(refit=True, refit_reason=reason, fit_stats=model.fit_stats)
+    elif reason and "observations_since_fit" not in stats:
+        raise ValueError(f"Model {run_id} cannot be updated ({reason}) and update.refit is disabled")
+    elif reason:
+        stats["refit_reason"] = reason
+        logger.info(f"Refit threshold crossed ({reason}) but refit is disabled")
+
+    model_dir = Path(os.getenv("ARTIFACTS_PATH", "")) / "models" / run_id
+    for current in model_dir.glob("model.*"):
+        shutil.copy2(current, model_dir / f"previous_{current.name}")
+
+    model_saver(model, run_id)
+
+    return model, stats
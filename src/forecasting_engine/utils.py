@@ -1,22 +1,21 @@
 import os
+import json
+import time
 import yaml
-import joblib
+import tempfile
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from functools import lru_cache
 from dotenv import load_dotenv
-import plotly.graph_objects as go
 from forecasting_engine.logger import app_logger
+from forecasting_engine.data.storage import save_frame, load_frame
+from forecasting_engine.models.registry import get_model_class
 
 load_dotenv()
 
 logger = app_logger(__name__)
 
-DATA_PATH_ENV = os.getenv("DATA_PATH")
-if not DATA_PATH_ENV:
-    raise EnvironmentError("DATA_PATH not set in environment")
-
-DATA_PATH = Path(DATA_PATH_ENV)
-
 
 def load_config(yaml_path: str) -> dict:
     """
@@ -56,6 +55,7 @@ def plot_actual_vs_forecast(
     Returns:
         fig: Plotly Figure object
     """
+    import plotly.graph_objects as go
 
     fig = go.Figure()
 
@@ -98,15 +98,68 @@ def plot_actual_vs_forecast(
 
     return fig
 
-def raw_data_saver(raw_df: pd.DataFrame) -> None:
+@lru_cache(maxsize=1)
+def app_config() -> dict:
+    """
+    Reads $CONFIG_PATH/config.yaml once; empty dict when it is missing.
+    """
+
+    config_path = os.getenv("CONFIG_PATH")
+    if not config_path or not (Path(config_path) / "config.yaml").exists():
+        return {}
+
+    return load_config(Path(config_path) / "config.yaml") or {}
+
+def storage_config() -> dict:
+    """
+    `storage` section of config.yaml, defaulting to zstd-compressed Parquet.
+    """
+
+    defaults = {"format": "parquet", "compression": "zstd"}
+    return {**defaults, **(app_config().get("storage") or {})}
+
+def artifact_config() -> dict:
+    """
+    `artifacts` section of config.yaml, defaulting to compact model artifacts.
+    """
+
+    defaults = {"format": "compact", "compare_formats": False}
+    return {**defaults, **(app_config().get("artifacts") or {})}
+
+def ingestion_config() -> dict:
+    """
+    `ingestion` section of config.yaml, defaulting to the pyarrow CSV engine
+    with no extra columns or declared dtypes.
+    """
+
+    defaults = {
+        "engine": "pyarrow",
+        "chunk_size": 500000,
+        "extra_columns": [],
+        "datetime_format": None,
+        "dtypes": {}
+    }
+    return {**defaults, **(app_config().get("ingestion") or {})}
+
+def instrumentation_config() -> dict:
     """
-    Saves the user uploaded data as a CSV into data/raw using RUN_ID.
+    `instrumentation` section of config.yaml, defaulting to timing every
+    stage with peak RSS and saving the per-run metrics file.
     """
 
-    if raw_df is None or raw_df.empty:
+    defaults = {"enabled": True, "memory": "rss", "save": True}
+    return {**defaults, **(app_config().get("instrumentation") or {})}
+
+def _stage_data_saver(df: pd.DataFrame, stage: str, run_id: str = None) -> Path:
+    """
+    Saves a dataframe into data/<stage> through the columnar storage layer,
+    deduplicated by content hash and recorded under run_id (default RUN_ID).
+    """
+
+    if df is None or df.empty:
         raise ValueError("Empty or invalid dataframe received")
 
-    run_id = os.getenv("RUN_ID")
+    run_id = run_id or os.getenv("RUN_ID")
     if not run_id:
         raise EnvironmentError("RUN_ID not set in environment")
 
@@ -114,20 +167,64 @@ def raw_data_saver(raw_df: pd.DataFrame) -> None:
     if not data_path:
         raise EnvironmentError("DATA_PATH not set in environment")
 
-    raw_dir = Path(data_path) / "raw"
-    raw_dir.mkdir(parents=True, exist_ok=True)
+    config = storage_config()
+
+    return save_frame(
+        df,
+        stage_dir=Path(data_path) / stage,
+        run_id=run_id,
+        storage_format=config["format"],
+        compression=config["compression"]
+    )
+
+def raw_data_saver(raw_df: pd.DataFrame) -> Path:
+    """
+    Saves the user uploaded data into data/raw using RUN_ID.
+    """
 
-    raw_data_path = raw_dir / f"{run_id}.csv"
-    raw_df.to_csv(raw_data_path, index=False)
+    raw_data_path = _stage_data_saver(raw_df, "raw")
 
     logger.info(f"Raw data saved successfully at {raw_data_path}")
 
-def processed_data_saver(processed_df: pd.DataFrame) -> None:
+    return raw_data_path
+
+def processed_data_saver(processed_df: pd.DataFrame, run_id: str = None) -> Path:
+    """
+    Saves the processed data into data/processed using run_id (default RUN_ID).
+    """
+
+    processed_data_path = _stage_data_saver(processed_df, "processed", run_id)
+
+    logger.info(f"Processed data saved successfully at {processed_data_path}")
+
+    return processed_data_path
+
+def stored_data_loader(stage: str, run_id: str = None, columns: list = None) -> pd.DataFrame:
+    """
+    Loads data saved by raw_data_saver / processed_data_saver for a run
+    (defaults to the current RUN_ID), memory-mapped and with dtypes intact.
+    """
+
+    run_id = run_id or os.getenv("RUN_ID")
+    if not run_id:
+        raise EnvironmentError("RUN_ID not set in environment")
+
+    data_path = os.getenv("DATA_PATH")
+    if not data_path:
+        raise EnvironmentError("DATA_PATH not set in environment")
+
+    df = load_frame(Path(data_path) / stage, run_id, columns=columns)
+
+    logger.info(f"Loaded {stage} data for run {run_id} ({len(df)} rows)")
+
+    return df
+
+def forecast_data_saver(forecast_df: pd.DataFrame) -> Path:
     """
-    Saves the user uploaded data as a CSV into data/processed using RUN_ID.
+    Saves consolidated forecasts as a CSV into data/forecasts using RUN_ID.
     """
 
-    if processed_df is None or processed_df.empty:
+    if forecast_df is None or forecast_df.empty:
         raise ValueError("Empty or invalid dataframe received")
 
     run_id = os.getenv("RUN_ID")
@@ -138,23 +235,84 @@ def processed_data_saver(processed_df: pd.DataFrame) -> None:
     if not data_path:
         raise EnvironmentError("DATA_PATH not set in environment")
 
-    processed_dir = Path(data_path) / "processed"
-    processed_dir.mkdir(parents=True, exist_ok=True)
+    forecast_dir = Path(data_path) / "forecasts"
+    forecast_dir.mkdir(parents=True, exist_ok=True)
 
-    processed_data_path = processed_dir / f"{run_id}.csv"
-    processed_df.to_csv(processed_data_path, index=False)
+    forecast_data_path = forecast_dir / f"{run_id}.csv"
+    forecast_df.to_csv(forecast_data_path, index=False)
 
-    logger.info(f"Processed data saved successfully at {processed_data_path}")
+    logger.info(f"Forecast data saved successfully at {forecast_data_path}")
+
+    return forecast_data_path
+
+def _write_compact_artifact(model, model_path: Path, run_id: str = None) -> None:
+    metadata, arrays = model.to_artifact()
+    metadata["run_id"] = run_id or os.getenv("RUN_ID")
+
+    np.savez_compressed(
+        model_path,
+        metadata=np.array(json.dumps(metadata)),
+        **arrays
+    )
+
+def _read_compact_artifact(model_path: Path):
+    with np.load(model_path, allow_pickle=False) as artifact:
+        metadata = json.loads(str(artifact["metadata"]))
+        arrays = {k: artifact[k] for k in artifact.files if k != "metadata"}
+
+    model_class = get_model_class(metadata["model"])
+    return model_class.from_artifact(metadata, arrays)
 
-def model_saver(model) -> None:
+def compare_model_artifacts(model) -> dict:
     """
-    Saves the trained model to artifacts/models using RUN_ID.
+    Writes the model both as a compact artifact and as a full joblib pickle
+    into a temp dir and reports file size and load time for each.
+    """
+    import joblib
+
+    report = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {
+            "compact": Path(tmp_dir) / "model.npz",
+            "joblib": Path(tmp_dir) / "model.joblib"
+        }
+
+        _write_compact_artifact(model, paths["compact"])
+        joblib.dump(model, paths["joblib"])
+
+        readers = {"compact": _read_compact_artifact, "joblib": joblib.load}
+
+        for name, path in paths.items():
+            start = time.perf_counter()
+            readers[name](path)
+            report[name] = {
+                "size_bytes": path.stat().st_size,
+                "load_seconds": time.perf_counter() - start
+            }
+
+    logger.info(
+        f"Artifact comparison | "
+        f"compact={report['compact']['size_bytes']} bytes / "
+        f"{report['compact']['load_seconds'] * 1000:.1f} ms, "
+        f"joblib={report['joblib']['size_bytes']} bytes / "
+        f"{report['joblib']['load_seconds'] * 1000:.1f} ms"
+    )
+
+    return report
+
+def model_saver(model, run_id: str = None) -> Path:
+    """
+    Saves the trained model to artifacts/models using run_id (default RUN_ID).
+
+    Models supporting to_artifact() are stored as a compact model.npz (spec,
+    params, final state and metadata); others fall back to model.joblib.
     """
 
     if model is None:
         raise ValueError("Model is empty; pass a trained model")
 
-    run_id = os.getenv("RUN_ID")
+    run_id = run_id or os.getenv("RUN_ID")
     if not run_id:
         raise EnvironmentError("RUN_ID not set in environment")
 
@@ -165,16 +323,44 @@ def model_saver(model) -> None:
     model_dir = Path(artifacts_path) / "models" / run_id
     model_dir.mkdir(parents=True, exist_ok=True)
 
-    model_path = model_dir / "model.joblib"
-    joblib.dump(model, model_path)
+    config = artifact_config()
+    model_path = None
+
+    if config["format"] == "compact":
+        try:
+            model_path = model_dir / "model.npz"
+            _write_compact_artifact(model, model_path, run_id)
+        except NotImplementedError:
+            logger.info(f"{type(model).__name__} has no compact artifact, using joblib")
+            model_path = None
+
+    if model_path is None:
+        import joblib
 
-    logger.info(f"Model saved successfully at {model_path}")
+        model_path = model_dir / "model.joblib"
+        joblib.dump(model, model_path)
 
-def model_loader():
+    # a stale artifact in the other format would shadow this one on load
+    for stale in model_dir.glob("model.*"):
+        if stale != model_path:
+            stale.unlink()
+
+    logger.info(
+        f"Model saved successfully at {model_path} "
+        f"({model_path.stat().st_size} bytes)"
+    )
+
+    if config["compare_formats"] and model_path.suffix == ".npz":
+        compare_model_artifacts(model)
+
+    return model_path
+
+def model_loader(run_id: str = None):
     """
-    Loads a trained model from artifacts/models/<run_id>/model.joblib
+    Loads a trained model from artifacts/models/<run_id>/, preferring the
+    compact model.npz and falling back to model.joblib.
     """
-    run_id = os.getenv("RUN_ID")
+    run_id = run_id or os.getenv("RUN_ID")
     if not run_id:
         raise EnvironmentError("RUN_ID not set in environment")
 
@@ -186,12 +372,24 @@ def model_loader():
     if not model_dir.exists():
         raise FileNotFoundError(f"Model directory not found: {model_dir}")
 
+    start = time.perf_counter()
+
+    compact_path = model_dir / "model.npz"
     model_path = model_dir / "model.joblib"
-    if not model_path.exists():
-        raise FileNotFoundError(f"Model file not found: {model_path}")
 
-    model = joblib.load(model_path)
+    if compact_path.exists():
+        model_path = compact_path
+        model = _read_compact_artifact(compact_path)
+    elif model_path.exists():
+        import joblib
 
-    logger.info(f"Model loaded successfully from {model_path}")
+        model = joblib.load(model_path)
+    else:
+        raise FileNotFoundError(f"Model file not found in {model_dir}")
+
+    logger.info(
+        f"Model loaded successfully from {model_path} "
+        f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
 
     return model